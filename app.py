@@ -1,8 +1,18 @@
-from flask import Flask, request, jsonify, render_template
+from flask import Flask, Response, g, request, jsonify, render_template, stream_with_context
 from flask_cors import CORS
-from typing import Any
+from concurrent.futures import Executor
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 import logging
-from telugu_nlp_processor import TeluguNLPProcessor
+import os
+import threading
+from metrics import MetricsRegistry, RequestMetrics
+from lexicons import LexiconWatcher, reload_artifact
+from qa_cache import QAResultCache
+from qa_record import LEVELS, OPTIONAL_FIELDS, CompactPairEncoder, compact_qa_pairs
+from question_bank import QuestionBank
+from question_index import DEDUPE_MODES, QuestionIndex
+from response_encoding import choose_encoding, compress, dumps_json
+from telugu_nlp_processor import SELECTION_STRATEGIES, TeluguNLPProcessor, create_batch_executor
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -11,8 +21,226 @@ logger = logging.getLogger(__name__)
 app = Flask(__name__)
 CORS(app)
 
+# Largest accepted request body in bytes
+app.config['MAX_CONTENT_LENGTH'] = int(os.environ.get('QA_MAX_CONTENT_LENGTH', 1024 * 1024))
+
+# Admission limits of each paragraph, checked before any NLP work (0 disables a limit)
+app.config['MAX_PARAGRAPH_LENGTH'] = int(os.environ.get('QA_MAX_PARAGRAPH_LENGTH', 50000))
+app.config['MAX_QUESTIONS'] = int(os.environ.get('QA_MAX_QUESTIONS', 1000))
+
+# gzip/brotli compression of JSON responses at least COMPRESS_MIN_SIZE bytes
+# long, for clients that accept it (QA_COMPRESSION=0 disables)
+app.config['COMPRESSION_ENABLED'] = os.environ.get('QA_COMPRESSION', '1') == '1'
+app.config['COMPRESS_MIN_SIZE'] = int(os.environ.get('QA_COMPRESS_MIN_SIZE', 1024))
+
+# Batch processing settings
+app.config['BATCH_WORKERS'] = int(os.environ.get('QA_BATCH_WORKERS', os.cpu_count() or 1))
+app.config['BATCH_MAX_ITEMS'] = int(os.environ.get('QA_BATCH_MAX_ITEMS', 1000))
+
+# Paragraphs expected to analyze at least this many sentences shard them over
+# the batch pool (0 disables; needs QA_BATCH_WORKERS above 1)
+app.config['PARALLEL_MIN_SENTENCES'] = int(os.environ.get('QA_PARALLEL_MIN_SENTENCES', 256))
+
+# Result cache settings (a size of 0 disables the cache)
+app.config['CACHE_SIZE'] = int(os.environ.get('QA_CACHE_SIZE', 1024))
+app.config['CACHE_TTL'] = float(os.environ.get('QA_CACHE_TTL', 3600))
+app.config['CACHE_PATH'] = os.environ.get('QA_CACHE_PATH')
+app.config['SENTENCE_CACHE_SIZE'] = int(os.environ.get('QA_SENTENCE_CACHE_SIZE', 4096))
+
+# SQLite file keeping every generated result for the /api/questions queries (unset disables the bank)
+app.config['BANK_PATH'] = os.environ.get('QA_BANK_PATH')
+
+# Most generic template questions added when a paragraph yields too few
+app.config['MAX_GENERIC_QUESTIONS'] = int(os.environ.get('QA_MAX_GENERIC_QUESTIONS', 100))
+
+# Seconds between checks of the lexicon and gazetteer files for changes (0 disables hot reload)
+app.config['LEXICON_RELOAD_INTERVAL'] = float(os.environ.get('QA_LEXICON_RELOAD_INTERVAL', 10))
+
+# Files whose changes trigger a reload: "sources" (lexicon and gazetteer files,
+# compiled by each process) or "artifact" (only the output of build-lexicons)
+app.config['LEXICON_RELOAD_WATCH'] = os.environ.get('QA_LEXICON_RELOAD_WATCH', 'sources')
+
+# Near-duplicate suppression for requests that ask for it with "dedupe": most
+# questions remembered per request or batch, and the MinHash similarity at
+# which two questions count as the same
+app.config['DEDUPE_MAX_SIZE'] = int(os.environ.get('QA_DEDUPE_MAX_SIZE', 100000))
+app.config['DEDUPE_THRESHOLD'] = float(os.environ.get('QA_DEDUPE_THRESHOLD', 0.8))
+
+# Request metrics for /api/metrics (QA_METRICS=0 disables collection)
+app.config['METRICS_ENABLED'] = os.environ.get('QA_METRICS', '1') == '1'
+metrics_registry = MetricsRegistry()
+
 # Initialize Telugu NLP processor
-nlp_processor = TeluguNLPProcessor()
+result_cache = QAResultCache(
+    max_entries=app.config['CACHE_SIZE'],
+    ttl=app.config['CACHE_TTL'],
+    path=app.config['CACHE_PATH']
+) if app.config['CACHE_SIZE'] > 0 else None
+
+question_bank = QuestionBank(app.config['BANK_PATH']) if app.config['BANK_PATH'] else None
+
+# Process pool for batch requests and large paragraphs, created on first use
+batch_executor: Optional[Executor] = None
+batch_executor_lock = threading.Lock()
+
+def get_batch_executor() -> Optional[Executor]:
+    """Return the shared batch process pool, or None to process batches in-process"""
+    global batch_executor
+    if app.config['BATCH_WORKERS'] <= 1:
+        return None
+    with batch_executor_lock:
+        if batch_executor is None:
+            batch_executor = create_batch_executor(app.config['BATCH_WORKERS'], app.config['MAX_GENERIC_QUESTIONS'],
+                                                   app.config['LEXICON_RELOAD_INTERVAL'],
+                                                   app.config['LEXICON_RELOAD_WATCH'] == 'artifact')
+        return batch_executor
+
+def create_processor() -> TeluguNLPProcessor:
+    """Build a processor on the currently loaded lexicons"""
+    return TeluguNLPProcessor(
+        result_cache=result_cache,
+        sentence_cache_size=app.config['SENTENCE_CACHE_SIZE'],
+        max_generic_questions=app.config['MAX_GENERIC_QUESTIONS'],
+        question_bank=question_bank,
+        parallel_executor=get_batch_executor if app.config['PARALLEL_MIN_SENTENCES'] > 0 else None,
+        parallel_min_sentences=app.config['PARALLEL_MIN_SENTENCES'],
+        parallel_window=2 * app.config['BATCH_WORKERS']
+    )
+
+nlp_processor = create_processor()
+
+# Lexicon hot reload: a changed file triggers a rebuild in the background,
+# after which nlp_processor is replaced in a single assignment.  Requests
+# already running finish on the processor they started with.
+lexicon_watcher = (
+    LexiconWatcher(app.config['LEXICON_RELOAD_INTERVAL'], watch_artifact=app.config['LEXICON_RELOAD_WATCH'] == 'artifact')
+    if app.config['LEXICON_RELOAD_INTERVAL'] > 0 else None
+)
+
+def reload_lexicons() -> None:
+    """Recompile the lexicons and swap in a processor that uses them"""
+    global nlp_processor
+    try:
+        artifact = reload_artifact()
+        if artifact.version == nlp_processor.lexicon_version:
+            return
+        nlp_processor = create_processor()
+        logger.info(f"Reloaded lexicons (version {artifact.version})")
+    except Exception as e:
+        logger.error(f"Error reloading lexicons: {str(e)}")
+
+@app.before_request
+def check_lexicons():
+    """Start a background reload when the lexicon files have changed"""
+    if lexicon_watcher is not None and lexicon_watcher.changed():
+        threading.Thread(target=reload_lexicons, name='lexicon-reload', daemon=True).start()
+
+@app.before_request
+def reject_oversized_requests():
+    """Reject bodies above MAX_CONTENT_LENGTH before any work is done"""
+    max_length = app.config['MAX_CONTENT_LENGTH']
+    if max_length and request.content_length and request.content_length > max_length:
+        return jsonify({'error': 'Request is too large'}), 413
+    return None
+
+@app.after_request
+def record_request_metrics(response: Response) -> Response:
+    """Record request counts, stage timings and payload sizes"""
+    if app.config['METRICS_ENABLED'] and request.endpoint not in (None, 'static', 'metrics'):
+        metrics_registry.record_request(
+            request.endpoint,
+            response.status_code,
+            g.get('request_metrics'),
+            None if response.is_streamed else response.calculate_content_length()
+        )
+    return response
+
+@app.after_request
+def compress_response(response: Response) -> Response:
+    """Compress JSON bodies with the best coding the client accepts; runs before metrics record the size"""
+    if (not app.config['COMPRESSION_ENABLED'] or response.is_streamed or response.direct_passthrough
+            or response.mimetype != 'application/json' or 'Content-Encoding' in response.headers):
+        return response
+    body = response.get_data()
+    if len(body) < app.config['COMPRESS_MIN_SIZE']:
+        return response
+    response.vary.add('Accept-Encoding')
+    encoding = choose_encoding(request.accept_encodings)
+    if encoding is not None:
+        response.set_data(compress(body, encoding))
+        response.headers['Content-Encoding'] = encoding
+    return response
+
+def start_request_metrics() -> Optional[RequestMetrics]:
+    """Start collecting stage metrics when enabled or asked for by the X-Debug-Timings header"""
+    if app.config['METRICS_ENABLED'] or request.headers.get('X-Debug-Timings') == '1':
+        g.request_metrics = RequestMetrics()
+        return g.request_metrics
+    return None
+
+def create_question_index(data: Dict[str, Any]) -> Optional[QuestionIndex]:
+    """The duplicate index a request asks for with "dedupe", or None when it does not"""
+    mode = data.get('dedupe')
+    if mode is None:
+        return None
+    if mode not in DEDUPE_MODES:
+        raise ValueError(f"dedupe must be one of: {', '.join(DEDUPE_MODES)}")
+    return QuestionIndex(mode, app.config['DEDUPE_MAX_SIZE'], app.config['DEDUPE_THRESHOLD'])
+
+class ParagraphTooLarge(ValueError):
+    """A paragraph over MAX_PARAGRAPH_LENGTH, answered with 413 rather than 400"""
+
+def admit_generation(data: Any) -> Tuple[str, int]:
+    """The paragraph and num_questions of a generation request, checked against the admission limits
+
+    The difficulty is checked here too, so a bad one never reaches the cache or the bank.
+    """
+    if not isinstance(data, dict):
+        raise ValueError('Request body must be a JSON object')
+    paragraph = data.get('paragraph', '')
+    if not paragraph or not isinstance(paragraph, str):
+        raise ValueError('Paragraph is required')
+    max_length = app.config['MAX_PARAGRAPH_LENGTH']
+    if max_length and len(paragraph) > max_length:
+        raise ParagraphTooLarge(f"Paragraph is longer than {max_length} characters")
+    num_questions = data.get('num_questions', 5)
+    # Integers and integer strings (as form fields send them); not floats or booleans
+    if isinstance(num_questions, bool) or not isinstance(num_questions, (int, str)):
+        raise ValueError('num_questions must be an integer')
+    try:
+        num_questions = int(num_questions)
+    except ValueError:
+        raise ValueError('num_questions must be an integer')
+    if num_questions < 1:
+        raise ValueError('num_questions must be at least 1')
+    max_questions = app.config['MAX_QUESTIONS']
+    if max_questions and num_questions > max_questions:
+        raise ValueError(f"num_questions must be at most {max_questions}")
+    difficulty = data.get('difficulty', 'mixed')
+    if not isinstance(difficulty, str) or difficulty not in ('mixed', *LEVELS):
+        raise ValueError(f"difficulty must be one of: mixed, {', '.join(LEVELS)}")
+    return paragraph, num_questions
+
+def admission_error(error: ValueError) -> Tuple[Response, int]:
+    """The error response for a request that failed admission"""
+    return jsonify({'error': str(error)}), 413 if isinstance(error, ParagraphTooLarge) else 400
+
+def response_fields(data: Dict[str, Any]) -> Tuple[bool, Iterable[str]]:
+    """Whether a request asked for the compact form, and which of OPTIONAL_FIELDS its pairs keep
+
+    Pairs keep every optional field by default, and none in the compact form.
+    """
+    compact = bool(data.get('compact', False))
+    include = data.get('include')
+    if include is None:
+        return compact, () if compact else OPTIONAL_FIELDS
+    if not isinstance(include, list) or any(field not in OPTIONAL_FIELDS for field in include):
+        raise ValueError(f"include must be a list of: {', '.join(OPTIONAL_FIELDS)}")
+    return compact, include
+
+def json_response(payload: Dict[str, Any]) -> Response:
+    """A compact UTF-8 JSON response encoded with the fastest available encoder"""
+    return Response(dumps_json(payload), mimetype='application/json')
 
 @app.route('/')
 def index():
@@ -23,35 +251,241 @@ def index():
 def generate_qa():
     """Generate questions and answers from Telugu paragraph"""
     try:
-        data: Any = request.get_json()
-        paragraph = data.get('paragraph', '')
-        num_questions = data.get('num_questions', 5)
+        data: Any = request.get_json(silent=True)
+        try:
+            paragraph, num_questions = admit_generation(data)
+        except ValueError as e:
+            return admission_error(e)
         difficulty = data.get('difficulty', 'mixed')
+        selection = data.get('selection', 'sequential')
+        
+        if selection not in SELECTION_STRATEGIES:
+            return jsonify({'error': f"selection must be one of: {', '.join(SELECTION_STRATEGIES)}"}), 400
+        try:
+            dedupe = create_question_index(data)
+            compact, include = response_fields(data)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
         
-        if not paragraph:
-            return jsonify({'error': 'Paragraph is required'}), 400
+        # Generate Q&A pairs and their statistics
+        metrics = start_request_metrics()
+        source = data.get('source')
+        result = nlp_processor.generate_qa_with_statistics(paragraph, num_questions, difficulty, metrics, selection,
+                                                           dedupe, str(source) if source is not None else None)
+        qa_pairs = result['qa_pairs']
+        total_questions = len(qa_pairs)
+        
+        response: Dict[str, Any] = {'success': True}
+        if compact:
+            response['compact'] = True
+            response['sentences'], qa_pairs = compact_qa_pairs(qa_pairs, include)
+        elif len(include) < len(OPTIONAL_FIELDS):
+            dropped = set(OPTIONAL_FIELDS) - set(include)
+            qa_pairs = [{key: value for key, value in qa.items() if key not in dropped} for qa in qa_pairs]
+        response['qa_pairs'] = qa_pairs
+        response['total_questions'] = total_questions
+        response['statistics'] = result['statistics']
+        if metrics is not None and request.headers.get('X-Debug-Timings') == '1':
+            response['timings'] = metrics.to_dict()
+        return json_response(response) if compact else jsonify(response)
+        
+    except Exception as e:
+        logger.error(f"Error generating Q&A: {str(e)}")
+        return jsonify({'error': 'Failed to generate Q&A'}), 500
+
+@app.route('/api/generate-qa/stream', methods=['POST'])
+def generate_qa_stream():
+    """Stream questions and answers from a Telugu paragraph as NDJSON or Server-Sent Events"""
+    data: Any = request.get_json(silent=True)
+    try:
+        paragraph, num_questions = admit_generation(data)
+    except ValueError as e:
+        return admission_error(e)
+    difficulty = data.get('difficulty', 'mixed')
+    selection = data.get('selection', 'sequential')
+    
+    if selection not in SELECTION_STRATEGIES:
+        return jsonify({'error': f"selection must be one of: {', '.join(SELECTION_STRATEGIES)}"}), 400
+    try:
+        dedupe = create_question_index(data)
+        compact, include = response_fields(data)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
+    use_sse = data.get('format') == 'sse' or (
+        data.get('format') is None and request.accept_mimetypes.best == 'text/event-stream'
+    )
+    
+    # The compact form sends each context sentence once, in a "sentence"
+    # event ahead of the first pair that references it
+    dumps = dumps_json if compact else lambda payload: app.json.dumps(payload).encode('utf-8')
+    encoder = CompactPairEncoder(include) if compact else None
+    dropped = set(OPTIONAL_FIELDS) - set(include)
+    
+    def encode(event: str, payload: Dict[str, Any]) -> bytes:
+        if use_sse:
+            return b'event: ' + event.encode('ascii') + b'\ndata: ' + dumps(payload) + b'\n\n'
+        return dumps({'event': event, **payload}) + b'\n'
+    
+    processor = nlp_processor
+    
+    def generate() -> Iterator[bytes]:
+        qa_pairs: List[Dict[str, Any]] = []
+        removed = 0
+        try:
+            for qa in processor.iter_qa_pairs(paragraph, num_questions, difficulty, selection=selection):
+                if dedupe is not None and not dedupe.add(qa['question']):
+                    removed += 1
+                    continue
+                if encoder is not None:
+                    pair, added = encoder.encode(qa)
+                    if added:
+                        yield encode('sentence', {'index': pair['sentence'], 'sentence': qa.get('context', '')})
+                elif dropped:
+                    pair = {key: value for key, value in qa.items() if key not in dropped}
+                else:
+                    pair = qa
+                yield encode('qa', {'index': len(qa_pairs), 'qa': pair})
+                qa_pairs.append(qa)
+            statistics = processor.get_question_statistics(qa_pairs)
+            if dedupe is not None:
+                statistics['duplicates_removed'] = removed
+            yield encode('done', {'total_questions': len(qa_pairs), 'statistics': statistics})
+        except Exception as e:
+            logger.error(f"Error streaming Q&A: {str(e)}")
+            yield encode('error', {'error': 'Failed to generate Q&A'})
+    
+    return Response(
+        stream_with_context(generate()),
+        mimetype='text/event-stream' if use_sse else 'application/x-ndjson',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
+@app.route('/api/generate-qa/batch', methods=['POST'])
+def generate_qa_batch():
+    """Generate questions and answers for a list of Telugu paragraphs"""
+    try:
+        data: Any = request.get_json(silent=True)
+        items = data.get('items') if isinstance(data, dict) else None
         
-        # Generate Q&A pairs
-        qa_pairs = nlp_processor.generate_qa_pairs(paragraph, num_questions, difficulty)
+        if not isinstance(items, list) or not items:
+            return jsonify({'error': 'Items are required'}), 400
+        if len(items) > app.config['BATCH_MAX_ITEMS']:
+            return jsonify({'error': f"At most {app.config['BATCH_MAX_ITEMS']} items are allowed"}), 400
+        try:
+            dedupe = create_question_index(data)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
         
-        # Get question statistics
-        statistics = nlp_processor.get_question_statistics(qa_pairs)
+        # Items failing admission are reported as failed items without being
+        # sent to the processor; with "dedupe", questions repeating an
+        # earlier item's are dropped
+        errors: List[Optional[str]] = []
+        for item in items:
+            try:
+                admit_generation(item if isinstance(item, dict) else {})
+            except ValueError as e:
+                errors.append(str(e))
+            else:
+                errors.append(None)
+        admitted = iter(nlp_processor.generate_qa_pairs_batch(
+            [item for item, error in zip(items, errors) if error is None], get_batch_executor(), dedupe
+        ))
+        results = [next(admitted) if error is None else {'success': False, 'error': error} for error in errors]
         
         return jsonify({
             'success': True,
-            'qa_pairs': qa_pairs,
-            'total_questions': len(qa_pairs),
-            'statistics': statistics
+            'results': results,
+            'total_items': len(results),
+            'failed_items': sum(1 for result in results if not result['success'])
         })
         
     except Exception as e:
-        logger.error(f"Error generating Q&A: {str(e)}")
+        logger.error(f"Error generating batch Q&A: {str(e)}")
         return jsonify({'error': 'Failed to generate Q&A'}), 500
 
+def question_filters() -> Dict[str, Any]:
+    """Question bank filters from the query string: level, type, min_confidence, max_confidence and source"""
+    filters: Dict[str, Any] = {'level': request.args.get('level'), 'type': request.args.get('type'),
+                               'source': request.args.get('source')}
+    if filters['level'] is not None and filters['level'] not in LEVELS:
+        raise ValueError(f"level must be one of: {', '.join(LEVELS)}")
+    for name in ('min_confidence', 'max_confidence'):
+        value = request.args.get(name)
+        try:
+            filters[name] = float(value) if value is not None else None
+        except ValueError:
+            raise ValueError(f"{name} must be a number")
+    return filters
+
+def page_arguments() -> Dict[str, int]:
+    """Keyset paging arguments from the query string: after (an id) and limit"""
+    try:
+        return {'after': int(request.args.get('after', 0)), 'limit': int(request.args.get('limit', 50))}
+    except ValueError:
+        raise ValueError('after and limit must be integers')
+
+@app.route('/api/questions')
+def list_questions():
+    """Page through stored questions by level, type, confidence range and source"""
+    if question_bank is None:
+        return jsonify({'error': 'Question bank is not enabled'}), 404
+    try:
+        filters, page = question_filters(), page_arguments()
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    return jsonify({'success': True, **question_bank.query(**filters, **page)})
+
+@app.route('/api/questions/statistics')
+def question_statistics():
+    """Level statistics of the stored questions matching the filters"""
+    if question_bank is None:
+        return jsonify({'error': 'Question bank is not enabled'}), 404
+    try:
+        filters = question_filters()
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    totals, synthetic = question_bank.level_totals(**filters)
+    statistics = nlp_processor.level_analyzer.summarize_level_totals(totals)
+    statistics['synthetic_questions'] = synthetic
+    return jsonify({'success': True, 'statistics': statistics})
+
+@app.route('/api/sources')
+def list_sources():
+    """Page through the stored results, optionally only those with a source label"""
+    if question_bank is None:
+        return jsonify({'error': 'Question bank is not enabled'}), 404
+    try:
+        page = page_arguments()
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    return jsonify({'success': True, **question_bank.sources(request.args.get('source'), **page)})
+
+@app.route('/api/metrics')
+def metrics():
+    """Prometheus metrics endpoint"""
+    return Response(metrics_registry.render(), mimetype='text/plain; version=0.0.4')
+
 @app.route('/api/health')
 def health_check():
     """Health check endpoint"""
-    return jsonify({'status': 'healthy', 'service': 'telugu-qa-generator'})
+    health: Dict[str, Any] = {'status': 'healthy', 'service': 'telugu-qa-generator'}
+    if result_cache is not None:
+        health['cache'] = result_cache.stats()
+    if question_bank is not None:
+        health['question_bank'] = question_bank.stats()
+    processor = nlp_processor
+    if processor.sentence_cache is not None:
+        health['sentence_cache'] = processor.sentence_cache.stats()
+    health['lexicons'] = {
+        'version': processor.lexicon_version,
+        'gazetteers': {kind: len(gazetteer) for kind, gazetteer in processor.gazetteers.items()}
+    }
+    return jsonify(health)
 
 if __name__ == '__main__':
-    app.run(debug=True, host='0.0.0.0', port=5000)
+    # Batch pool processes import the main module before their first task;
+    # name the pool's own module as main so they skip this file's app setup
+    import importlib.util
+    __spec__ = importlib.util.find_spec('pool_preload')
+    app.run(debug=os.environ.get('FLASK_DEBUG') == '1', host='0.0.0.0', port=5000)
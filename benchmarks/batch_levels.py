@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Telugu Q&A Generator - Batch Level Scoring Benchmark
+Compares QuestionLevelAnalyzer.analyze_level_info one question at a time
+against analyze_level_infos_batch on questions from a synthetic corpus
+
+    python benchmarks/batch_levels.py --questions 50000
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import question_level_analyzer
+from benchmarks.corpus import CorpusGenerator
+from telugu_nlp_processor import TeluguNLPProcessor
+
+def best_time(action: Callable[[], Any], repeat: int) -> float:
+    """Best wall time of repeat runs, in seconds"""
+    timings: List[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        action()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+def main() -> None:
+    """Main function"""
+    parser = argparse.ArgumentParser(description="Benchmark batch question level scoring")
+    parser.add_argument('--questions', type=int, default=50000)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    processor = TeluguNLPProcessor(sentence_cache_size=0)
+    analyzer = processor.level_analyzer
+    generator = CorpusGenerator(seed=args.seed, processor=processor)
+
+    questions: List[Dict[str, str]] = []
+    while len(questions) < args.questions:
+        sentence = generator.sentence()
+        questions.extend(processor.generate_question_from_sentence(sentence, processor.extract_entities(sentence)))
+    questions = questions[:args.questions]
+    texts = [qa['question'] for qa in questions]
+    answers = [qa['answer'] for qa in questions]
+
+    print(f"📊 Level scoring of {len(questions)} questions "
+          f"(NumPy {'available' if question_level_analyzer.load_numpy() is not None else 'not installed'})")
+    print("=" * 50)
+    single = best_time(lambda: [analyzer.analyze_level_info(q, a) for q, a in zip(texts, answers)], args.repeat)
+    batch = best_time(lambda: analyzer.analyze_level_infos_batch(texts, answers), args.repeat)
+    print(f"one at a time: {single * 1e6 / len(texts):8.2f} µs/question")
+    print(f"batch:         {batch * 1e6 / len(texts):8.2f} µs/question ({single / batch:.2f}x)")
+
+if __name__ == "__main__":
+    main()
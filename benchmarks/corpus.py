@@ -0,0 +1,90 @@
+"""
+Telugu Q&A Generator - Synthetic Corpus
+Builds Telugu paragraphs of configurable size, entity density and keyword mix
+from the lexicons of TeluguNLPProcessor and QuestionLevelAnalyzer
+"""
+
+import random
+from typing import List, Optional
+
+from telugu_nlp_processor import TeluguNLPProcessor
+
+# Stems end in a consonant so the processor's entity patterns attach to them
+PERSON_STEMS = ['శ్రీనివాస', 'వెంకటేశ్వర', 'సుబ్బా', 'రాజ', 'కృష్ణ', 'లక్ష్మీ', 'సీతా', 'పద్మా', 'రమేష', 'అనిల']
+PLACE_STEMS = ['రామపుర', 'కొత్తపేట', 'కొండాపూర', 'హైదరాబాద', 'వరంగల', 'నెల్లూర', 'కడప', 'గుంటూర']
+MONTHS = ['చైత్ర', 'వైశాఖ', 'శ్రావణ', 'కార్తీక', 'మార్గశిర', 'మాఘ', 'ఫాల్గుణ']
+FILLER = ['ఆ', 'ఈ', 'చాలా', 'మరియు', 'కూడా', 'అక్కడ', 'ప్రజలు', 'పిల్లలు', 'రైతులు', 'ఉపాధ్యాయులు',
+          'పాఠశాల', 'పుస్తకం', 'పండుగ', 'నది', 'పొలం', 'సమావేశం']
+
+class CorpusGenerator:
+    """Generates synthetic Telugu paragraphs for benchmarking the NLP pipeline
+
+    ``entity_density`` is the chance that each entity kind (person, place,
+    year, day, month) appears in a sentence, and ``keyword_mix`` the chance
+    that each keyword kind (why/how markers, level indicators, complexity
+    words) appears.  ``overlap`` is the share of sentences drawn from a
+    shared pool, which models boilerplate repeated across paragraphs.
+    """
+
+    def __init__(self, seed: int = 0, entity_density: float = 0.5, keyword_mix: float = 0.3,
+                 overlap: float = 0.0, pool_size: int = 200,
+                 processor: Optional[TeluguNLPProcessor] = None):
+        self.rng = random.Random(seed)
+        self.entity_density = entity_density
+        self.keyword_mix = keyword_mix
+        self.overlap = overlap
+
+        processor = processor or TeluguNLPProcessor(sentence_cache_size=0)
+        analyzer = processor.level_analyzer
+        self.person_suffixes = processor.person_suffixes
+        self.location_indicators = processor.location_indicators
+        self.day_marker = processor.day_marker
+        self.month_marker = processor.month_marker
+        self.cause_keywords = processor.why_keywords + processor.how_keywords
+        self.verbs = processor.common_verbs
+        self.nouns = processor.common_nouns
+        self.indicators = [indicator for indicators in analyzer.complex_indicators.values()
+                           for indicator in indicators]
+        self.complexity_words = [word for words in analyzer.complexity_factors['word_complexity'].values()
+                                 for word in words]
+
+        self.pool = [self.sentence() for _ in range(pool_size)] if overlap > 0 else []
+
+    def sentence(self) -> str:
+        """Build one sentence"""
+        rng = self.rng
+        words = [rng.choice(FILLER) for _ in range(rng.randint(2, 5))]
+
+        if rng.random() < self.entity_density:
+            words.insert(0, rng.choice(PERSON_STEMS) + rng.choice(self.person_suffixes))
+        if rng.random() < self.entity_density:
+            words.append(rng.choice(PLACE_STEMS) + rng.choice(self.location_indicators))
+        if rng.random() < self.entity_density:
+            words.append(str(rng.randint(1900, 2024)))
+        if rng.random() < self.entity_density:
+            words.append(f"{rng.randint(1, 31)}{self.day_marker}")
+        if rng.random() < self.entity_density:
+            words.append(f"{rng.choice(MONTHS)}{self.month_marker}")
+
+        if rng.random() < self.keyword_mix:
+            words.append(rng.choice(self.cause_keywords))
+        if rng.random() < self.keyword_mix:
+            words.append(rng.choice(self.indicators))
+        if rng.random() < self.keyword_mix:
+            words.append(rng.choice(self.complexity_words))
+
+        words.append(rng.choice(self.nouns))
+        words.append(rng.choice(self.verbs))
+        return ' '.join(words)
+
+    def paragraph(self, sentences: int) -> str:
+        """Build one paragraph of the given number of sentences"""
+        chosen = [
+            self.rng.choice(self.pool) if self.pool and self.rng.random() < self.overlap else self.sentence()
+            for _ in range(sentences)
+        ]
+        return '. '.join(chosen) + '.'
+
+    def corpus(self, paragraphs: int, sentences: int) -> List[str]:
+        """Build a list of paragraphs"""
+        return [self.paragraph(sentences) for _ in range(paragraphs)]
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Telugu Q&A Generator - Gazetteer Scaling Benchmark
+Measures entity extraction per sentence, gazetteer compile time and
+artifact load time as synthetic person, place and organization gazetteers
+grow
+
+    python benchmarks/gazetteer_scaling.py --sizes 0 1000 10000 100000
+"""
+
+import argparse
+import pickle
+import random
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.corpus import CorpusGenerator
+from gazetteer import GAZETTEER_KINDS, Gazetteer
+from lexicons import artifact_key, compile_lexicons, read_lexicons
+from telugu_nlp_processor import TeluguNLPProcessor
+
+CONSONANTS = [chr(code) for code in range(0x0C15, 0x0C39)]
+VOWEL_SIGNS = ['', 'ా', 'ి', 'ీ', 'ు', 'ె', 'ో', 'ం']
+
+def synthetic_names(count: int, rng: random.Random) -> List[str]:
+    """Distinct one- or two-word names of two to five syllables"""
+    def word() -> str:
+        return ''.join(rng.choice(CONSONANTS) + rng.choice(VOWEL_SIGNS) for _ in range(rng.randint(2, 5)))
+    names = set()
+    while len(names) < count:
+        names.add(word() if rng.random() < 0.7 else f"{word()} {word()}")
+    return sorted(names)
+
+def main() -> None:
+    """Main function"""
+    parser = argparse.ArgumentParser(description="Benchmark entity extraction as gazetteers grow")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[0, 1000, 10000, 100000],
+                        help='names per gazetteer kind')
+    parser.add_argument('--sentences', type=int, default=2000)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    generator = CorpusGenerator(seed=args.seed, processor=TeluguNLPProcessor(sentence_cache_size=0))
+    lexicons = read_lexicons()
+
+    print(f"📊 Entity extraction over {args.sentences} sentences")
+    print("=" * 50)
+    for size in args.sizes:
+        names = {kind: synthetic_names(size, rng) for kind in GAZETTEER_KINDS}
+        start = time.perf_counter()
+        gazetteers: Dict[str, Gazetteer] = {kind: Gazetteer(kind, names[kind]) for kind in GAZETTEER_KINDS}
+        compiled = time.perf_counter() - start
+
+        artifact = compile_lexicons(artifact_key(b'', {}), lexicons, gazetteers)
+        payload = pickle.dumps(artifact, protocol=pickle.HIGHEST_PROTOCOL)
+        # Loading compiles the patterns again, as a process without them in re's cache would
+        re.purge()
+        start = time.perf_counter()
+        for gazetteer in pickle.loads(payload).gazetteers.values():
+            gazetteer.compile()
+        loaded = time.perf_counter() - start
+
+        processor = TeluguNLPProcessor(sentence_cache_size=0, lexicons=lexicons, gazetteers=gazetteers)
+        # Mention a known name in every other sentence so matches are found
+        sentences = [
+            generator.sentence() if i % 2 or not size else f"{rng.choice(names['persons'])} {generator.sentence()}"
+            for i in range(args.sentences)
+        ]
+        start = time.perf_counter()
+        found = sum(len(processor.extract_entities(sentence)['persons']) for sentence in sentences)
+        extraction = time.perf_counter() - start
+
+        print(f"{size:>7} names/kind  extract {extraction * 1e6 / len(sentences):6.2f} µs/sentence  "
+              f"compile {compiled:6.2f} s  artifact load {loaded:6.2f} s  "
+              f"({len(payload) / 1024 / 1024:.1f} MB, {found} persons found)")
+
+if __name__ == "__main__":
+    main()
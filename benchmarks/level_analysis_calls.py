@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Telugu Q&A Generator - Level Analysis Benchmark
+Counts the questions QuestionLevelAnalyzer scores per request
+"""
+
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Sequence
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from qa_record import LevelInfo
+from telugu_nlp_processor import TeluguNLPProcessor
+
+SAMPLE_PARAGRAPH = (
+    "శ్రీనివాసరావు 1985 సంవత్సరంలో హైదరాబాద్నగరం లో జన్మించాడు. "
+    "వర్షాల కారణంగా పంటలు బాగా పండాయి. "
+    "రైతులు కొత్త విధానం ద్వారా నీటిని పొదుపు చేశారు. "
+    "సీతాదేవి 15వ తేదీ విజయవాడ పట్టణం కు వెళ్ళింది. "
+    "ఈ ప్రక్రియ చాలా ముఖ్యమైన మార్పులకు దారితీసింది. "
+    "రాజ్కుమార్ జనవరి మాసం లో కొత్త పాఠశాల ప్రారంభించాడు."
+)
+
+def count_calls(processor: TeluguNLPProcessor, action: Callable[[], Any]) -> int:
+    """Run an action and count the questions it scores
+
+    Single analyses and the templated fill go through ``_score_question``;
+    batches count one scoring per row, whether NumPy scores them together or
+    they fall back to single analyses.
+    """
+    analyzer = processor.level_analyzer
+    score_question = analyzer._score_question
+    analyze_batch = analyzer.analyze_level_infos_batch
+    calls = 0
+
+    def counted_score(*args: Any, **kwargs: Any) -> LevelInfo:
+        nonlocal calls
+        calls += 1
+        return score_question(*args, **kwargs)
+
+    def counted_batch(questions: Sequence[str], answers: Sequence[str]) -> List[LevelInfo]:
+        nonlocal calls
+        before = calls
+        results = analyze_batch(questions, answers)
+        calls = before + len(questions)
+        return results
+
+    analyzer._score_question = counted_score  # type: ignore[method-assign]
+    analyzer.analyze_level_infos_batch = counted_batch  # type: ignore[method-assign]
+    try:
+        action()
+    finally:
+        del analyzer._score_question
+        del analyzer.analyze_level_infos_batch
+    return calls
+
+def strip_level_info(qa_pairs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Drop level analysis from pairs, as the statistics path used to see them"""
+    return [
+        {key: value for key, value in qa.items() if key not in ('level', 'confidence', 'scores', 'factors')}
+        for qa in qa_pairs
+    ]
+
+def main() -> None:
+    """Main function"""
+    processor = TeluguNLPProcessor(sentence_cache_size=0)
+    num_questions = 20
+    iterations = 200
+
+    def reanalyzing_request() -> None:
+        qa_pairs = processor.generate_qa_pairs(SAMPLE_PARAGRAPH, num_questions)
+        processor.get_question_statistics(strip_level_info(qa_pairs))
+
+    def combined_request() -> None:
+        processor.generate_qa_with_statistics(SAMPLE_PARAGRAPH, num_questions)
+
+    generated = count_calls(processor, lambda: processor.generate_qa_pairs(SAMPLE_PARAGRAPH, num_questions))
+    returned = len(processor.generate_qa_pairs(SAMPLE_PARAGRAPH, num_questions))
+    print(f"📊 Questions scored per /api/generate-qa request ({generated} while generating, {returned} returned)")
+    print("=" * 50)
+    calls: Dict[str, int] = {}
+    for label, action in (('re-analyzing statistics', reanalyzing_request),
+                          ('generate + statistics', combined_request)):
+        calls[label] = count_calls(processor, action)
+        start = time.perf_counter()
+        for _ in range(iterations):
+            action()
+        elapsed = (time.perf_counter() - start) / iterations * 1000
+        print(f"{label:<25} scored: {calls[label]:>4}   time: {elapsed:.3f} ms/request")
+
+    # Statistics reuse the generated analysis instead of scoring every returned pair again
+    assert calls['re-analyzing statistics'] == generated + returned, calls
+    assert calls['generate + statistics'] == generated, calls
+
+if __name__ == "__main__":
+    main()
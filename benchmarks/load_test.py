@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Telugu Q&A Generator - Load Test
+Sends concurrent requests to /api/generate-qa and reports throughput and
+latency percentiles
+
+    python run.py serve --workers 4 --threads 4 &
+    python benchmarks/load_test.py --requests 2000 --concurrency 32
+    python benchmarks/load_test.py --compact --accept-encoding gzip
+"""
+
+import argparse
+import json
+import random
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Tuple
+
+PARAGRAPHS = [
+    "శ్రీనివాసరావు 1985 సంవత్సరంలో హైదరాబాద్నగరం లో జన్మించాడు. "
+    "వర్షాల కారణంగా పంటలు బాగా పండాయి. రైతులు కొత్త విధానం ద్వారా నీటిని పొదుపు చేశారు.",
+    "సీతాదేవి 15వ తేదీ విజయవాడ పట్టణం కు వెళ్ళింది. "
+    "ఈ ప్రక్రియ చాలా ముఖ్యమైన మార్పులకు దారితీసింది.",
+    "రాజ్కుమార్ జనవరి మాసం లో కొత్త పాఠశాల ప్రారంభించాడు. "
+    "గ్రామస్తులు ఆ పాఠశాల ద్వారా చదువు నేర్చుకున్నారు. ఆ పాఠశాల తెలంగాణ రాష్ట్రం లో ప్రసిద్ధి చెందింది."
+]
+
+def send_request(url: str, body: bytes, timeout: float, accept_encoding: str) -> Tuple[float, bool, int]:
+    """Send one request and return its latency in seconds, whether it succeeded and the bytes received"""
+    headers = {'Content-Type': 'application/json'}
+    if accept_encoding:
+        headers['Accept-Encoding'] = accept_encoding
+    request = urllib.request.Request(url, data=body, headers=headers)
+    start = time.perf_counter()
+    received = 0
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            received = len(response.read())
+            ok = response.status == 200
+    except (urllib.error.URLError, OSError):
+        ok = False
+    return time.perf_counter() - start, ok, received
+
+def percentile(values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of sorted values"""
+    if not values:
+        return 0.0
+    index = min(len(values) - 1, max(0, int(round(fraction * len(values))) - 1))
+    return values[index]
+
+def main() -> None:
+    """Main function"""
+    parser = argparse.ArgumentParser(description="Load test /api/generate-qa")
+    parser.add_argument('--url', default='http://localhost:5000/api/generate-qa')
+    parser.add_argument('--requests', type=int, default=1000)
+    parser.add_argument('--concurrency', type=int, default=16)
+    parser.add_argument('--num-questions', type=int, default=10)
+    parser.add_argument('--timeout', type=float, default=30)
+    parser.add_argument('--unique', action='store_true',
+                        help='make every paragraph unique so result caches do not hit')
+    parser.add_argument('--compact', action='store_true', help='ask for the compact response form')
+    parser.add_argument('--accept-encoding', default='', help='Accept-Encoding header, e.g. gzip or br')
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    bodies: List[bytes] = []
+    for index in range(args.requests):
+        paragraph = rng.choice(PARAGRAPHS)
+        if args.unique:
+            paragraph += f" ఈ కథ సంఖ్య {index}."
+        bodies.append(json.dumps({
+            'paragraph': paragraph,
+            'num_questions': args.num_questions,
+            'difficulty': 'mixed',
+            'compact': args.compact
+        }).encode('utf-8'))
+
+    print(f"🔥 {args.requests} requests, concurrency {args.concurrency} → {args.url}")
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+        results = list(executor.map(
+            lambda body: send_request(args.url, body, args.timeout, args.accept_encoding), bodies
+        ))
+    elapsed = time.perf_counter() - start
+
+    latencies = sorted(latency for latency, ok, _ in results if ok)
+    errors = sum(1 for _, ok, _ in results if not ok)
+    received = sum(size for _, ok, size in results if ok)
+    print(f"throughput: {len(latencies) / elapsed:.1f} req/s over {elapsed:.2f} s")
+    print(f"latency p50: {percentile(latencies, 0.50) * 1000:.1f} ms  "
+          f"p90: {percentile(latencies, 0.90) * 1000:.1f} ms  "
+          f"p99: {percentile(latencies, 0.99) * 1000:.1f} ms")
+    print(f"response size: {received / max(1, len(latencies)):.0f} B on average")
+    print(f"errors: {errors}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Telugu Q&A Generator - Parallel Paragraph Benchmark
+Times one large paragraph processed on a single core against the same
+paragraph with its sentences sharded over a worker pool, and checks that
+both give the same result.  The CPU time the requesting process still
+spends in parallel mode bounds the speedup more workers can give
+
+    python benchmarks/parallel_paragraph.py --sentences 1000 10000 --workers 4
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Callable, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.corpus import CorpusGenerator
+from telugu_nlp_processor import TeluguNLPProcessor, create_batch_executor
+
+def median_ms(function: Callable[[str], object], paragraphs: List[str]) -> Tuple[float, float]:
+    """Median wall time and CPU time of this process of function over the paragraphs in milliseconds"""
+    times: List[float] = []
+    cpu_times: List[float] = []
+    for paragraph in paragraphs:
+        cpu_start = time.process_time()
+        start = time.perf_counter()
+        function(paragraph)
+        times.append(time.perf_counter() - start)
+        cpu_times.append(time.process_time() - cpu_start)
+    return statistics.median(times) * 1e3, statistics.median(cpu_times) * 1e3
+
+def main() -> None:
+    """Main function"""
+    parser = argparse.ArgumentParser(description="Benchmark intra-request parallelism on large paragraphs")
+    parser.add_argument('--sentences', type=int, nargs='+', default=[1000, 10000], help='paragraph sizes')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--difficulty', default='advanced',
+                        help='a rare level makes the whole paragraph be analyzed')
+    parser.add_argument('--num-questions', type=int, default=100)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    generator = CorpusGenerator(seed=args.seed, processor=TeluguNLPProcessor(sentence_cache_size=0))
+    executor = create_batch_executor(args.workers)
+    # Every run gets a paragraph of its own, since the workers keep sentence caches
+    single = TeluguNLPProcessor(sentence_cache_size=0)
+    parallel = TeluguNLPProcessor(sentence_cache_size=0, parallel_executor=lambda: executor,
+                                  parallel_window=2 * args.workers)
+
+    print(f"⚡ {args.workers} workers, {args.num_questions} {args.difficulty} questions, "
+          f"parallel above {parallel.parallel_min_sentences} sentences")
+    print("=" * 50)
+    try:
+        # Start the workers before timing
+        parallel.generate_qa_pairs(' '.join(generator.corpus(1, 2 * parallel.parallel_min_sentences)),
+                                   args.num_questions, args.difficulty)
+        for sentences in sorted(args.sentences):
+            paragraphs = generator.corpus(args.repeat, sentences)
+            results: List[object] = []
+            one, _ = median_ms(lambda paragraph: results.append(
+                single.generate_qa_pairs(paragraph, args.num_questions, args.difficulty)
+            ), paragraphs)
+            many, main_cpu = median_ms(lambda paragraph: results.append(
+                parallel.generate_qa_pairs(paragraph, args.num_questions, args.difficulty)
+            ), paragraphs)
+            same = results[:args.repeat] == results[args.repeat:]
+            print(f"{sentences:>7} sentences  single core {one:9.1f} ms  parallel {many:9.1f} ms  "
+                  f"speedup {one / many:5.2f}x  (at most {one / main_cpu:4.1f}x, requesting process CPU "
+                  f"{main_cpu:7.1f} ms)  same result: {same}")
+    finally:
+        executor.shutdown()
+
+if __name__ == "__main__":
+    main()
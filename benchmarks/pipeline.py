@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Telugu Q&A Generator - Pipeline Benchmark
+Times every stage of Q&A generation on a synthetic corpus, saves the results
+as JSON and optionally fails when a stage regressed against a baseline
+
+    python benchmarks/pipeline.py --output baseline.json
+    python benchmarks/pipeline.py --compare baseline.json --threshold 0.15
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.corpus import CorpusGenerator
+from qa_record import QARecordSet
+from telugu_nlp_processor import TeluguNLPProcessor
+
+def time_stage(action: Callable[[], Any], repeat: int) -> float:
+    """Run an action repeat times and return the median wall time in seconds"""
+    timings: List[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        action()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+def run_benchmark(args: argparse.Namespace) -> Dict[str, Any]:
+    """Time each pipeline stage over the corpus"""
+    processor = TeluguNLPProcessor(sentence_cache_size=0)
+    analyzer = processor.level_analyzer
+    generator = CorpusGenerator(
+        seed=args.seed,
+        entity_density=args.entity_density,
+        keyword_mix=args.keyword_mix,
+        processor=processor
+    )
+    corpus = generator.corpus(args.paragraphs, args.sentences)
+
+    # Intermediate results of each stage feed the next one
+    paragraph_sentences = [processor.split_sentences(paragraph) for paragraph in corpus]
+    sentences = [sentence for split in paragraph_sentences for sentence in split if len(sentence) >= 10]
+    entities = [processor.extract_entities(sentence) for sentence in sentences]
+    questions = [processor.generate_question_from_sentence(sentence, found)
+                 for sentence, found in zip(sentences, entities)]
+    for sentence, generated in zip(sentences, questions):
+        for qa in generated:
+            qa['context'] = sentence
+    flat_questions = [qa for generated in questions for qa in generated]
+
+    def dedupe() -> List[Dict[str, Any]]:
+        unique: List[Dict[str, Any]] = []
+        seen: set[str] = set()
+        for qa in flat_questions:
+            if qa['question'] not in seen:
+                seen.add(qa['question'])
+                unique.append(qa)
+        return unique
+
+    unique_questions = dedupe()
+    analyzed = [{**qa, **analyzer.analyze_question_level(qa['question'], qa['answer'], qa['context'])}
+                for qa in unique_questions]
+
+    def fill() -> int:
+        return sum(len(list(processor._iter_generic_questions(split, 0, args.fill_questions, set(), QARecordSet())))
+                   for split in paragraph_sentences)
+
+    def end_to_end() -> None:
+        for paragraph in corpus:
+            processor.generate_qa_pairs(paragraph, args.num_questions)
+
+    stages: Dict[str, Any] = {
+        'split_sentences': (lambda: [processor.split_sentences(paragraph) for paragraph in corpus], len(corpus)),
+        'extract_entities': (lambda: [processor.extract_entities(sentence) for sentence in sentences], len(sentences)),
+        'generate_questions': (lambda: [processor.generate_question_from_sentence(sentence, found)
+                                        for sentence, found in zip(sentences, entities)], len(sentences)),
+        'dedupe': (dedupe, len(flat_questions)),
+        'analyze_question_level': (lambda: [analyzer.analyze_question_level(qa['question'], qa['answer'], qa['context'])
+                                            for qa in unique_questions], len(unique_questions)),
+        'generic_fill': (fill, fill()),
+        'level_statistics': (lambda: analyzer.get_level_statistics(analyzed), len(analyzed)),
+        'end_to_end': (end_to_end, len(corpus))
+    }
+
+    results: Dict[str, Any] = {}
+    for name, (action, items) in stages.items():
+        seconds = time_stage(action, args.repeat)
+        results[name] = {
+            'items': items,
+            'total_ms': round(seconds * 1000, 3),
+            'per_item_us': round(seconds * 1e6 / items, 3) if items else 0
+        }
+
+    return {
+        'meta': {
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'paragraphs': args.paragraphs,
+            'sentences': args.sentences,
+            'entity_density': args.entity_density,
+            'keyword_mix': args.keyword_mix,
+            'num_questions': args.num_questions,
+            'fill_questions': args.fill_questions,
+            'seed': args.seed,
+            'repeat': args.repeat
+        },
+        'stages': results
+    }
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[str]:
+    """Return the stages whose per-item time grew by more than threshold"""
+    regressions: List[str] = []
+    print(f"\n{'stage':<24}{'baseline µs':>14}{'current µs':>14}{'change':>10}")
+    for name, result in current['stages'].items():
+        base = baseline.get('stages', {}).get(name)
+        if not base or not base['per_item_us']:
+            continue
+        change = result['per_item_us'] / base['per_item_us'] - 1
+        flag = ''
+        if change > threshold:
+            regressions.append(name)
+            flag = '  ❌'
+        print(f"{name:<24}{base['per_item_us']:>14.3f}{result['per_item_us']:>14.3f}{change:>+10.1%}{flag}")
+    return regressions
+
+def main() -> None:
+    """Main function"""
+    parser = argparse.ArgumentParser(description="Benchmark the Telugu Q&A pipeline stage by stage")
+    parser.add_argument('--paragraphs', type=int, default=200)
+    parser.add_argument('--sentences', type=int, default=10, help='sentences per paragraph')
+    parser.add_argument('--entity-density', type=float, default=0.5)
+    parser.add_argument('--keyword-mix', type=float, default=0.3)
+    parser.add_argument('--num-questions', type=int, default=10, help='questions per end-to-end request')
+    parser.add_argument('--fill-questions', type=int, default=30, help='generic questions filled per paragraph')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help='write results to this JSON file')
+    parser.add_argument('--compare', help='baseline JSON file to check for regressions')
+    parser.add_argument('--threshold', type=float, default=0.15, help='allowed slowdown per stage (0.15 = 15%%)')
+    args = parser.parse_args()
+
+    print("📊 Telugu Q&A pipeline benchmark")
+    print("=" * 50)
+    results = run_benchmark(args)
+    for name, result in results['stages'].items():
+        print(f"{name:<24}{result['per_item_us']:>12.3f} µs/item  ({result['items']} items, {result['total_ms']:.1f} ms)")
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2, ensure_ascii=False), encoding='utf-8')
+        print(f"\n💾 Results saved to {args.output}")
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text(encoding='utf-8'))
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n❌ Regressions above {args.threshold:.0%}: {', '.join(regressions)}")
+            sys.exit(1)
+        print("\n✅ No regressions")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Telugu Q&A Generator - Question Bank Benchmark
+Fills a temporary question bank with synthetic paragraphs and compares
+generating a paragraph against reading it back from the bank, then times
+paged queries and level statistics as the bank grows
+
+    python benchmarks/question_bank.py --paragraphs 1000 10000
+"""
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.corpus import CorpusGenerator
+from question_bank import QuestionBank
+from telugu_nlp_processor import TeluguNLPProcessor
+
+def median_ms(function: Callable[[], object], repeat: int) -> float:
+    """Median wall time of function in milliseconds"""
+    times: List[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1e3
+
+def main() -> None:
+    """Main function"""
+    parser = argparse.ArgumentParser(description="Benchmark question bank reuse and queries")
+    parser.add_argument('--paragraphs', type=int, nargs='+', default=[1000, 10000],
+                        help='bank sizes in stored paragraphs')
+    parser.add_argument('--sentences', type=int, default=8, help='sentences per paragraph')
+    parser.add_argument('--num-questions', type=int, default=10)
+    parser.add_argument('--repeat', type=int, default=20)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    generator = CorpusGenerator(seed=args.seed, processor=TeluguNLPProcessor(sentence_cache_size=0))
+    corpus = generator.corpus(max(args.paragraphs), args.sentences)
+
+    with tempfile.TemporaryDirectory() as directory:
+        bank = QuestionBank(str(Path(directory) / 'bank.db'))
+        processor = TeluguNLPProcessor(sentence_cache_size=0, question_bank=bank)
+        plain = TeluguNLPProcessor(sentence_cache_size=0)
+        stored = 0
+
+        print(f"📊 Question bank, {args.num_questions} questions per paragraph")
+        print("=" * 50)
+        for size in sorted(args.paragraphs):
+            start = time.perf_counter()
+            for number, paragraph in enumerate(corpus[stored:size], stored):
+                processor.generate_qa_with_statistics(paragraph, args.num_questions, source=f"chapter-{number // 100}")
+            filled = time.perf_counter() - start
+            stored = size
+
+            paragraph = corpus[size // 2]
+            generate = median_ms(lambda: plain.generate_qa_pairs(paragraph, args.num_questions), args.repeat)
+            hit = median_ms(lambda: processor.generate_qa_pairs_cached(paragraph, args.num_questions), args.repeat)
+            by_level = median_ms(lambda: bank.query(level='advanced', limit=50), args.repeat)
+            by_source = median_ms(lambda: bank.query(source='chapter-3', limit=50), args.repeat)
+            by_confidence = median_ms(lambda: bank.query(min_confidence=0.7, max_confidence=0.8, limit=50),
+                                      args.repeat)
+            totals = median_ms(lambda: bank.level_totals(type='who'), args.repeat)
+            scanned = median_ms(lambda: bank.level_totals(min_confidence=0.0), args.repeat)
+
+            print(f"{size:>7} paragraphs ({bank.stats()['questions']} questions, filled in {filled:.1f} s)")
+            print(f"  generate {generate:8.3f} ms   read from bank {hit:8.3f} ms")
+            print(f"  page by level {by_level:8.3f} ms   by source {by_source:8.3f} ms   "
+                  f"by confidence {by_confidence:8.3f} ms")
+            print(f"  statistics from totals {totals:8.3f} ms   by scanning {scanned:8.3f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Telugu Q&A Generator - Question Index Benchmark
+Measures the cost of adding and looking up questions in a QuestionIndex,
+and the memory it holds, as it grows to hundreds of thousands of questions
+
+    python benchmarks/question_index.py --sizes 1000 10000 100000 300000
+"""
+
+import argparse
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from question_index import DEDUPE_MODES, QuestionIndex, normalize_question
+
+CONSONANTS = [chr(code) for code in range(0x0C15, 0x0C39)]
+VOWEL_SIGNS = ['', 'ా', 'ి', 'ీ', 'ు', 'ె', 'ో', 'ం']
+
+def synthetic_question(rng: random.Random) -> str:
+    """A question of four to eight words of two to five syllables"""
+    def word() -> str:
+        return ''.join(rng.choice(CONSONANTS) + rng.choice(VOWEL_SIGNS) for _ in range(rng.randint(2, 5)))
+    return ' '.join(word() for _ in range(rng.randint(4, 8))) + '?'
+
+def main() -> None:
+    """Main function"""
+    parser = argparse.ArgumentParser(description="Benchmark QuestionIndex as it grows")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000])
+    parser.add_argument('--modes', nargs='+', default=['normalized', 'near'], choices=DEDUPE_MODES)
+    parser.add_argument('--lookups', type=int, default=5000, help='questions timed at each size')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    questions = [synthetic_question(rng) for _ in range(max(args.sizes))]
+    # Unseen questions, and seen ones with punctuation and a counter suffix
+    unseen = [synthetic_question(rng) for _ in range(args.lookups)]
+    repeats = [f"{question.rstrip('?')}, ({number})?" for number, question in enumerate(questions[:args.lookups])]
+    normalize_question('')
+
+    print(f"📊 QuestionIndex lookups, {args.lookups} per size")
+    print("=" * 50)
+    for mode in args.modes:
+        for size in sorted(args.sizes):
+            # Memory is traced on a separate build, tracing slows everything down
+            tracemalloc.start()
+            index = QuestionIndex(mode, max_size=size)
+            index.filter(questions[:size])
+            memory = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+
+            index = QuestionIndex(mode, max_size=size)
+            start = time.perf_counter()
+            for question in questions[:size]:
+                index.add(question)
+            added = time.perf_counter() - start
+
+            start = time.perf_counter()
+            new = sum(question not in index for question in unseen)
+            miss = time.perf_counter() - start
+            start = time.perf_counter()
+            found = sum(question in index for question in repeats[:min(size, args.lookups)])
+            hit = time.perf_counter() - start
+
+            print(f"{mode:<10} {size:>7} questions  add {added * 1e6 / size:6.1f} µs  "
+                  f"miss {miss * 1e6 / len(unseen):6.1f} µs  hit {hit * 1e6 / min(size, args.lookups):6.1f} µs  "
+                  f"{memory / size:5.0f} B/question  ({new} unseen new, {found} repeats found)")
+
+if __name__ == "__main__":
+    main()
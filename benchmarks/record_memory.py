@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Telugu Q&A Generator - Record Memory Benchmark
+Compares memory held and allocated by a batch of Q&A pairs kept as compact
+QARecords against the same pairs as JSON-shaped dicts
+
+    python benchmarks/record_memory.py --questions 10000
+"""
+
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.corpus import CorpusGenerator
+from telugu_nlp_processor import TeluguNLPProcessor
+
+def measure(action: Callable[[], Any]) -> Tuple[Any, Dict[str, float]]:
+    """Run an action under tracemalloc and report retained and peak memory, GC runs and time"""
+    gc.collect()
+    collections = sum(stats['collections'] for stats in gc.get_stats())
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = action()
+    elapsed = time.perf_counter() - start
+    retained, peak = tracemalloc.get_traced_memory()
+    blocks = sum(stat.count for stat in tracemalloc.take_snapshot().statistics('filename'))
+    tracemalloc.stop()
+    return result, {
+        'retained_mb': retained / 1024 / 1024,
+        'peak_mb': peak / 1024 / 1024,
+        'blocks': blocks,
+        'gc_runs': sum(stats['collections'] for stats in gc.get_stats()) - collections,
+        'seconds': elapsed
+    }
+
+def main() -> None:
+    """Main function"""
+    parser = argparse.ArgumentParser(description="Measure memory of a Q&A batch as records and as dicts")
+    parser.add_argument('--questions', type=int, default=10000, help='total questions in the batch')
+    parser.add_argument('--num-questions', type=int, default=20, help='questions per paragraph')
+    parser.add_argument('--sentences', type=int, default=12)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    processor = TeluguNLPProcessor(sentence_cache_size=0)
+    generator = CorpusGenerator(seed=args.seed, processor=processor)
+    corpus = generator.corpus(max(1, args.questions // args.num_questions), args.sentences)
+
+    def as_dicts() -> List[List[Dict[str, Any]]]:
+        return [processor.generate_qa_pairs(paragraph, args.num_questions) for paragraph in corpus]
+
+    def as_records() -> List[Any]:
+        return [processor.generate_qa_records(paragraph, args.num_questions) for paragraph in corpus]
+
+    print(f"📊 Memory of {len(corpus)} paragraphs × {args.num_questions} questions")
+    print("=" * 50)
+    results: Dict[str, Dict[str, float]] = {}
+    for label, action in (('dicts', as_dicts), ('records', as_records)):
+        batch, results[label] = measure(action)
+        total = sum(len(result) for result in batch)
+        stats = results[label]
+        print(f"{label:<8} {total:>6} questions  retained {stats['retained_mb']:7.2f} MB  "
+              f"peak {stats['peak_mb']:7.2f} MB  blocks {stats['blocks']:>8}  "
+              f"gc runs {stats['gc_runs']:>4}  {stats['seconds']:.2f} s")
+        del batch
+
+    dicts, records = results['dicts'], results['records']
+    print(f"\n✅ records retain {1 - records['retained_mb'] / dicts['retained_mb']:.0%} less memory "
+          f"in {1 - records['blocks'] / dicts['blocks']:.0%} fewer blocks")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Telugu Q&A Generator - Response Encoding Benchmark
+Compares the size and encoding time of the verbose /api/generate-qa
+response with the compact form, and what gzip and brotli take off each
+
+    python benchmarks/response_encoding.py --sentences 10 50 200
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Callable, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app import app
+from benchmarks.corpus import CorpusGenerator
+from qa_record import compact_qa_pairs
+from response_encoding import available_encodings, compress, dumps_json
+from telugu_nlp_processor import TeluguNLPProcessor
+
+def median_ms(function: Callable[[], object], repeat: int) -> float:
+    """Median wall time of function in milliseconds"""
+    times: List[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1e3
+
+def main() -> None:
+    """Main function"""
+    parser = argparse.ArgumentParser(description="Benchmark verbose and compact response encoding")
+    parser.add_argument('--sentences', type=int, nargs='+', default=[10, 50, 200],
+                        help='paragraph sizes in sentences')
+    parser.add_argument('--questions-per-sentence', type=int, default=2)
+    parser.add_argument('--repeat', type=int, default=20)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    processor = TeluguNLPProcessor(sentence_cache_size=0)
+    generator = CorpusGenerator(seed=args.seed, processor=processor)
+
+    print(f"📦 Response encoding, {args.questions_per_sentence} questions per sentence")
+    print("=" * 50)
+    for sentences in args.sentences:
+        paragraph = generator.corpus(1, sentences)[0]
+        result = processor.generate_qa_with_statistics(paragraph, sentences * args.questions_per_sentence)
+
+        def verbose() -> bytes:
+            return app.json.dumps({'success': True, 'qa_pairs': result['qa_pairs'],
+                                   'total_questions': len(result['qa_pairs']),
+                                   'statistics': result['statistics']}).encode('utf-8')
+
+        def compact() -> bytes:
+            table, qa_pairs = compact_qa_pairs(result['qa_pairs'])
+            return dumps_json({'success': True, 'compact': True, 'sentences': table, 'qa_pairs': qa_pairs,
+                               'total_questions': len(qa_pairs), 'statistics': result['statistics']})
+
+        print(f"{sentences} sentences, {len(result['qa_pairs'])} questions")
+        for name, encode in (('verbose', verbose), ('compact', compact)):
+            body = encode()
+            line = f"  {name:<8} {len(body):>8} B  encode {median_ms(encode, args.repeat):7.3f} ms"
+            for encoding in available_encodings():
+                size = len(compress(body, encoding))
+                line += (f"  {encoding} {size:>7} B in "
+                         f"{median_ms(lambda: compress(body, encoding), args.repeat):6.3f} ms")
+            print(line)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Telugu Q&A Generator - Sentence Segmentation Benchmark
+Compares peak memory and time of splitting a multi-megabyte text with
+re.split plus a strip pass against SentenceSegmenter over the string, a
+file object and a memory-mapped file
+
+    python benchmarks/segmentation.py --megabytes 20
+"""
+
+import argparse
+import mmap
+import re
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.corpus import CorpusGenerator
+from telugu_nlp_processor import TeluguNLPProcessor
+
+def measure(action: Callable[[], Any]) -> Tuple[Any, float, float]:
+    """Run an action under tracemalloc, returning its result, peak memory in MB and time"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = action()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, peak / 1024 / 1024, elapsed
+
+def main() -> None:
+    """Main function"""
+    parser = argparse.ArgumentParser(description="Benchmark sentence segmentation of a large text")
+    parser.add_argument('--megabytes', type=float, default=20, help='UTF-8 size of the text')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    processor = TeluguNLPProcessor(sentence_cache_size=0)
+    segmenter = processor.segmenter
+    generator = CorpusGenerator(seed=args.seed, processor=processor)
+    parts: List[str] = []
+    size = 0
+    while size < args.megabytes * 1024 * 1024:
+        paragraph = generator.paragraph(20) + '\n'
+        parts.append(paragraph)
+        size += len(paragraph.encode('utf-8'))
+    text = ''.join(parts)
+    del parts
+    boundary = '|'.join(map(re.escape, processor.sentence_endings))
+
+    with tempfile.NamedTemporaryFile('w', encoding='utf-8', suffix='.txt') as handle:
+        handle.write(text)
+        handle.flush()
+
+        def split_and_strip() -> int:
+            return len([s.strip() for s in re.split(boundary, text) if s.strip()])
+
+        def spans() -> int:
+            return len(segmenter.spans(text))
+
+        def stream_string() -> int:
+            return sum(1 for _ in segmenter.iter_sentences(text))
+
+        def stream_file() -> int:
+            with open(handle.name, encoding='utf-8') as source:
+                return sum(1 for _ in segmenter.iter_sentences(source))
+
+        def stream_mmap() -> int:
+            with open(handle.name, 'rb') as source, mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return sum(1 for _ in segmenter.iter_sentences(mapped))
+
+        print(f"📊 Segmenting {size / 1024 / 1024:.1f} MB of text")
+        print("=" * 50)
+        baseline = None
+        for label, action in (('split + strip', split_and_strip), ('spans', spans),
+                              ('stream str', stream_string), ('stream file', stream_file),
+                              ('stream mmap', stream_mmap)):
+            count, peak, seconds = measure(action)
+            baseline = baseline or peak
+            print(f"{label:<14} {count:>8} sentences  peak {peak:8.2f} MB "
+                  f"({peak / baseline:6.1%})  {seconds:.2f} s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Telugu Q&A Generator - Sentence Cache Benchmark
+Compares Q&A generation with and without per-sentence memoization on a
+corpus where paragraphs share part of their sentences
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.corpus import CorpusGenerator
+from telugu_nlp_processor import TeluguNLPProcessor
+
+def run(processor: TeluguNLPProcessor, corpus: List[str], num_questions: int) -> float:
+    """Generate Q&A for every paragraph and return the elapsed seconds"""
+    start = time.perf_counter()
+    for paragraph in corpus:
+        processor.generate_qa_pairs(paragraph, num_questions)
+    return time.perf_counter() - start
+
+def main() -> None:
+    """Main function"""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--paragraphs', type=int, default=500)
+    parser.add_argument('--sentences', type=int, default=12)
+    parser.add_argument('--overlap', type=float, default=0.6, help='share of sentences drawn from the common pool')
+    parser.add_argument('--num-questions', type=int, default=50)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    generator = CorpusGenerator(seed=args.seed, overlap=args.overlap, pool_size=args.sentences * 4)
+    corpus = generator.corpus(args.paragraphs, args.sentences)
+
+    print("📊 Sentence cache benchmark")
+    print("=" * 50)
+    print(f"{args.paragraphs} paragraphs × {args.sentences} sentences, {args.overlap:.0%} overlap")
+
+    uncached = TeluguNLPProcessor(sentence_cache_size=0)
+    cached = TeluguNLPProcessor()
+    uncached_time = run(uncached, corpus, args.num_questions)
+    cached_time = run(cached, corpus, args.num_questions)
+
+    assert cached.sentence_cache is not None
+    stats = cached.sentence_cache.stats()
+    print(f"without cache: {uncached_time * 1000 / len(corpus):.3f} ms/paragraph")
+    print(f"with cache:    {cached_time * 1000 / len(corpus):.3f} ms/paragraph "
+          f"({uncached_time / cached_time:.2f}x)")
+    print(f"hit rate: {stats['hit_rate']:.1%}  entries: {stats['entries']}  evictions: {stats['evictions']}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Telugu Q&A Generator - Startup Benchmark
+Starts fresh interpreters that import the app and serve one
+/api/generate-qa request through the Flask test client, reporting the
+time to first served request and the slowest imports from -X importtime
+
+    python benchmarks/startup.py --runs 10
+    python benchmarks/startup.py --no-artifact   # compile lexicons at startup
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Runs in the child interpreter; prints its own timings as JSON
+CHILD = r'''
+import json, time
+start = time.perf_counter()
+from app import app
+imported = time.perf_counter()
+response = app.test_client().post('/api/generate-qa', json={
+    'paragraph': 'రాముడు అయోధ్య నగరంలో జన్మించాడు. సీత మిథిల నగరంలో పుట్టింది.',
+    'num_questions': 5
+})
+assert response.status_code == 200, response.status_code
+served = time.perf_counter()
+print(json.dumps({'import': imported - start, 'first_request': served - imported}))
+'''
+
+def parse_importtime(stderr: str) -> Dict[str, float]:
+    """Cumulative import time in seconds of the modules app imports directly, from -X importtime output"""
+    times: Dict[str, float] = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        # Names are indented two spaces per nesting level below the first
+        if len(name) - len(name.lstrip()) == 3:
+            times[name.strip()] = int(cumulative) / 1e6
+    return times
+
+def run_once(env: Dict[str, str]) -> Tuple[Dict[str, float], Dict[str, float]]:
+    """Start one interpreter; returns its timings and the import times of app's direct imports"""
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', CHILD], cwd=ROOT, env=env,
+                            capture_output=True, text=True, check=True)
+    timings = json.loads(result.stdout.strip().splitlines()[-1])
+    timings['process'] = time.perf_counter() - start
+    return timings, parse_importtime(result.stderr)
+
+def main() -> None:
+    """Main function"""
+    parser = argparse.ArgumentParser(description="Measure time to first served request")
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--top', type=int, default=8, help='slowest imports of app to show')
+    parser.add_argument('--no-artifact', action='store_true',
+                        help='ignore the precompiled lexicon artifact and compile at startup')
+    args = parser.parse_args()
+
+    env = {**os.environ, 'QA_CACHE_SIZE': '0', 'QA_METRICS': '0'}
+    if args.no_artifact:
+        env['QA_LEXICON_ARTIFACT'] = str(ROOT / 'data' / 'no-such-artifact.pickle')
+
+    runs: List[Dict[str, float]] = []
+    imports: Dict[str, List[float]] = {}
+    for _ in range(args.runs):
+        timings, import_times = run_once(env)
+        runs.append(timings)
+        for name, seconds in import_times.items():
+            imports.setdefault(name, []).append(seconds)
+
+    print(f"📊 Startup over {args.runs} runs (median"
+          f"{', lexicons compiled at startup' if args.no_artifact else ''})")
+    print("=" * 50)
+    for key, label in (('import', 'import app'), ('first_request', 'first request'),
+                       ('process', 'spawn to first response')):
+        print(f"{label:<26} {statistics.median(run[key] for run in runs) * 1e3:8.1f} ms")
+    print("\nslowest imports of app")
+    slowest = sorted(imports.items(), key=lambda item: -statistics.median(item[1]))[:args.top]
+    for name, seconds in slowest:
+        print(f"  {name:<24} {statistics.median(seconds) * 1e3:8.1f} ms")
+
+if __name__ == "__main__":
+    main()
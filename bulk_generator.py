@@ -0,0 +1,290 @@
+import json
+import os
+import time
+from collections import deque
+from concurrent.futures import Executor, Future
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from question_bank import QuestionBank
+from question_index import QuestionIndex
+from telugu_nlp_processor import TeluguNLPProcessor, create_batch_executor, generate_batch_chunk
+
+# Fields of an input record passed on to TeluguNLPProcessor.generate_batch_item
+ITEM_FIELDS = ('num_questions', 'difficulty', 'selection')
+
+# Input record fields holding the text and the record id, in order of preference
+TEXT_FIELDS = ('paragraph', 'text', 'body')
+ID_FIELDS = ('id', 'request_id')
+
+def iter_input_files(paths: Iterable[str]) -> Iterator[Path]:
+    """Yield the .txt and .jsonl files named by paths, walking directories in sorted order"""
+    for name in paths:
+        path = Path(name)
+        if path.is_dir():
+            for child in sorted(path.rglob('*')):
+                if child.is_file() and child.suffix in ('.txt', '.jsonl'):
+                    yield child
+        else:
+            yield path
+
+def iter_input_records(paths: Iterable[str], defaults: Optional[Dict[str, Any]] = None) -> Iterator[Dict[str, Any]]:
+    """Yield one record per paragraph from text and JSONL files, reading lazily
+
+    Text files hold paragraphs separated by blank lines.  JSONL files hold one
+    object per line with the text in ``paragraph`` (or ``text``/``body``), an
+    optional ``id`` (or ``request_id``) and optional per-record
+    ``num_questions``, ``difficulty`` and ``selection``, which override
+    ``defaults``.  Every record gets an ``id``, a ``source`` and the ``file``
+    it was read from.
+    """
+    defaults = defaults or {}
+    for path in iter_input_files(paths):
+        if path.suffix == '.jsonl':
+            with open(path, encoding='utf-8') as handle:
+                for line_number, line in enumerate(handle, 1):
+                    if not line.strip():
+                        continue
+                    source = f"{path}:{line_number}"
+                    try:
+                        data = json.loads(line)
+                    except json.JSONDecodeError:
+                        yield {'id': source, 'source': source, 'error': 'Invalid JSON'}
+                        continue
+                    if not isinstance(data, dict):
+                        yield {'id': source, 'source': source, 'error': 'Record must be a JSON object'}
+                        continue
+                    record = {**defaults, **{key: data[key] for key in ITEM_FIELDS if key in data}}
+                    record['paragraph'] = next((data[key] for key in TEXT_FIELDS if key in data), '')
+                    record['id'] = next((data[key] for key in ID_FIELDS if key in data), source)
+                    record['source'] = source
+                    record['file'] = str(path)
+                    yield record
+        else:
+            with open(path, encoding='utf-8') as handle:
+                for number, paragraph in enumerate(_iter_paragraphs(handle), 1):
+                    source = f"{path}#{number}"
+                    yield {**defaults, 'paragraph': paragraph, 'id': source, 'source': source, 'file': str(path)}
+
+def _iter_paragraphs(lines: Iterable[str]) -> Iterator[str]:
+    """Join lines into paragraphs separated by blank lines"""
+    paragraph: List[str] = []
+    for line in lines:
+        if line.strip():
+            paragraph.append(line.strip())
+        elif paragraph:
+            yield ' '.join(paragraph)
+            paragraph = []
+    if paragraph:
+        yield ' '.join(paragraph)
+
+def _chunks(records: Iterator[Dict[str, Any]], size: int) -> Iterator[List[Dict[str, Any]]]:
+    """Group records into lists of up to size"""
+    chunk: List[Dict[str, Any]] = []
+    for record in records:
+        chunk.append(record)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+class Checkpoint:
+    """Progress of a bulk run: records written, the output size after them and the run's counters
+
+    The checkpoint is replaced atomically after every flushed chunk, so after
+    an interruption the output can be truncated back to the last complete
+    chunk and the run continued from the next record.
+    """
+
+    def __init__(self, path: Path, settings: Dict[str, Any]):
+        self.path = path
+        self.settings = settings
+        self.records_done = 0
+        self.output_bytes = 0
+        self.totals: Dict[str, int] = {}
+
+    def load(self) -> bool:
+        """Read saved progress; returns False when there is none"""
+        if not self.path.exists():
+            return False
+        saved = json.loads(self.path.read_text(encoding='utf-8'))
+        if saved.get('settings') != self.settings:
+            raise ValueError(f"{self.path} was written with different inputs or options")
+        self.records_done = saved['records_done']
+        self.output_bytes = saved['output_bytes']
+        self.totals = saved.get('totals', {})
+        return True
+
+    def save(self) -> None:
+        """Write the progress atomically"""
+        temporary = self.path.with_name(self.path.name + '.tmp')
+        temporary.write_text(json.dumps({
+            'settings': self.settings,
+            'records_done': self.records_done,
+            'output_bytes': self.output_bytes,
+            'totals': self.totals
+        }, ensure_ascii=False), encoding='utf-8')
+        os.replace(temporary, self.path)
+
+    def remove(self) -> None:
+        if self.path.exists():
+            self.path.unlink()
+
+def _iter_output_questions(path: Path) -> Iterator[str]:
+    """The questions already written to a bulk output file, in order"""
+    with open(path, encoding='utf-8') as handle:
+        for line in handle:
+            for qa in json.loads(line).get('qa_pairs', ()):
+                yield qa['question']
+
+def generate_jsonl(inputs: Sequence[str], output: str, options: Dict[str, Any], workers: int = 1,
+                   chunk_size: int = 16, resume: bool = False, max_generic_questions: int = 100,
+                   progress_every: float = 5.0, dedupe: Optional[str] = None, dedupe_index: Optional[str] = None,
+                   dedupe_max_size: int = 1_000_000, dedupe_threshold: float = 0.8,
+                   bank: Optional[str] = None,
+                   progress: Optional[Callable[[int, float], None]] = None) -> Dict[str, Any]:
+    """Generate Q&A for every input record and append one JSON line per record to output
+
+    Records are read lazily and sent to a process pool in chunks; at most
+    ``2 * workers`` chunks are in flight, so memory stays bounded whatever
+    the corpus size.  Output lines are written in input order.  With
+    ``resume``, a run continues after the last chunk recorded in the
+    ``<output>.progress`` checkpoint.  Returns run totals, which also
+    count the records written before a resume.
+
+    With a ``dedupe`` mode, questions repeating one written earlier in the
+    run are dropped.  ``dedupe_index`` names a file holding the questions of
+    earlier runs; it is read at the start and updated when the run completes.
+
+    With ``bank``, results are also stored in that question bank, labelled
+    with their input file, and records it already holds are read from it
+    instead of being generated.
+
+    ``progress`` is called with the records done so far and the records per
+    second at most every ``progress_every`` seconds.
+    """
+    output_path = Path(output)
+    checkpoint = Checkpoint(output_path.with_name(output_path.name + '.progress'), {
+        'inputs': list(inputs),
+        'options': options,
+        'max_generic_questions': max_generic_questions,
+        'dedupe': [dedupe, dedupe_index, dedupe_max_size, dedupe_threshold] if dedupe else None,
+        'bank': bank
+    })
+    index: Optional[QuestionIndex] = None
+    if dedupe:
+        index = (QuestionIndex.load(dedupe_index, dedupe, dedupe_max_size, dedupe_threshold) if dedupe_index
+                 else QuestionIndex(dedupe, dedupe_max_size, dedupe_threshold))
+    if resume and checkpoint.load():
+        if not output_path.exists() or output_path.stat().st_size < checkpoint.output_bytes:
+            raise ValueError(f"{output_path} is missing or shorter than its checkpoint; run without --resume")
+        with open(output_path, 'ab') as handle:
+            handle.truncate(checkpoint.output_bytes)
+        # The index file is only written at the end of a run, so replaying
+        # the questions written so far restores the state at the checkpoint
+        if index is not None:
+            for question in _iter_output_questions(output_path):
+                index.add(question)
+    else:
+        output_path.write_bytes(b'')
+        checkpoint.save()
+
+    records = iter_input_records(inputs, options)
+    for _ in range(checkpoint.records_done):
+        if next(records, None) is None:
+            break
+
+    executor: Optional[Executor] = create_batch_executor(workers, max_generic_questions) if workers > 1 else None
+    # Deduplication and the question bank run here and need a processor
+    processor = (TeluguNLPProcessor(max_generic_questions=max_generic_questions,
+                                    question_bank=QuestionBank(bank) if bank else None)
+                 if executor is None or index is not None or bank else None)
+    # Counters cover the whole run, including the part before a resume
+    totals = {'records': 0, 'failed': 0, 'questions': 0}
+    if index is not None:
+        totals['duplicates_removed'] = 0
+    totals.update(checkpoint.totals)
+    checkpoint.totals = totals
+    resumed_from = checkpoint.records_done
+    started = last_report = time.perf_counter()
+
+    def submit(chunk: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], Any]:
+        # Records that could not be read are reported as they are and never processed
+        valid = [record for record in chunk if 'error' not in record]
+        items = [{key: record[key] for key in ('paragraph',) + ITEM_FIELDS if key in record} for record in valid]
+        if bank:
+            for item, record in zip(items, valid):
+                item['source'] = record.get('file')
+        if executor is None or not items:
+            return chunk, [processor.generate_batch_item(item) for item in items]  # type: ignore[union-attr]
+        if not bank:
+            return chunk, executor.submit(generate_batch_chunk, items)
+        # Records already in the bank are read here; only the rest go to the workers
+        banked = [processor.banked_batch_item(item) for item in items]  # type: ignore[union-attr]
+        missing = [item for item, result in zip(items, banked) if result is None]
+        return chunk, (items, banked, executor.submit(generate_batch_chunk, missing) if missing else None)
+
+    def collect(results: Any) -> List[Dict[str, Any]]:
+        if isinstance(results, Future):
+            return results.result()
+        if isinstance(results, list):
+            return results
+        items, banked, future = results
+        generated = iter(future.result() if future is not None else ())
+        collected = []
+        for item, result in zip(items, banked):
+            if result is None:
+                result = next(generated)
+                processor.bank_batch_result(item, result)  # type: ignore[union-attr]
+            collected.append(result)
+        return collected
+
+    pending: Deque[Tuple[List[Dict[str, Any]], Any]] = deque()
+    try:
+        with open(output_path, 'ab') as handle:
+            chunks = _chunks(records, chunk_size)
+            while True:
+                while len(pending) < max(2 * workers, 1):
+                    chunk = next(chunks, None)
+                    if chunk is None:
+                        break
+                    pending.append(submit(chunk))
+                if not pending:
+                    break
+
+                chunk, results = pending.popleft()
+                generated = iter(collect(results))
+                lines: List[bytes] = []
+                for record in chunk:
+                    if 'error' in record:
+                        result = {'success': False, 'error': record['error']}
+                    else:
+                        result = next(generated)
+                    if index is not None and result['success']:
+                        result = processor.dedupe_result(result, index)  # type: ignore[union-attr]
+                        totals['duplicates_removed'] += result['statistics']['duplicates_removed']
+                    line = {'id': record['id'], 'source': record['source'], **result}
+                    lines.append(json.dumps(line, ensure_ascii=False).encode('utf-8') + b'\n')
+                    totals['records'] += 1
+                    totals['failed'] += not result['success']
+                    totals['questions'] += result.get('total_questions', 0)
+                handle.writelines(lines)
+                handle.flush()
+                os.fsync(handle.fileno())
+                checkpoint.records_done += len(chunk)
+                checkpoint.output_bytes = handle.tell()
+                checkpoint.save()
+
+                now = time.perf_counter()
+                if progress is not None and now - last_report >= progress_every:
+                    last_report = now
+                    progress(checkpoint.records_done, (checkpoint.records_done - resumed_from) / (now - started))
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+    if index is not None and dedupe_index:
+        index.save(dedupe_index)
+    checkpoint.remove()
+    return {**totals, 'resumed_from': resumed_from, 'seconds': time.perf_counter() - started}
@@ -0,0 +1,78 @@
+import hashlib
+import re
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Pattern, Sequence
+
+from keyword_matcher import trie_pattern
+
+# Entity buckets gazetteer files can fill; a file's name up to the first '-' picks its bucket
+GAZETTEER_KINDS = ('persons', 'locations', 'organizations')
+
+# A name starts a token: it follows whitespace or an opening quote or bracket
+_NAME_START = r'(?<![^\s"\'(\[{“‘«])'
+
+class Gazetteer:
+    """A list of names found in text with one prefix-trie regex scan
+
+    Names match at the start of a token and may run straight into an
+    inflectional suffix, so ``హైదరాబాద్`` is found in ``హైదరాబాద్‌లో``.  The
+    longest name wins at each start and matches do not overlap.  The cost of
+    a scan depends on the text length and name depth rather than on the
+    number of names.  Compiling the pattern is the slow part (seconds for
+    100k names), so it is never done per request.  Pickling keeps only the
+    pattern's source: whoever unpickles a gazetteer calls :meth:`compile`,
+    or reuses an already compiled gazetteer of the same version instead.
+    """
+
+    def __init__(self, kind: str, names: Iterable[str], version: str = ''):
+        self.kind = kind
+        self.version = version
+        unique = sorted({name.strip() for name in names} - {''})
+        self.size = len(unique)
+        self._source: Optional[str] = _NAME_START + trie_pattern(unique) if unique else None
+        self._pattern: Optional[Pattern[str]] = None
+        self.compile()
+
+    def __getstate__(self) -> Dict[str, object]:
+        return {**self.__dict__, '_pattern': None}
+
+    def __len__(self) -> int:
+        return self.size
+
+    def compile(self) -> None:
+        """Compile the pattern if it is not compiled yet"""
+        if self._pattern is None and self._source is not None:
+            self._pattern = re.compile(self._source)
+
+    def find(self, text: str) -> List[str]:
+        """Names found in text, in text order"""
+        if self._pattern is None:
+            if self._source is None:
+                return []
+            self.compile()
+        return self._pattern.findall(text)
+
+def gazetteer_files(directory: Path) -> Dict[str, List[Path]]:
+    """The gazetteer files of a directory by kind: persons.txt, locations-ap.txt, ..."""
+    files: Dict[str, List[Path]] = {}
+    if directory.is_dir():
+        for path in sorted(directory.glob('*.txt')):
+            kind = path.stem.split('-', 1)[0]
+            if kind in GAZETTEER_KINDS:
+                files.setdefault(kind, []).append(path)
+    return files
+
+def gazetteer_version(paths: Sequence[Path], contents: Sequence[bytes]) -> str:
+    """Content hash of one kind's gazetteer files"""
+    digest = hashlib.sha256()
+    for path, content in zip(paths, contents):
+        digest.update(path.name.encode('utf-8') + b'\0' + content + b'\0')
+    return digest.hexdigest()
+
+def read_names(contents: Iterable[bytes]) -> Iterable[str]:
+    """Names from gazetteer file contents: one per line, skipping blank lines and # comments"""
+    for content in contents:
+        for line in content.decode('utf-8').splitlines():
+            name = line.strip()
+            if name and not name.startswith('#'):
+                yield name
@@ -0,0 +1,117 @@
+import re
+from typing import Dict, Iterable, List, Optional, Pattern, Tuple
+
+# Above this many keywords that can overlap others, every offset is tried instead
+MAX_OVERLAPPING_KEYWORDS = 16
+
+def trie_pattern(keywords: Iterable[str]) -> str:
+    """A regex matching any of the keywords, preferring the longest at each position"""
+    trie: Dict[str, dict] = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[''] = {}
+    return KeywordMatcher._trie_pattern(trie)
+
+class KeywordMatcher:
+    """Finds which keywords of a fixed lexicon occur in a text in one scan
+
+    The keywords are compiled into a single prefix-trie regex, so the cost of
+    a scan depends on the text length and keyword depth rather than on the
+    number of keywords.  Results follow ``str.__contains__`` semantics: every
+    keyword that occurs anywhere in the text is reported once, including
+    keywords that overlap or nest inside each other.
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords: List[str] = list(keywords)
+
+        # Keyword -> positions in the lexicon (a keyword may be listed twice)
+        self._positions: Dict[str, List[int]] = {}
+        for position, keyword in enumerate(self.keywords):
+            if keyword:
+                self._positions.setdefault(keyword, []).append(position)
+
+        trie: Dict[str, dict] = {}
+        for keyword in self._positions:
+            node = trie
+            for char in keyword:
+                node = node.setdefault(char, {})
+            node[''] = {}
+
+        # Each match is the longest keyword starting at that offset; the
+        # shorter keywords that are its prefixes are resolved from the trie
+        self._prefix_positions: Dict[str, Tuple[int, ...]] = {}
+        for keyword in self._positions:
+            node = trie
+            positions: List[int] = []
+            for size, char in enumerate(keyword, 1):
+                node = node[char]
+                if '' in node:
+                    positions.extend(self._positions[keyword[:size]])
+            self._prefix_positions[keyword] = tuple(positions)
+
+        self._pattern = re.compile('(?=(' + self._trie_pattern(trie) + '))') if trie else None
+
+        # A plain left-to-right scan that skips over each match misses only
+        # keywords nested inside the matched ones, which are known in advance,
+        # and keywords that start inside a match and run past its end.  The
+        # latter are few in practice and are checked with a substring test,
+        # so most of the work is one findall in C.
+        self._scan_pattern: Optional[Pattern[str]] = None
+        self._contained_positions: Dict[str, Tuple[int, ...]] = {}
+        self._overlapping: List[str] = []
+        if self._pattern is not None:
+            overlapping = self._overlapping_keywords()
+            if len(overlapping) <= MAX_OVERLAPPING_KEYWORDS:
+                self._overlapping = overlapping
+                self._scan_pattern = re.compile(self._trie_pattern(trie))
+                for keyword in self._positions:
+                    self._contained_positions[keyword] = tuple(self._find_overlapping(keyword))
+
+    def _overlapping_keywords(self) -> List[str]:
+        """Keywords whose proper prefix is a proper suffix of some keyword"""
+        suffixes = {keyword[start:] for keyword in self._positions for start in range(1, len(keyword))}
+        return [keyword for keyword in self._positions
+                if any(keyword[:size] in suffixes for size in range(1, len(keyword)))]
+
+    @classmethod
+    def _trie_pattern(cls, node: Dict[str, dict]) -> str:
+        """Render a trie node as a regex that prefers the longest keyword"""
+        branches = [re.escape(char) + cls._trie_pattern(child)
+                    for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        if len(branches) == 1 and '' not in node:
+            return branches[0]
+        pattern = '(?:' + '|'.join(branches) + ')'
+        return pattern + '?' if '' in node else pattern
+
+    def find(self, text: str) -> List[int]:
+        """Return the lexicon positions of all keywords found in text, in lexicon order"""
+        if self._scan_pattern is not None:
+            matches = self._scan_pattern.findall(text)
+            if self._overlapping:
+                matches.extend(keyword for keyword in self._overlapping if keyword in text)
+            if not matches:
+                return []
+            if len(matches) == 1:
+                return list(self._contained_positions[matches[0]])
+            positions: set[int] = set()
+            for keyword in set(matches):
+                positions.update(self._contained_positions[keyword])
+            return sorted(positions)
+        return self._find_overlapping(text)
+
+    def _find_overlapping(self, text: str) -> List[int]:
+        """find() by trying every offset of the text"""
+        if self._pattern is None:
+            return []
+        found: set[str] = set()
+        for match in self._pattern.finditer(text):
+            found.add(match.group(1))
+        positions: set[int] = set()
+        for keyword in found:
+            positions.update(self._prefix_positions[keyword])
+        return sorted(positions)
@@ -0,0 +1,233 @@
+import copy
+import hashlib
+import json
+import logging
+import os
+import pickle
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from gazetteer import Gazetteer, gazetteer_files, gazetteer_version, read_names
+
+# Bump when the artifact layout or the classes pickled into it change
+ARTIFACT_VERSION = 5
+
+DATA_DIR = Path(__file__).resolve().parent / 'data'
+
+# Lexicon data file, gazetteer directory and the precompiled artifact built
+# from them by `python run.py build-lexicons`
+LEXICON_PATH = Path(os.environ.get('QA_LEXICON_PATH', DATA_DIR / 'lexicons.json'))
+GAZETTEER_DIR = Path(os.environ.get('QA_GAZETTEER_DIR', DATA_DIR / 'gazetteers'))
+ARTIFACT_PATH = Path(os.environ.get('QA_LEXICON_ARTIFACT', DATA_DIR / 'lexicons.pickle'))
+
+logger = logging.getLogger(__name__)
+
+class LexiconArtifact:
+    """Lexicon data together with the matchers and lookup tables compiled from it
+
+    ``compiled`` maps 'processor' and 'analyzer' to the attributes that
+    TeluguNLPProcessor and QuestionLevelAnalyzer would otherwise build in
+    ``__init__``, including the processor's gazetteers.  They are never
+    modified after compilation, so every instance in a process shares them.
+    """
+
+    def __init__(self, key: Dict[str, Any], lexicons: Dict[str, Any], compiled: Dict[str, Dict[str, Any]]):
+        self.key = key
+        self.lexicons = lexicons
+        self.compiled = compiled
+
+    @property
+    def version(self) -> str:
+        """Short hash identifying the lexicons, format and Python version the artifact was built from"""
+        return key_version(self.key)
+
+    @property
+    def gazetteers(self) -> Dict[str, Gazetteer]:
+        return self.compiled['processor']['gazetteers']
+
+    def section(self, name: str) -> Dict[str, Any]:
+        """A private copy of one section of the lexicon data"""
+        return copy.deepcopy(self.lexicons[name])
+
+_artifacts: Dict[Path, LexiconArtifact] = {}
+_artifacts_lock = threading.Lock()
+
+def read_lexicons(path: Optional[Path] = None) -> Dict[str, Any]:
+    """Read the lexicon data file"""
+    return json.loads(Path(path or LEXICON_PATH).read_text(encoding='utf-8'))
+
+def artifact_key(source: bytes, gazetteer_versions: Dict[str, str]) -> Dict[str, Any]:
+    """What an artifact must have been built from to be used: format, file hashes and Python version"""
+    return {
+        'format': ARTIFACT_VERSION,
+        'source_sha256': hashlib.sha256(source).hexdigest(),
+        'gazetteers': gazetteer_versions,
+        'python': list(sys.version_info[:2])
+    }
+
+def key_version(key: Dict[str, Any]) -> str:
+    """Short hash of an artifact key"""
+    return hashlib.sha256(json.dumps(key, sort_keys=True).encode('utf-8')).hexdigest()[:16]
+
+def lexicons_version(lexicons: Dict[str, Any], gazetteers: Optional[Dict[str, Gazetteer]] = None) -> str:
+    """Version of lexicon data and gazetteers passed in directly rather than read from the files"""
+    source = json.dumps(lexicons, sort_keys=True, ensure_ascii=False).encode('utf-8')
+    return key_version(artifact_key(source, {kind: gazetteer.version for kind, gazetteer in (gazetteers or {}).items()}))
+
+def _read_sources(path: Path, gazetteer_dir: Path) -> Tuple[bytes, Dict[str, Tuple[str, List[bytes]]]]:
+    """The lexicon file, and each gazetteer kind's version and file contents"""
+    gazetteers: Dict[str, Tuple[str, List[bytes]]] = {}
+    for kind, files in gazetteer_files(gazetteer_dir).items():
+        contents = [file.read_bytes() for file in files]
+        gazetteers[kind] = (gazetteer_version(files, contents), contents)
+    return path.read_bytes(), gazetteers
+
+def compile_lexicons(key: Dict[str, Any], lexicons: Dict[str, Any],
+                     gazetteers: Optional[Dict[str, Gazetteer]] = None) -> LexiconArtifact:
+    """Build the compiled processor and analyzer state for lexicon data and gazetteers"""
+    from telugu_nlp_processor import TeluguNLPProcessor
+    processor = TeluguNLPProcessor(sentence_cache_size=0, lexicons=lexicons, gazetteers=gazetteers)
+    return LexiconArtifact(key, lexicons, {
+        'processor': processor.compiled_state(),
+        'analyzer': processor.level_analyzer.compiled_state()
+    })
+
+def _compile_sources(source: bytes, gazetteer_sources: Dict[str, Tuple[str, List[bytes]]],
+                     previous: Optional[LexiconArtifact] = None) -> LexiconArtifact:
+    """Compile lexicons and gazetteers, reusing the previous artifact's unchanged gazetteers"""
+    reusable = previous.gazetteers if previous is not None else {}
+    gazetteers: Dict[str, Gazetteer] = {}
+    for kind, (version, contents) in gazetteer_sources.items():
+        gazetteer = reusable.get(kind)
+        if gazetteer is None or gazetteer.version != version:
+            gazetteer = Gazetteer(kind, read_names(contents), version)
+        gazetteers[kind] = gazetteer
+    key = artifact_key(source, {kind: version for kind, (version, _) in gazetteer_sources.items()})
+    return compile_lexicons(key, json.loads(source), gazetteers)
+
+def build_artifact(path: Optional[Path] = None, output: Optional[Path] = None,
+                   gazetteer_dir: Optional[Path] = None) -> LexiconArtifact:
+    """Compile the lexicon data file and gazetteers and write the artifact, replacing any previous one atomically
+
+    The file holds two pickles, the key and then the artifact, so a stale
+    artifact is recognised without unpickling (and recompiling) its matchers.
+    """
+    source, gazetteer_sources = _read_sources(Path(path or LEXICON_PATH), Path(gazetteer_dir or GAZETTEER_DIR))
+    artifact = _compile_sources(source, gazetteer_sources)
+    output = Path(output or ARTIFACT_PATH)
+    temporary = output.with_name(output.name + '.tmp')
+    with open(temporary, 'wb') as handle:
+        pickle.dump(artifact.key, handle, protocol=pickle.HIGHEST_PROTOCOL)
+        pickle.dump(artifact, handle, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(temporary, output)
+    return artifact
+
+def load_artifact(path: Optional[Path] = None) -> LexiconArtifact:
+    """The compiled lexicons for a data file, loaded once per process on first use
+
+    The prebuilt artifact is used when it was built from the same lexicon
+    and gazetteer files by the same artifact format and Python version;
+    otherwise the lexicons are compiled in memory.
+    """
+    path = Path(path or LEXICON_PATH)
+    artifact = _artifacts.get(path)
+    if artifact is not None:
+        return artifact
+    with _artifacts_lock:
+        artifact = _artifacts.get(path)
+        if artifact is None:
+            artifact = _artifacts[path] = _load_or_compile(path)
+        return artifact
+
+def reload_artifact(path: Optional[Path] = None) -> LexiconArtifact:
+    """Re-read the lexicon files and replace the loaded artifact if they changed
+
+    Gazetteers whose files are unchanged are carried over without being
+    recompiled.  Processors created afterwards use the new artifact;
+    existing ones keep the artifact they were created with.
+    """
+    path = Path(path or LEXICON_PATH)
+    with _artifacts_lock:
+        artifact = _artifacts[path] = _load_or_compile(path, _artifacts.get(path))
+        return artifact
+
+def _compile_gazetteers(artifact: LexiconArtifact, previous: Optional[LexiconArtifact] = None) -> None:
+    """Compile a loaded artifact's gazetteers, taking unchanged ones from the previous artifact instead"""
+    reusable = previous.gazetteers if previous is not None else {}
+    for kind, gazetteer in artifact.gazetteers.items():
+        compiled = reusable.get(kind)
+        if compiled is not None and compiled.version == gazetteer.version:
+            artifact.gazetteers[kind] = compiled
+        else:
+            gazetteer.compile()
+
+def _load_or_compile(path: Path, previous: Optional[LexiconArtifact] = None) -> LexiconArtifact:
+    source, gazetteer_sources = _read_sources(path, GAZETTEER_DIR)
+    key = artifact_key(source, {kind: version for kind, (version, _) in gazetteer_sources.items()})
+    if previous is not None and previous.key == key:
+        return previous
+    try:
+        with open(ARTIFACT_PATH, 'rb') as handle:
+            if pickle.load(handle) == key:
+                artifact = pickle.load(handle)
+                if isinstance(artifact, LexiconArtifact):
+                    _compile_gazetteers(artifact, previous)
+                    return artifact
+            if previous is None:
+                logger.info("Lexicon artifact %s is out of date; run `python run.py build-lexicons`", ARTIFACT_PATH)
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.warning("Could not load lexicon artifact %s: %s", ARTIFACT_PATH, e)
+    return _compile_sources(source, gazetteer_sources, previous)
+
+class LexiconWatcher:
+    """Notices changes to the lexicon and gazetteer files, looking at most once per interval
+
+    Only file sizes and modification times are compared, so a check costs a
+    few ``stat`` calls.  With ``watch_artifact`` only the compiled artifact is
+    watched, so edits take effect once ``build-lexicons`` has rebuilt it;
+    reloading then compiles only the gazetteers that changed.
+    """
+
+    def __init__(self, interval: float, path: Optional[Path] = None, gazetteer_dir: Optional[Path] = None,
+                 watch_artifact: bool = False):
+        self.interval = interval
+        self.path = Path(path or LEXICON_PATH)
+        self.gazetteer_dir = Path(gazetteer_dir or GAZETTEER_DIR)
+        self.watch_artifact = watch_artifact
+        self._lock = threading.Lock()
+        self._signature = self._stat()
+        self._next_check = time.monotonic() + interval
+
+    def _stat(self) -> Tuple[Tuple[str, int, int], ...]:
+        if self.watch_artifact:
+            files = [ARTIFACT_PATH]
+        else:
+            files = [self.path] + [file for files in gazetteer_files(self.gazetteer_dir).values() for file in files]
+        signature = []
+        for file in files:
+            try:
+                stat = file.stat()
+            except OSError:
+                continue
+            signature.append((str(file), stat.st_mtime_ns, stat.st_size))
+        return tuple(signature)
+
+    def changed(self) -> bool:
+        """True once after the files change; other callers within the interval get False without a check"""
+        now = time.monotonic()
+        if now < self._next_check or not self._lock.acquire(blocking=False):
+            return False
+        try:
+            self._next_check = now + self.interval
+            signature = self._stat()
+            if signature == self._signature:
+                return False
+            self._signature = signature
+            return True
+        finally:
+            self._lock.release()
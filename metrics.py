@@ -0,0 +1,139 @@
+import threading
+import time
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+T = TypeVar('T')
+
+# Bucket upper bounds for stage latencies (seconds) and per-request sizes
+LATENCY_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+BYTE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+class RequestMetrics:
+    """Stage timings and counts collected while serving one request
+
+    Code on the hot path only touches this object when one was passed in, so
+    requests without metrics pay a single ``is not None`` check per stage.
+    """
+
+    def __init__(self) -> None:
+        self.started = time.perf_counter()
+        self.stages: Dict[str, float] = {}
+        self.counts: Dict[str, int] = {}
+
+    def add_time(self, stage: str, start: float) -> None:
+        """Add the time elapsed since start (from time.perf_counter) to a stage"""
+        self.stages[stage] = self.stages.get(stage, 0.0) + time.perf_counter() - start
+
+    def count(self, name: str, amount: int = 1) -> None:
+        """Increase a per-request count"""
+        self.counts[name] = self.counts.get(name, 0) + amount
+
+    def timed(self, stage: str, items: Iterable[T]) -> Iterator[T]:
+        """Iterate over items, charging the time spent producing each one to a stage"""
+        iterator = iter(items)
+        while True:
+            start = time.perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                self.add_time(stage, start)
+                return
+            self.add_time(stage, start)
+            yield item
+
+    def elapsed(self) -> float:
+        """Seconds since the request started"""
+        return time.perf_counter() - self.started
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Timings in milliseconds plus counts, for the debug response block"""
+        return {
+            'total_ms': round(self.elapsed() * 1000, 3),
+            'stages_ms': {stage: round(seconds * 1000, 3) for stage, seconds in self.stages.items()},
+            'counts': dict(self.counts)
+        }
+
+class Histogram:
+    """Cumulative-bucket histogram in the Prometheus style"""
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        self.bucket_counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        for index, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.bucket_counts[index] += 1
+                break
+        self.count += 1
+        self.sum += value
+
+class MetricsRegistry:
+    """Process-wide request metrics rendered in the Prometheus text format
+
+    Each server worker process keeps its own registry.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._requests: Dict[Tuple[str, int], int] = {}
+        # (metric name, label value) -> histogram
+        self._histograms: Dict[Tuple[str, str], Histogram] = {}
+        self._descriptions: Dict[str, Tuple[str, Tuple[float, ...], str]] = {
+            'qa_request_seconds': ('End-to-end request latency', LATENCY_BUCKETS, 'endpoint'),
+            'qa_stage_seconds': ('Time spent per pipeline stage in a request', LATENCY_BUCKETS, 'stage'),
+            'qa_request_count': ('Per-request pipeline counts (sentences, questions, synthetic questions)',
+                                 COUNT_BUCKETS, 'name'),
+            'qa_response_bytes': ('Response payload size', BYTE_BUCKETS, 'endpoint')
+        }
+
+    def observe(self, metric: str, label: str, value: float) -> None:
+        """Record one observation of a histogram metric"""
+        with self._lock:
+            histogram = self._histograms.get((metric, label))
+            if histogram is None:
+                histogram = self._histograms[(metric, label)] = Histogram(self._descriptions[metric][1])
+            histogram.observe(value)
+
+    def record_request(self, endpoint: str, status: int, metrics: Optional[RequestMetrics] = None,
+                       response_bytes: Optional[int] = None) -> None:
+        """Record a finished request and, when collected, its stage metrics"""
+        with self._lock:
+            self._requests[(endpoint, status)] = self._requests.get((endpoint, status), 0) + 1
+        if metrics is not None:
+            self.observe('qa_request_seconds', endpoint, metrics.elapsed())
+            for stage, seconds in metrics.stages.items():
+                self.observe('qa_stage_seconds', stage, seconds)
+            for name, amount in metrics.counts.items():
+                self.observe('qa_request_count', name, amount)
+        if response_bytes is not None:
+            self.observe('qa_response_bytes', endpoint, response_bytes)
+
+    def render(self) -> str:
+        """Render every metric in the Prometheus text exposition format"""
+        lines: List[str] = [
+            '# HELP qa_requests_total Requests served',
+            '# TYPE qa_requests_total counter'
+        ]
+        with self._lock:
+            for (endpoint, status), total in sorted(self._requests.items()):
+                lines.append(f'qa_requests_total{{endpoint="{endpoint}",status="{status}"}} {total}')
+
+            for metric, (description, _, label_name) in self._descriptions.items():
+                lines.append(f'# HELP {metric} {description}')
+                lines.append(f'# TYPE {metric} histogram')
+                for (name, label), histogram in sorted(self._histograms.items()):
+                    if name != metric:
+                        continue
+                    labels = f'{label_name}="{label}"'
+                    cumulative = 0
+                    for bound, bucket_count in zip(histogram.buckets, histogram.bucket_counts):
+                        cumulative += bucket_count
+                        lines.append(f'{metric}_bucket{{{labels},le="{bound}"}} {cumulative}')
+                    lines.append(f'{metric}_bucket{{{labels},le="+Inf"}} {histogram.count}')
+                    lines.append(f'{metric}_sum{{{labels}}} {histogram.sum}')
+                    lines.append(f'{metric}_count{{{labels}}} {histogram.count}')
+        return '\n'.join(lines) + '\n'
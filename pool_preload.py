@@ -0,0 +1,8 @@
+"""Imported once by the batch pool's fork server, so every worker it forks
+starts with the lexicon artifact loaded and its gazetteers compiled.  Under
+``python app.py`` it also stands in for the main module in pool processes"""
+from lexicons import load_artifact
+from question_level_analyzer import load_numpy
+
+load_artifact()
+load_numpy()
@@ -0,0 +1,268 @@
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Generic, Hashable, Iterable, List, Optional, Tuple, TypeVar
+
+V = TypeVar('V')
+
+class LRUCache(Generic[V]):
+    """Thread-safe, size-bounded least recently used cache with hit/miss counters
+
+    Values are handed out as stored, so callers must treat them as read-only.
+    """
+
+    def __init__(self, max_entries: int = 4096):
+        self.max_entries = max_entries
+        self._entries: 'OrderedDict[Hashable, V]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Optional[V]:
+        """Return the cached value for key, or None"""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: V) -> None:
+        """Store value under key, evicting the least recently used entries"""
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop every cached entry"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cache hit/miss counters and occupancy"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 3) if lookups else 0,
+                'evictions': self.evictions,
+                'entries': len(self._entries)
+            }
+
+class ProcessConnection:
+    """A SQLite connection opened per process, for stores created before a server forks its workers
+
+    SQLite connections must not be carried across ``fork()``, not even to
+    close them, so nothing is opened until first use: a server that creates
+    the store before forking leaves each worker to open its own.  A
+    connection inherited anyway is kept open but unused.  Connections use
+    WAL, so readers do not block the writer, and wait up to ``timeout``
+    seconds for a lock held by another process.
+    """
+
+    def __init__(self, path: str, schema: Iterable[str] = (), timeout: float = 30):
+        self.path = path
+        self.schema = tuple(schema)
+        self.timeout = timeout
+        self._db: Optional[sqlite3.Connection] = None
+        self._pid = 0
+        self._inherited: List[sqlite3.Connection] = []
+
+    def get(self) -> sqlite3.Connection:
+        """The connection of the current process, opened on first use"""
+        if self._db is None or self._pid != os.getpid():
+            if self._db is not None:
+                self._inherited.append(self._db)
+            self._db = sqlite3.connect(self.path, timeout=self.timeout, check_same_thread=False)
+            self._db.execute('PRAGMA journal_mode=WAL')
+            self._db.execute('PRAGMA synchronous=NORMAL')
+            with self._db:
+                for statement in self.schema:
+                    self._db.execute(statement)
+            self._pid = os.getpid()
+        return self._db
+
+# Disk layer of QAResultCache
+CACHE_SCHEMA = (
+    'CREATE TABLE IF NOT EXISTS qa_cache ('
+    'key TEXT PRIMARY KEY, num_questions INTEGER, total INTEGER, payload TEXT, '
+    'expires_at REAL, accessed_at REAL)',
+    'CREATE INDEX IF NOT EXISTS qa_cache_accessed ON qa_cache (accessed_at)'
+)
+
+class QAResultCache:
+    """Content-addressed cache of generated Q&A pairs with LRU and TTL eviction
+
+    Entries are keyed by a hash of the paragraph, difficulty, lexicon version
+    and generic question limit and hold the pairs generated for the largest
+    ``num_questions`` seen so far.  Because generation yields pairs in a
+    fixed order, a request for fewer questions
+    is served by slicing a larger cached result.  Pairs are stored as JSON so
+    every hit returns fresh objects and memory is bounded in bytes.
+
+    When ``path`` is given, entries are also written to a SQLite database so
+    the cache survives restarts.  Disk errors are logged and treated as
+    misses rather than failing the request.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl: float = 3600, max_bytes: int = 64 * 1024 * 1024,
+                 path: Optional[str] = None, max_disk_entries: int = 100000):
+        self.logger = logging.getLogger(__name__)
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.max_disk_entries = max_disk_entries
+
+        # key -> (expires_at, num_questions, pair count, payload)
+        self._entries: 'OrderedDict[str, Tuple[float, int, int, str]]' = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._db = ProcessConnection(path, CACHE_SCHEMA) if path else None
+
+    @staticmethod
+    def make_key(paragraph: str, difficulty: str, version: str = '', max_generic_questions: int = 100) -> str:
+        """Hash the normalized paragraph, difficulty, lexicon version and generic question limit into a cache key"""
+        # Sentences are stripped during generation, so only the outer
+        # whitespace of the paragraph can be dropped without changing output
+        content = f"{version}\0{max_generic_questions}\0{difficulty}\0{paragraph.strip()}".encode('utf-8')
+        return hashlib.sha256(content).hexdigest()
+
+    def get(self, key: str, num_questions: int) -> Optional[List[Dict[str, Any]]]:
+        """Return the first num_questions cached pairs, or None if they are not cached"""
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= now:
+                self._remove(key)
+                entry = None
+            if entry is None:
+                entry = self._load(key, now)
+            if entry is None or not self._covers(entry, num_questions):
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            payload = entry[3]
+
+        return json.loads(payload)[:num_questions]
+
+    def put(self, key: str, num_questions: int, qa_pairs: List[Dict[str, Any]]) -> None:
+        """Store the pairs generated for num_questions under key"""
+        if self.max_entries <= 0:
+            return
+        now = time.time()
+        payload = json.dumps(qa_pairs, ensure_ascii=False)
+        entry = (now + self.ttl, num_questions, len(qa_pairs), payload)
+        with self._lock:
+            current = self._entries.get(key)
+            if current is not None and current[0] > now and self._covers(current, num_questions):
+                return
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = entry
+            self._size += len(payload)
+            while self._entries and (len(self._entries) > self.max_entries or self._size > self.max_bytes):
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+            self._store(key, entry)
+
+    def clear(self) -> None:
+        """Drop every cached entry, including those on disk"""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+            if self._db is not None:
+                db = self._db.get()
+                db.execute('DELETE FROM qa_cache')
+                db.commit()
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cache hit/miss counters and occupancy"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 3) if lookups else 0,
+                'evictions': self.evictions,
+                'entries': len(self._entries),
+                'bytes': self._size,
+                'persistent': self._db is not None
+            }
+
+    @staticmethod
+    def _covers(entry: Tuple[float, int, int, str], num_questions: int) -> bool:
+        """Check whether an entry can answer a request for num_questions pairs"""
+        _, cached_questions, total, _ = entry
+        # A result shorter than requested means generation ran out of
+        # material, so asking for more would return the same pairs
+        return num_questions <= cached_questions or total < cached_questions
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        self._size -= len(entry[3])
+
+    def _load(self, key: str, now: float) -> Optional[Tuple[float, int, int, str]]:
+        """Promote an unexpired entry from disk into memory"""
+        if self._db is None:
+            return None
+        try:
+            db = self._db.get()
+            row = db.execute(
+                'SELECT expires_at, num_questions, total, payload FROM qa_cache WHERE key = ? AND expires_at > ?',
+                (key, now)
+            ).fetchone()
+            if row is None:
+                return None
+            db.execute('UPDATE qa_cache SET accessed_at = ? WHERE key = ?', (now, key))
+            db.commit()
+        except sqlite3.Error as e:
+            self.logger.error(f"Error reading Q&A cache: {str(e)}")
+            return None
+        entry = (row[0], row[1], row[2], row[3])
+        self._entries[key] = entry
+        self._size += len(entry[3])
+        while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+        return self._entries.get(key)
+
+    def _store(self, key: str, entry: Tuple[float, int, int, str]) -> None:
+        """Write an entry through to disk, pruning expired and least recently used rows"""
+        if self._db is None:
+            return
+        try:
+            now = time.time()
+            db = self._db.get()
+            db.execute(
+                'INSERT OR REPLACE INTO qa_cache (key, num_questions, total, payload, expires_at, accessed_at) '
+                'VALUES (?, ?, ?, ?, ?, ?)',
+                (key, entry[1], entry[2], entry[3], entry[0], now)
+            )
+            db.execute('DELETE FROM qa_cache WHERE expires_at <= ?', (now,))
+            db.execute(
+                'DELETE FROM qa_cache WHERE key IN ('
+                'SELECT key FROM qa_cache ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)',
+                (self.max_disk_entries,)
+            )
+            db.commit()
+        except sqlite3.Error as e:
+            self.logger.error(f"Error writing Q&A cache: {str(e)}")
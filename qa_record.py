@@ -0,0 +1,172 @@
+import marshal
+import sys
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# Difficulty levels in score order; ties go to the first
+LEVELS = ('basic', 'intermediate', 'advanced')
+
+class LevelInfo:
+    """Difficulty analysis of one question
+
+    Instances are never modified after creation, so several records can
+    share one.
+    """
+
+    __slots__ = ('level', 'confidence', 'scores', 'question_length', 'answer_length', 'complex_indicators')
+
+    def __init__(self, level: str, confidence: float, scores: Tuple[int, ...], question_length: int,
+                 answer_length: int, complex_indicators: Tuple[str, ...]):
+        self.level = sys.intern(level)
+        self.confidence = confidence
+        self.scores = scores
+        self.question_length = question_length
+        self.answer_length = answer_length
+        self.complex_indicators = complex_indicators
+
+    def to_dict(self) -> Dict[str, Any]:
+        """The level analysis in the shape returned by QuestionLevelAnalyzer.analyze_question_level"""
+        return {
+            'level': self.level,
+            'confidence': self.confidence,
+            'scores': dict(zip(LEVELS, self.scores)),
+            'factors': {
+                'question_length': self.question_length,
+                'answer_length': self.answer_length,
+                'complex_indicators': list(self.complex_indicators)
+            }
+        }
+
+class QARecord:
+    """Compact Q&A pair used inside the pipeline
+
+    The context sentence is stored once per result in a QARecordSet and
+    referenced by index.  Records are turned into the JSON dict shape only
+    when a result leaves the processor.
+    """
+
+    __slots__ = ('question', 'answer', 'type', 'context', 'level_info', 'synthetic')
+
+    def __init__(self, question: str, answer: str, type: str, context: int, level_info: LevelInfo,
+                 synthetic: bool = False):
+        self.question = question
+        self.answer = answer
+        self.type = sys.intern(type)
+        self.context = context
+        self.level_info = level_info
+        self.synthetic = synthetic
+
+    @property
+    def level(self) -> str:
+        return self.level_info.level
+
+    def with_context(self, context: int) -> 'QARecord':
+        """A copy of this record pointing at another context index"""
+        return QARecord(self.question, self.answer, self.type, context, self.level_info, self.synthetic)
+
+    def to_dict(self, contexts: List[str]) -> Dict[str, Any]:
+        """The pair in the API JSON shape, resolving its context from the context table"""
+        info = self.level_info
+        basic, intermediate, advanced = info.scores
+        qa: Dict[str, Any] = {
+            'question': self.question,
+            'answer': self.answer,
+            'type': self.type,
+            'context': contexts[self.context]
+        }
+        if self.synthetic:
+            qa['synthetic'] = True
+        qa['level'] = info.level
+        qa['confidence'] = info.confidence
+        qa['scores'] = {'basic': basic, 'intermediate': intermediate, 'advanced': advanced}
+        qa['factors'] = {
+            'question_length': info.question_length,
+            'answer_length': info.answer_length,
+            'complex_indicators': list(info.complex_indicators)
+        }
+        return qa
+
+class QARecordSet:
+    """The records of one result together with the context sentences they reference"""
+
+    __slots__ = ('records', 'contexts', '_context_index')
+
+    def __init__(self, records: Optional[Iterable[QARecord]] = None):
+        self.records: List[QARecord] = list(records) if records is not None else []
+        self.contexts: List[str] = []
+        self._context_index: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def context_index(self, sentence: str) -> int:
+        """Index of a sentence in the context table, adding it when new"""
+        index = self._context_index.get(sentence)
+        if index is None:
+            index = self._context_index[sentence] = len(self.contexts)
+            self.contexts.append(sentence)
+        return index
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """All records in the API JSON shape"""
+        return [record.to_dict(self.contexts) for record in self.records]
+
+def pack_sentence_records(analyzed: Iterable[Tuple[QARecord, ...]]) -> bytes:
+    """Serialize the analyzed records of several sentences for another process of the same Python
+
+    Records become tuples of built-in values written with marshal, which
+    is several times cheaper to write and read than pickling the objects.
+    """
+    return marshal.dumps([
+        [(record.question, record.answer, record.type, record.synthetic, record.level_info.level,
+          record.level_info.confidence, record.level_info.scores, record.level_info.question_length,
+          record.level_info.answer_length, record.level_info.complex_indicators) for record in records]
+        for records in analyzed
+    ])
+
+def unpack_sentence_records(data: bytes) -> List[Tuple[QARecord, ...]]:
+    """The records written by :func:`pack_sentence_records`, with context index 0"""
+    return [
+        tuple(QARecord(question, answer, type, 0,
+                       LevelInfo(level, confidence, scores, question_length, answer_length, complex_indicators),
+                       synthetic)
+              for question, answer, type, synthetic, level, confidence, scores, question_length, answer_length,
+              complex_indicators in records)
+        for records in marshal.loads(data)
+    ]
+
+# Parts of a pair that compact responses leave out unless asked for
+OPTIONAL_FIELDS = ('scores', 'factors')
+
+class CompactPairEncoder:
+    """Turns Q&A pairs into the compact API shape, one at a time
+
+    Each context sentence goes into a sentence table once, however many
+    pairs share it, and pairs reference it by index in ``sentence``.  Of
+    :data:`OPTIONAL_FIELDS`, only those in ``include`` are kept.
+    """
+
+    __slots__ = ('sentences', '_sentence_index', '_dropped')
+
+    def __init__(self, include: Iterable[str] = ()):
+        self.sentences: List[str] = []
+        self._sentence_index: Dict[str, int] = {}
+        self._dropped = frozenset({'context', *OPTIONAL_FIELDS} - set(include))
+
+    def encode(self, qa: Dict[str, Any]) -> Tuple[Dict[str, Any], bool]:
+        """The compact pair, and whether its sentence was just added to the table"""
+        context = qa.get('context', '')
+        index = self._sentence_index.get(context)
+        added = index is None
+        if added:
+            index = self._sentence_index[context] = len(self.sentences)
+            self.sentences.append(context)
+        pair = {key: value for key, value in qa.items() if key not in self._dropped}
+        pair['sentence'] = index
+        return pair, added
+
+def compact_qa_pairs(qa_pairs: Iterable[Dict[str, Any]],
+                     include: Iterable[str] = ()) -> Tuple[List[str], List[Dict[str, Any]]]:
+    """The sentence table and compact pairs of a whole result"""
+    encoder = CompactPairEncoder(include)
+    pairs = [encoder.encode(qa)[0] for qa in qa_pairs]
+    return encoder.sentences, pairs
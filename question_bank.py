@@ -0,0 +1,307 @@
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from qa_cache import ProcessConnection
+from qa_record import LEVELS
+
+# Most questions or sources returned by one page of a query
+MAX_PAGE_SIZE = 500
+
+SCHEMA = (
+    # One row per generated result: a paragraph with its difficulty,
+    # selection and lexicon version (together the result cache key)
+    'CREATE TABLE IF NOT EXISTS sources ('
+    'id INTEGER PRIMARY KEY, paragraph_key TEXT NOT NULL, selection TEXT NOT NULL, '
+    'paragraph_hash TEXT NOT NULL, source TEXT, paragraph TEXT NOT NULL, difficulty TEXT NOT NULL, '
+    'lexicon_version TEXT NOT NULL, num_questions INTEGER NOT NULL, total INTEGER NOT NULL, '
+    'created_at REAL NOT NULL, UNIQUE (paragraph_key, selection))',
+    'CREATE INDEX IF NOT EXISTS sources_source ON sources (source, id)',
+    'CREATE INDEX IF NOT EXISTS sources_paragraph_hash ON sources (paragraph_hash)',
+    # Questions in result order; the context sentence is kept as its
+    # offsets in the paragraph, details hold the scores and factors
+    'CREATE TABLE IF NOT EXISTS questions ('
+    'id INTEGER PRIMARY KEY, source_id INTEGER NOT NULL, position INTEGER NOT NULL, '
+    'sentence_start INTEGER, sentence_end INTEGER, question TEXT NOT NULL, answer TEXT NOT NULL, '
+    'type TEXT NOT NULL, level TEXT NOT NULL, confidence REAL NOT NULL, synthetic INTEGER NOT NULL, '
+    'details TEXT NOT NULL)',
+    'CREATE INDEX IF NOT EXISTS questions_source ON questions (source_id, position)',
+    'CREATE INDEX IF NOT EXISTS questions_level ON questions (level, id)',
+    'CREATE INDEX IF NOT EXISTS questions_type ON questions (type, id)',
+    'CREATE INDEX IF NOT EXISTS questions_confidence ON questions (confidence)',
+    # Running totals per level and type, kept by triggers so statistics
+    # over the whole bank never scan the questions
+    'CREATE TABLE IF NOT EXISTS question_totals ('
+    'level TEXT NOT NULL, type TEXT NOT NULL, count INTEGER NOT NULL, confidence_sum REAL NOT NULL, '
+    'synthetic INTEGER NOT NULL, PRIMARY KEY (level, type)) WITHOUT ROWID',
+    'CREATE TRIGGER IF NOT EXISTS questions_added AFTER INSERT ON questions BEGIN '
+    'INSERT INTO question_totals (level, type, count, confidence_sum, synthetic) '
+    'VALUES (NEW.level, NEW.type, 1, NEW.confidence, NEW.synthetic) '
+    'ON CONFLICT (level, type) DO UPDATE SET count = count + 1, '
+    'confidence_sum = confidence_sum + excluded.confidence_sum, synthetic = synthetic + excluded.synthetic; '
+    'END',
+    'CREATE TRIGGER IF NOT EXISTS questions_removed AFTER DELETE ON questions BEGIN '
+    'UPDATE question_totals SET count = count - 1, confidence_sum = confidence_sum - OLD.confidence, '
+    'synthetic = synthetic - OLD.synthetic WHERE level = OLD.level AND type = OLD.type; '
+    'END'
+)
+
+def paragraph_hash(paragraph: str) -> str:
+    """Hash identifying a paragraph whatever it was generated with"""
+    return hashlib.sha256(paragraph.strip().encode('utf-8')).hexdigest()
+
+class QuestionBank:
+    """Generated Q&A pairs kept in SQLite for later queries and reuse
+
+    Each stored result is keyed like the result cache (paragraph,
+    difficulty and lexicon version) plus the selection strategy, so asking
+    again for a stored paragraph is served by index reads instead of the
+    NLP pipeline.  Questions can be paged through by level, type,
+    confidence range and source, and level statistics come from totals the
+    database keeps up to date.  One connection is opened per process, so a
+    bank can be created before a server forks its workers.
+    """
+
+    def __init__(self, path: str):
+        self.logger = logging.getLogger(__name__)
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = ProcessConnection(path, SCHEMA)
+        self.hits = 0
+        self.misses = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        """The connection of the current process, opened on first use"""
+        return self._connection.get()
+
+    @staticmethod
+    def _covers(selection: str, stored_questions: int, total: int, num_questions: int) -> bool:
+        """Check whether a stored result can answer a request for num_questions pairs"""
+        if selection != 'sequential':
+            return num_questions == stored_questions
+        # Sequential results are prefixes of larger ones, and a result
+        # shorter than requested means generation ran out of material
+        return num_questions <= stored_questions or total < stored_questions
+
+    def get(self, key: str, num_questions: int, selection: str = 'sequential') -> Optional[List[Dict[str, Any]]]:
+        """Return the first num_questions stored pairs for a result key, or None if they are not stored"""
+        try:
+            with self._lock:
+                db = self._connect()
+                row = db.execute(
+                    'SELECT id, num_questions, total FROM sources WHERE paragraph_key = ? AND selection = ?',
+                    (key, selection)
+                ).fetchone()
+                if row is None or not self._covers(selection, row[1], row[2], num_questions):
+                    self.misses += 1
+                    return None
+                rows = db.execute(
+                    f'SELECT {self._QUESTION_COLUMNS} FROM questions q JOIN sources s ON s.id = q.source_id '
+                    'WHERE q.source_id = ? ORDER BY q.position LIMIT ?',
+                    (row[0], num_questions)
+                ).fetchall()
+                self.hits += 1
+        except sqlite3.Error as e:
+            # A locked or damaged bank is a miss: the result is generated instead
+            self.logger.error(f"Error reading question bank: {str(e)}")
+            with self._lock:
+                self.misses += 1
+            return None
+        return [self._qa_from_row(row) for row in rows]
+
+    def put(self, key: str, paragraph: str, difficulty: str, selection: str, lexicon_version: str,
+            num_questions: int, qa_pairs: List[Dict[str, Any]], spans: Dict[str, Tuple[int, int]],
+            source: Optional[str] = None) -> None:
+        """Store the pairs generated for num_questions, replacing a smaller stored result
+
+        ``spans`` maps context sentences to their offsets in the paragraph.
+        When the result is already stored, only a new ``source`` label is
+        recorded.
+        """
+        try:
+            with self._lock:
+                db = self._connect()
+                with db:
+                    row = db.execute(
+                        'SELECT id, num_questions, total, source FROM sources WHERE paragraph_key = ? AND selection = ?',
+                        (key, selection)
+                    ).fetchone()
+                    if row is not None and self._covers(selection, row[1], row[2], num_questions):
+                        if source is not None:
+                            db.execute('UPDATE sources SET source = ? WHERE id = ?', (source, row[0]))
+                        return
+                    if row is not None:
+                        # The larger result replaces the stored one and keeps its label
+                        source = source if source is not None else row[3]
+                        db.execute('DELETE FROM questions WHERE source_id = ?', (row[0],))
+                        db.execute('DELETE FROM sources WHERE id = ?', (row[0],))
+                    source_id = db.execute(
+                        'INSERT INTO sources (paragraph_key, selection, paragraph_hash, source, paragraph, difficulty, '
+                        'lexicon_version, num_questions, total, created_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                        (key, selection, paragraph_hash(paragraph), source, paragraph, difficulty, lexicon_version,
+                         num_questions, len(qa_pairs), time.time())
+                    ).lastrowid
+                    db.executemany(
+                        'INSERT INTO questions (source_id, position, sentence_start, sentence_end, question, answer, '
+                        'type, level, confidence, synthetic, details) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                        (self._row_from_qa(source_id, position, qa, spans) for position, qa in enumerate(qa_pairs))
+                    )
+        except sqlite3.Error as e:
+            self.logger.error(f"Error writing question bank: {str(e)}")
+
+    def set_source(self, key: str, selection: str, source: str) -> None:
+        """Label a stored result with a source"""
+        try:
+            with self._lock:
+                db = self._connect()
+                with db:
+                    db.execute('UPDATE sources SET source = ? WHERE paragraph_key = ? AND selection = ?',
+                               (source, key, selection))
+        except sqlite3.Error as e:
+            self.logger.error(f"Error writing question bank: {str(e)}")
+
+    # Columns read for a question; the context is cut from the paragraph
+    # (substr counts characters from 1, like the offsets from 0)
+    _QUESTION_COLUMNS = (
+        'q.id, q.question, q.answer, q.type, q.level, q.confidence, q.synthetic, q.details, '
+        'q.sentence_start, q.sentence_end, s.source, s.paragraph_hash, '
+        'substr(s.paragraph, q.sentence_start + 1, q.sentence_end - q.sentence_start)'
+    )
+
+    @staticmethod
+    def _row_from_qa(source_id: int, position: int, qa: Dict[str, Any],
+                     spans: Dict[str, Tuple[int, int]]) -> Tuple[Any, ...]:
+        details = {'scores': qa.get('scores'), 'factors': qa.get('factors')}
+        span = spans.get(qa.get('context', ''))
+        if span is None:
+            details['context'] = qa.get('context', '')
+        start, end = span if span is not None else (None, None)
+        return (source_id, position, start, end, qa['question'], qa['answer'], qa.get('type', ''),
+                qa.get('level', ''), qa.get('confidence', 0), int(bool(qa.get('synthetic'))),
+                json.dumps(details, ensure_ascii=False))
+
+    @staticmethod
+    def _qa_from_row(row: Tuple[Any, ...]) -> Dict[str, Any]:
+        """A stored question in the API JSON shape"""
+        details = json.loads(row[7])
+        qa: Dict[str, Any] = {
+            'question': row[1],
+            'answer': row[2],
+            'type': row[3],
+            'context': row[12] if row[8] is not None else details.get('context', '')
+        }
+        if row[6]:
+            qa['synthetic'] = True
+        qa['level'] = row[4]
+        qa['confidence'] = row[5]
+        qa['scores'] = details['scores']
+        qa['factors'] = details['factors']
+        return qa
+
+    @staticmethod
+    def _filters(level: Optional[str], type: Optional[str], min_confidence: Optional[float],
+                 max_confidence: Optional[float], source: Optional[str]) -> Tuple[List[str], List[Any]]:
+        """WHERE conditions and parameters for question queries; ``source`` matches a label or paragraph hash"""
+        conditions: List[str] = []
+        parameters: List[Any] = []
+        for condition, value in (('q.level = ?', level), ('q.type = ?', type),
+                                 ('q.confidence >= ?', min_confidence), ('q.confidence <= ?', max_confidence)):
+            if value is not None:
+                conditions.append(condition)
+                parameters.append(value)
+        if source is not None:
+            conditions.append('q.source_id IN (SELECT id FROM sources WHERE source = ? OR paragraph_hash = ?)')
+            parameters.extend((source, source))
+        return conditions, parameters
+
+    def query(self, level: Optional[str] = None, type: Optional[str] = None,
+              min_confidence: Optional[float] = None, max_confidence: Optional[float] = None,
+              source: Optional[str] = None, after: int = 0, limit: int = 50) -> Dict[str, Any]:
+        """One page of stored questions matching the filters, in the order they were stored
+
+        Pages are keyed by question id: pass the returned ``next_after`` as
+        ``after`` for the next page; it is None on the last page.
+        """
+        limit = max(1, min(limit, MAX_PAGE_SIZE))
+        conditions, parameters = self._filters(level, type, min_confidence, max_confidence, source)
+        conditions.append('q.id > ?')
+        parameters.extend((after, limit + 1))
+        with self._lock:
+            rows = self._connect().execute(
+                f'SELECT {self._QUESTION_COLUMNS} FROM questions q JOIN sources s ON s.id = q.source_id '
+                f'WHERE {" AND ".join(conditions)} ORDER BY q.id LIMIT ?',
+                parameters
+            ).fetchall()
+        questions = [{
+            'id': row[0],
+            'source': row[10],
+            'paragraph_hash': row[11],
+            'sentence_start': row[8],
+            'sentence_end': row[9],
+            **self._qa_from_row(row)
+        } for row in rows[:limit]]
+        return {'questions': questions, 'next_after': questions[-1]['id'] if len(rows) > limit else None}
+
+    def sources(self, source: Optional[str] = None, after: int = 0, limit: int = 50) -> Dict[str, Any]:
+        """One page of stored results, optionally only those with a source label"""
+        limit = max(1, min(limit, MAX_PAGE_SIZE))
+        condition = 'id > ?' + (' AND source = ?' if source is not None else '')
+        parameters: List[Any] = [after] + ([source] if source is not None else []) + [limit + 1]
+        with self._lock:
+            rows = self._connect().execute(
+                'SELECT id, source, paragraph_hash, difficulty, selection, lexicon_version, num_questions, total, '
+                f'created_at FROM sources WHERE {condition} ORDER BY id LIMIT ?',
+                parameters
+            ).fetchall()
+        names = ('id', 'source', 'paragraph_hash', 'difficulty', 'selection', 'lexicon_version',
+                 'num_questions', 'total_questions', 'created_at')
+        sources = [dict(zip(names, row)) for row in rows[:limit]]
+        return {'sources': sources, 'next_after': sources[-1]['id'] if len(rows) > limit else None}
+
+    def level_totals(self, level: Optional[str] = None, type: Optional[str] = None,
+                     min_confidence: Optional[float] = None, max_confidence: Optional[float] = None,
+                     source: Optional[str] = None) -> Tuple[Dict[str, Tuple[int, float]], int]:
+        """Question count and confidence sum per level, and the synthetic question count, of matching questions
+
+        Filters on level and type alone are answered from the running
+        totals; confidence and source filters aggregate over their index.
+        """
+        if min_confidence is None and max_confidence is None and source is None:
+            conditions, parameters = self._filters(level, type, None, None, None)
+            where = ' AND '.join(condition.replace('q.', '') for condition in conditions) or '1'
+            sql = (f'SELECT level, SUM(count), SUM(confidence_sum), SUM(synthetic) FROM question_totals '
+                   f'WHERE {where} GROUP BY level')
+        else:
+            conditions, parameters = self._filters(level, type, min_confidence, max_confidence, source)
+            sql = (f'SELECT q.level, COUNT(*), SUM(q.confidence), SUM(q.synthetic) FROM questions q '
+                   f'WHERE {" AND ".join(conditions)} GROUP BY q.level')
+        with self._lock:
+            rows = self._connect().execute(sql, parameters).fetchall()
+        totals = {row[0]: (row[1], row[2] or 0.0) for row in rows if row[0] in LEVELS and row[1]}
+        return totals, sum(row[3] or 0 for row in rows)
+
+    def stats(self) -> Dict[str, Any]:
+        """Get hit/miss counters and the number of stored results and questions"""
+        with self._lock:
+            db = self._connect()
+            sources = db.execute('SELECT COUNT(*) FROM sources').fetchone()[0]
+            questions = db.execute('SELECT COALESCE(SUM(count), 0) FROM question_totals').fetchone()[0]
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 3) if lookups else 0,
+                'sources': sources,
+                'questions': questions
+            }
+
+def sentence_spans(sentences: Iterable[Tuple[str, int, int]]) -> Dict[str, Tuple[int, int]]:
+    """Offsets of the first occurrence of each sentence, for QuestionBank.put"""
+    spans: Dict[str, Tuple[int, int]] = {}
+    for text, start, end in sentences:
+        spans.setdefault(text, (start, end))
+    return spans
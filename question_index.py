@@ -0,0 +1,236 @@
+import hashlib
+import os
+import pickle
+import re
+import sys
+import threading
+import unicodedata
+from array import array
+from collections import deque
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+# How questions are compared: as given, after normalization, or by
+# normalized text and MinHash similarity
+DEDUPE_MODES = ('exact', 'normalized', 'near')
+
+# Bump when the saved index layout or the signature scheme changes
+INDEX_FORMAT = 1
+
+# MinHash signature: one 16-bit minimum per bin, banded for LSH lookups
+SIGNATURE_BINS = 32
+BANDS = 8
+BAND_ROWS = SIGNATURE_BINS // BANDS
+SHINGLE_SIZE = 4
+
+# A counter the old generic fill appended to repeated questions, e.g. "... (7)"
+_COUNTER_SUFFIX = re.compile(r'\s*\(\d+\)[\s?!.।]*$')
+_SPACES = re.compile(r'\s+')
+
+@lru_cache(maxsize=1)
+def _strip_pattern() -> 're.Pattern[str]':
+    """Punctuation and format characters (zero-width joiners) of the Basic Multilingual Plane"""
+    codes = [code for code in range(0x10000)
+             if unicodedata.category(chr(code))[0] == 'P' or unicodedata.category(chr(code)) == 'Cf']
+    ranges = []
+    start = previous = codes[0]
+    for code in codes[1:] + [-1]:
+        if code != previous + 1:
+            ranges.append(re.escape(chr(start)) + ('-' + re.escape(chr(previous)) if previous > start else ''))
+            start = code
+        previous = code
+    return re.compile('[' + ''.join(ranges) + ']+')
+
+def normalize_question(question: str) -> str:
+    """The comparison form of a question: NFC, no counter suffix, punctuation or case, single spaces"""
+    text = _COUNTER_SUFFIX.sub('', unicodedata.normalize('NFC', question))
+    return _SPACES.sub(' ', _strip_pattern().sub('', text)).strip().casefold()
+
+def _hash_scheme() -> int:
+    """Fingerprint of the tuple hash that signatures are built from, which is fixed per Python build"""
+    return hash((1, 2, 3, 4)) & 0xFFFFFFFF
+
+def minhash_signature(text: str) -> bytes:
+    """One-permutation MinHash of the text's character 4-grams, SIGNATURE_BINS 16-bit values
+
+    Each shingle is hashed once; the low bits pick its bin and the bin keeps
+    the smallest hash.  Empty bins borrow the next filled bin's value so
+    short texts still get a full signature.
+    """
+    codes = list(map(ord, text))
+    if len(codes) < SHINGLE_SIZE:
+        codes += [0] * (SHINGLE_SIZE - len(codes))
+    shingles = zip(*(codes[offset:] for offset in range(SHINGLE_SIZE)))
+    # Sorted descending, so the smallest hash of each bin is assigned last
+    smallest = {h & (SIGNATURE_BINS - 1): h for h in sorted(map(hash, shingles), reverse=True)}
+    values = [(h >> 5) & 0xFFFF if h is not None else -1 for h in map(smallest.get, range(SIGNATURE_BINS))]
+    if len(smallest) < SIGNATURE_BINS:
+        filled = values[:]
+        for bin_index in [index for index, value in enumerate(filled) if value < 0]:
+            distance = 1
+            while filled[(bin_index + distance) % SIGNATURE_BINS] < 0:
+                distance += 1
+            values[bin_index] = (filled[(bin_index + distance) % SIGNATURE_BINS] + 0x9E37 * distance) & 0xFFFF
+    return array('H', values).tobytes()
+
+def signature_similarity(first: bytes, second: bytes) -> float:
+    """Estimated Jaccard similarity of two signatures: the share of bins that agree"""
+    a, b = memoryview(first).cast('H'), memoryview(second).cast('H')
+    return sum(x == y for x, y in zip(a, b)) / SIGNATURE_BINS
+
+class QuestionIndex:
+    """Remembers questions and recognises repeats of them in constant time
+
+    ``exact`` compares questions as given and ``normalized`` after
+    :func:`normalize_question`.  ``near`` also treats a question as a repeat
+    when the estimated Jaccard similarity of its character 4-grams to a
+    remembered question is at least ``threshold``; candidates come from
+    locality-sensitive hashing over MinHash bands, so a lookup costs the
+    same however many questions are remembered.  At most ``max_size``
+    questions are kept, the oldest forgotten first.  Only 8-byte digests and
+    signatures are stored, not the questions.  Safe to share between threads.
+    """
+
+    def __init__(self, mode: str = 'near', max_size: int = 100_000, threshold: float = 0.8):
+        if mode not in DEDUPE_MODES:
+            raise ValueError(f"Unknown dedupe mode: {mode}")
+        self.mode = mode
+        self.max_size = max(1, max_size)
+        self.threshold = threshold
+        self._lock = threading.Lock()
+        self._next_id = 0
+        self._order: Deque[int] = deque()
+        self._entries: Dict[int, Tuple[bytes, Optional[bytes]]] = {}
+        self._keys: Dict[bytes, int] = {}
+        self._bands: List[Dict[bytes, Union[int, List[int]]]] = [{} for _ in range(BANDS)] if mode == 'near' else []
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, question: str) -> bool:
+        text = question if self.mode == 'exact' else normalize_question(question)
+        key = self._digest(text)
+        if key in self._keys:
+            return True
+        if self.mode != 'near':
+            return False
+        signature = minhash_signature(text)
+        with self._lock:
+            return key in self._keys or self._find_similar(signature) is not None
+
+    def add(self, question: str) -> bool:
+        """Remember a question; returns False, remembering nothing, when it repeats one already known"""
+        text = question if self.mode == 'exact' else normalize_question(question)
+        key = self._digest(text)
+        if key in self._keys:
+            return False
+        # Hashing happens outside the lock; only the lookup and insert are serialized
+        signature = minhash_signature(text) if self.mode == 'near' else None
+        with self._lock:
+            if key in self._keys or (signature is not None and self._find_similar(signature) is not None):
+                return False
+            self._insert(key, signature)
+            return True
+
+    def filter(self, questions: Iterable[str]) -> List[bool]:
+        """add() for each question in order: which ones were new"""
+        return [self.add(question) for question in questions]
+
+    @staticmethod
+    def _digest(text: str) -> bytes:
+        return hashlib.blake2b(text.encode('utf-8'), digest_size=8).digest()
+
+    @staticmethod
+    def _band_keys(signature: bytes) -> Iterator[Tuple[int, bytes]]:
+        width = 2 * BAND_ROWS
+        for band in range(BANDS):
+            yield band, signature[band * width:(band + 1) * width]
+
+    def _find_similar(self, signature: bytes) -> Optional[int]:
+        checked = set()
+        for band, band_key in self._band_keys(signature):
+            found = self._bands[band].get(band_key)
+            if found is None:
+                continue
+            for entry_id in (found if isinstance(found, list) else (found,)):
+                if entry_id in checked:
+                    continue
+                checked.add(entry_id)
+                other = self._entries[entry_id][1]
+                if other is not None and signature_similarity(signature, other) >= self.threshold:
+                    return entry_id
+        return None
+
+    def _insert(self, key: bytes, signature: Optional[bytes]) -> None:
+        entry_id = self._next_id
+        self._next_id += 1
+        self._order.append(entry_id)
+        self._entries[entry_id] = (key, signature)
+        self._keys[key] = entry_id
+        if signature is not None:
+            for band, band_key in self._band_keys(signature):
+                bucket = self._bands[band]
+                found = bucket.get(band_key)
+                if found is None:
+                    bucket[band_key] = entry_id
+                elif isinstance(found, list):
+                    found.append(entry_id)
+                else:
+                    bucket[band_key] = [found, entry_id]
+        while len(self._order) > self.max_size:
+            self._evict(self._order.popleft())
+
+    def _evict(self, entry_id: int) -> None:
+        key, signature = self._entries.pop(entry_id)
+        if self._keys.get(key) == entry_id:
+            del self._keys[key]
+        if signature is not None:
+            for band, band_key in self._band_keys(signature):
+                bucket = self._bands[band]
+                found = bucket[band_key]
+                if isinstance(found, list):
+                    found.remove(entry_id)
+                    if len(found) == 1:
+                        bucket[band_key] = found[0]
+                else:
+                    del bucket[band_key]
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Write the remembered questions' digests and signatures, replacing any previous file atomically"""
+        path = Path(path)
+        with self._lock:
+            state = {
+                'format': INDEX_FORMAT,
+                'mode': self.mode,
+                'threshold': self.threshold,
+                'hash_scheme': _hash_scheme(),
+                'python': list(sys.version_info[:2]),
+                'entries': [self._entries[entry_id] for entry_id in self._order]
+            }
+        temporary = path.with_name(path.name + '.tmp')
+        with open(temporary, 'wb') as handle:
+            pickle.dump(state, handle, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary, path)
+
+    @classmethod
+    def load(cls, path: Union[str, Path], mode: str = 'near', max_size: int = 100_000,
+             threshold: float = 0.8) -> 'QuestionIndex':
+        """An index holding the questions saved at path, or an empty one when the file does not exist"""
+        index = cls(mode, max_size, threshold)
+        path = Path(path)
+        if not path.exists():
+            return index
+        with open(path, 'rb') as handle:
+            state: Dict[str, Any] = pickle.load(handle)
+        if state.get('format') != INDEX_FORMAT:
+            raise ValueError(f"{path} was written by an incompatible version")
+        if (state['mode'], state['threshold']) != (mode, threshold):
+            raise ValueError(f"{path} was built with dedupe mode {state['mode']} "
+                             f"and threshold {state['threshold']}")
+        if mode == 'near' and state['hash_scheme'] != _hash_scheme():
+            raise ValueError(f"{path} was built by Python {'.'.join(map(str, state['python']))}, "
+                             "whose signatures differ from this interpreter's")
+        for key, signature in state['entries']:
+            index._insert(key, signature)
+        return index
@@ -1,26 +1,52 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable, Optional, Sequence, Tuple
+from importlib.util import find_spec
+from itertools import chain
 import logging
+import time
+from keyword_matcher import KeywordMatcher
+from lexicons import load_artifact
+from metrics import RequestMetrics
+from qa_record import LEVELS, LevelInfo, QARecord
+
+# NumPy is optional and only imported by the first batch large enough to use it
+NUMPY_AVAILABLE = find_spec('numpy') is not None
+np: Any = None
+
+def load_numpy() -> Any:
+    """Import NumPy on first use; returns None when it is not installed"""
+    global np, NUMPY_AVAILABLE
+    if np is None and NUMPY_AVAILABLE:
+        try:
+            import numpy
+        except ImportError:
+            NUMPY_AVAILABLE = False
+        else:
+            np = numpy
+    return np
+
+# Smallest batch scored with NumPy; smaller ones are cheaper one question at a time
+NUMPY_MIN_BATCH = 64
+
+# Score matrix column of each level
+LEVEL_COLUMNS = {level: column for column, level in enumerate(LEVELS)}
 
 class QuestionLevelAnalyzer:
     """Analyzes question difficulty levels based on various factors"""
     
-    def __init__(self):
+    # Attributes built from the lexicons by _build_keyword_matchers and shared through the lexicon artifact
+    COMPILED_ATTRIBUTES = ('_indicator_entries', '_indicator_matcher', '_word_entries', '_word_matcher',
+                           '_indicator_columns', '_word_columns')
+    
+    def __init__(self, lexicons: Optional[Dict[str, Any]] = None):
+        """Use the given 'analyzer' lexicon section, or the compiled lexicons of the data file"""
         self.logger = logging.getLogger(__name__)
+        artifact = None
+        if lexicons is None:
+            artifact = load_artifact()
+            lexicons = artifact.section('analyzer')
         
         # Complexity indicators
-        self.complex_indicators = {
-            'advanced': [
-                'విశ్లేషించండి', 'వివరించండి', 'తులనా చేయండి', 'కారణాలు', 'ప్రభావం',
-                'పరిణామం', 'సిద్ధాంతం', 'సూత్రం', 'ప్రక్రియ', 'విధానం'
-            ],
-            'intermediate': [
-                'ఎందుకు', 'ఎలా', 'ఏ విధంగా', 'ఏ కారణంగా', 'ప్రధాన', 'ముఖ్యమైన',
-                'విశేషం', 'ప్రత్యేకం', 'విలక్షణం'
-            ],
-            'basic': [
-                'ఎవరు', 'ఏమిటి', 'ఎక్కడ', 'ఎప్పుడు', 'ఎంత', 'ఏం', 'ఎవరి'
-            ]
-        }
+        self.complex_indicators: Dict[str, List[str]] = lexicons['complex_indicators']
         
         # Sentence complexity factors
         self.complexity_factors: Dict[str, Dict[str, Any]] = {
@@ -29,29 +55,203 @@ class QuestionLevelAnalyzer:
                 'intermediate': (15, 30),
                 'advanced': (30, float('inf'))
             },
-            'word_complexity': {
-                'basic': ['చిన్న', 'పెద్ద', 'మంచి', 'చెడు', 'కొత్త', 'పాత'],
-                'intermediate': ['ముఖ్యమైన', 'ప్రత్యేకమైన', 'విలక్షణమైన', 'అద్భుతమైన'],
-                'advanced': ['అసాధారణమైన', 'అద్వితీయమైన', 'అపూర్వమైన', 'అసమానమైన']
-            }
+            'word_complexity': lexicons['word_complexity']
         }
+        
+        if artifact is None:
+            self._build_keyword_matchers()
+        else:
+            self.__dict__.update(artifact.compiled['analyzer'])
+            self._template_parts = {}
+    
+    def compiled_state(self) -> Dict[str, Any]:
+        """The matchers and tables built from the current lexicons"""
+        return {name: getattr(self, name) for name in self.COMPILED_ATTRIBUTES}
+    
+    def _build_keyword_matchers(self) -> None:
+        """Compile the indicator and word complexity lexicons into matchers"""
+        self._indicator_entries = [
+            (level, indicator)
+            for level, indicators in self.complex_indicators.items()
+            for indicator in indicators
+        ]
+        self._indicator_matcher = KeywordMatcher(
+            indicator.lower() for _, indicator in self._indicator_entries
+        )
+        
+        self._word_entries = [
+            level
+            for level, words in self.complexity_factors['word_complexity'].items()
+            for _ in words
+        ]
+        self._word_matcher = KeywordMatcher(
+            word
+            for words in self.complexity_factors['word_complexity'].values()
+            for word in words
+        )
+        
+        # Score matrix columns of the lexicon entries, for batch scoring
+        self._indicator_columns = [LEVEL_COLUMNS[level] for level, _ in self._indicator_entries]
+        self._word_columns = [LEVEL_COLUMNS[level] for level in self._word_entries]
+        
+        # Split question templates, rebuilt lazily against the new lexicons
+        self._template_parts: Dict[str, Tuple[str, str, Tuple[int, ...], bool]] = {}
+    
+    def update_lexicons(self, complex_indicators: Optional[Dict[str, List[str]]] = None,
+                        word_complexity: Optional[Dict[str, List[str]]] = None) -> None:
+        """Replace the indicator and/or word complexity lexicons and recompile the matchers"""
+        if complex_indicators is not None:
+            self.complex_indicators = complex_indicators
+        if word_complexity is not None:
+            self.complexity_factors['word_complexity'] = word_complexity
+        self._build_keyword_matchers()
     
     def analyze_question_level(self, question: str, answer: str, context: str) -> Dict[str, Any]:
         """Analyze the difficulty level of a question based on multiple factors"""
+        return self.analyze_level_info(question, answer).to_dict()
+    
+    def analyze_level_info(self, question: str, answer: str) -> LevelInfo:
+        """Same analysis as analyze_question_level, as a compact LevelInfo"""
+        return self._score_question(
+            self._indicator_matcher.find(question.lower()),
+            self._analyze_answer(answer),
+            len(question.split())
+        )
+    
+    def analyze_question_levels_batch(self, questions: Sequence[str], answers: Sequence[str],
+                                      contexts: Sequence[str]) -> List[Dict[str, Any]]:
+        """Analyze many questions at once; results equal analyze_question_level for each"""
+        return [info.to_dict() for info in self.analyze_level_infos_batch(questions, answers)]
+    
+    def analyze_level_infos_batch(self, questions: Sequence[str], answers: Sequence[str]) -> List[LevelInfo]:
+        """Same analysis as analyze_level_info for every (question, answer) pair
+        
+        Keyword scans stay per text, but the four factors are added into one
+        NumPy score matrix and the level and confidence come from a single
+        argmax and sum over it.  ``argmax`` returns the first maximum, which is
+        the basic -> intermediate -> advanced tie-break of the single-question
+        analysis.  Without NumPy, or for batches under NUMPY_MIN_BATCH, each
+        question is analyzed on its own.
+        """
+        size = len(questions)
+        if size < NUMPY_MIN_BATCH or load_numpy() is None:
+            return [self.analyze_level_info(question, answer) for question, answer in zip(questions, answers)]
+        
+        # Texts repeat within a batch (short entity answers especially), so each is scanned once
+        lowered = [question.lower() for question in questions]
+        found = {text: self._indicator_matcher.find(text) for text in set(lowered)}
+        indicator_positions = [found[text] for text in lowered]
+        found = {text: self._word_matcher.find(text) for text in set(answers)}
+        word_positions = [found[answer] for answer in answers]
+        
+        question_word_counts = [len(question.split()) for question in questions]
+        answer_word_counts = [len(answer.split()) for answer in answers]
+        question_lengths = np.array(question_word_counts, dtype=np.int64)
+        answer_lengths = np.array(answer_word_counts, dtype=np.int64)
+        scores = np.zeros((size, len(LEVELS)), dtype=np.int64)
+        
+        # Factor 1: Question complexity indicators
+        self._add_hits(scores, indicator_positions, self._indicator_columns, 2)
+        
+        # Factor 2: Answer complexity
+        for level, (min_len, max_len) in self.complexity_factors['sentence_length'].items():
+            scores[:, LEVEL_COLUMNS[level]] += (answer_lengths >= min_len) & (answer_lengths < max_len)
+        
+        # Factor 3: Word complexity in answer
+        self._add_hits(scores, word_positions, self._word_columns, 1)
+        
+        # Factor 4: Question length
+        scores[np.arange(size), (question_lengths > 5).astype(np.int64) + (question_lengths > 10)] += 1
         
+        # Determine final levels and confidence scores
+        best = scores.argmax(axis=1).tolist()
+        max_scores = scores.max(axis=1).tolist()
+        totals = scores.sum(axis=1).tolist()
+        confidences: Dict[Tuple[int, int], float] = {}
+        indicators = [indicator for _, indicator in self._indicator_entries]
+        results: List[LevelInfo] = []
+        for level_scores, column, max_score, total, question_length, answer_length, positions in zip(
+                scores.tolist(), best, max_scores, totals, question_word_counts, answer_word_counts,
+                indicator_positions):
+            confidence = confidences.get((max_score, total))
+            if confidence is None:
+                confidence = confidences[(max_score, total)] = round(min(max_score / total if total > 0 else 0, 1.0), 2)
+            results.append(LevelInfo(
+                LEVELS[column],
+                confidence,
+                tuple(level_scores),
+                question_length,
+                answer_length,
+                tuple([indicators[position] for position in positions])
+            ))
+        return results
+    
+    @staticmethod
+    def _add_hits(scores: Any, positions: List[List[int]], columns: List[int], weight: int) -> None:
+        """Add weight to the score matrix for every lexicon hit, given per row as lexicon positions"""
+        counts = [len(row_positions) for row_positions in positions]
+        if not any(counts):
+            return
+        rows = np.repeat(np.arange(len(positions)), counts)
+        hit_columns = np.asarray(columns, dtype=np.int64)[np.fromiter(chain.from_iterable(positions), dtype=np.int64)]
+        np.add.at(scores, (rows, hit_columns), weight)
+    
+    def analyze_templated_questions(self, sentence: str, templates: Sequence[str]) -> List[LevelInfo]:
+        """Analyze the questions formed by putting a sentence into each template
+        
+        Each template holds one ``{sentence}`` placeholder and the sentence is
+        also the answer and context.  The answer factors and the indicator scan
+        of the sentence are shared by all templates, and the fixed template
+        text is scanned once per lexicon.  Results equal analyze_level_info on
+        the formatted question.
+        """
+        answer_analysis = self._analyze_answer(sentence)
+        sentence_lower = sentence.lower()
+        sentence_positions: Optional[set[int]] = None
+        results: List[LevelInfo] = []
+        for template in templates:
+            question = template.format(sentence=sentence)
+            parts = self._template_parts.get(template)
+            if parts is None:
+                parts = self._template_parts[template] = self._split_template(template)
+            prefix, suffix, template_positions, separable = parts
+            if not separable or question.lower() != prefix + sentence_lower + suffix:
+                results.append(self.analyze_level_info(question, sentence))
+                continue
+            if sentence_positions is None:
+                sentence_positions = set(self._indicator_matcher.find(sentence_lower))
+            results.append(self._score_question(
+                sorted(sentence_positions.union(template_positions)),
+                answer_analysis,
+                len(question.split())
+            ))
+        return results
+    
+    def _split_template(self, template: str) -> Tuple[str, str, Tuple[int, ...], bool]:
+        """Split a question template around its placeholder and scan its fixed text for indicators
+        
+        The template is separable when no indicator can span the placeholder
+        boundary, so matches in the fixed text and in the sentence can be
+        found independently.
+        """
+        prefix, _, suffix = template.partition('{sentence}')
+        prefix = prefix.format().lower()
+        suffix = suffix.format().lower()
+        positions = set(self._indicator_matcher.find(prefix))
+        positions.update(self._indicator_matcher.find(suffix))
+        edges = (prefix[-1:], suffix[:1])
+        separable = not any(edge and edge in indicator.lower()
+                            for _, indicator in self._indicator_entries for edge in edges)
+        return prefix, suffix, tuple(positions), separable
+    
+    def _analyze_answer(self, answer: str) -> Tuple[Dict[str, int], int]:
+        """Score the answer length and word complexity factors"""
         level_scores = {
             'basic': 0,
             'intermediate': 0,
             'advanced': 0
         }
         
-        # Factor 1: Question complexity indicators
-        question_lower = question.lower()
-        for level, indicators in self.complex_indicators.items():
-            for indicator in indicators:
-                if indicator.lower() in question_lower:
-                    level_scores[level] += 2
-        
         # Factor 2: Answer complexity
         answer_words = answer.split()
         answer_length = len(answer_words)
@@ -61,13 +261,25 @@ class QuestionLevelAnalyzer:
                 level_scores[level] += 1
         
         # Factor 3: Word complexity in answer
-        for level, words in self.complexity_factors['word_complexity'].items():
-            for word in words:
-                if word in answer:
-                    level_scores[level] += 1
+        for position in self._word_matcher.find(answer):
+            level_scores[self._word_entries[position]] += 1
+        
+        return level_scores, answer_length
+    
+    def _score_question(self, indicator_positions: Iterable[int], answer_analysis: Tuple[Dict[str, int], int],
+                        question_length: int) -> LevelInfo:
+        """Combine the question and answer factors into the final level"""
+        answer_scores, answer_length = answer_analysis
+        level_scores = dict(answer_scores)
+        
+        # Factor 1: Question complexity indicators
+        matched_indicators: List[str] = []
+        for position in indicator_positions:
+            level, indicator = self._indicator_entries[position]
+            level_scores[level] += 2
+            matched_indicators.append(indicator)
         
         # Factor 4: Question length
-        question_length = len(question.split())
         if question_length <= 5:
             level_scores['basic'] += 1
         elif question_length <= 10:
@@ -83,19 +295,21 @@ class QuestionLevelAnalyzer:
         total_score = sum(level_scores.values())
         confidence = min(max_score / total_score if total_score > 0 else 0, 1.0)
         
-        return {
-            'level': final_level,
-            'confidence': round(confidence, 2),
-            'scores': level_scores,
-            'factors': {
-                'question_length': question_length,
-                'answer_length': answer_length,
-                'complex_indicators': [ind for inds in self.complex_indicators.values() 
-                                     for ind in inds if ind.lower() in question_lower]
-            }
-        }
+        return LevelInfo(
+            final_level,
+            round(confidence, 2),
+            tuple(level_scores.values()),
+            question_length,
+            answer_length,
+            tuple(matched_indicators)
+        )
+    
+    def has_level_info(self, qa: Dict[str, Any]) -> bool:
+        """Check whether a Q&A pair already carries a level analysis"""
+        return qa.get('level') in self.complex_indicators and 'confidence' in qa and 'scores' in qa
     
-    def categorize_questions_by_level(self, qa_pairs: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+    def categorize_questions_by_level(self, qa_pairs: List[Dict[str, Any]],
+                                      metrics: Optional[RequestMetrics] = None) -> Dict[str, List[Dict[str, Any]]]:
         """Categorize questions by their difficulty levels"""
         categorized: Dict[str, List[Dict[str, Any]]] = {
             'basic': [],
@@ -103,42 +317,99 @@ class QuestionLevelAnalyzer:
             'advanced': []
         }
         
+        # Pairs produced by generate_qa_pairs already carry their level
+        # analysis; the others are analyzed together in one batch
+        missing: List[Dict[str, Any]] = []
         for qa in qa_pairs:
-            level_info = self.analyze_question_level(
-                qa['question'], 
-                qa['answer'], 
-                qa.get('context', '')
-            )
+            if self.has_level_info(qa):
+                categorized[qa['level']].append(qa)
+            else:
+                missing.append(qa)
+        if not missing:
+            return categorized
+        
+        if metrics is not None:
+            metrics.count('statistics_reanalyzed', len(missing))
+        level_infos = self.analyze_level_infos_batch(
+            [qa['question'] for qa in missing],
+            [qa['answer'] for qa in missing]
+        )
+        
+        # Rebuild the categories in input order
+        for questions in categorized.values():
+            questions.clear()
+        analyzed = iter(level_infos)
+        for qa in qa_pairs:
+            if self.has_level_info(qa):
+                categorized[qa['level']].append(qa)
+                continue
+            level_info = next(analyzed).to_dict()
             qa_with_level = {**qa, **level_info}
             categorized[level_info['level']].append(qa_with_level)
         
         return categorized
     
-    def get_level_statistics(self, qa_pairs: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def get_level_statistics(self, qa_pairs: List[Dict[str, Any]],
+                             metrics: Optional[RequestMetrics] = None) -> Dict[str, Any]:
         """Get statistics about question levels"""
-        categorized = self.categorize_questions_by_level(qa_pairs)
-        
+        start = time.perf_counter() if metrics is not None else 0.0
+        categorized = self.categorize_questions_by_level(qa_pairs, metrics)
+        stats = self._summarize_levels(len(qa_pairs), {
+            level: [q.get('confidence', 0) for q in questions]
+            for level, questions in categorized.items()
+        })
+        if metrics is not None:
+            metrics.add_time('level_statistics', start)
+        return stats
+    
+    def get_record_statistics(self, records: Iterable[QARecord],
+                              metrics: Optional[RequestMetrics] = None) -> Dict[str, Any]:
+        """Same statistics as get_level_statistics, from records that carry their level"""
+        start = time.perf_counter() if metrics is not None else 0.0
+        confidences: Dict[str, List[float]] = {'basic': [], 'intermediate': [], 'advanced': []}
+        total = 0
+        for record in records:
+            confidences[record.level_info.level].append(record.level_info.confidence)
+            total += 1
+        stats = self._summarize_levels(total, confidences)
+        if metrics is not None:
+            metrics.add_time('level_statistics', start)
+        return stats
+    
+    @staticmethod
+    def summarize_level_totals(totals: Dict[str, Tuple[int, float]]) -> Dict[str, Any]:
+        """Same statistics as get_level_statistics, from each level's question count and confidence sum"""
+        total = sum(count for count, _ in totals.values())
+        distribution = {level: totals.get(level, (0, 0.0))[0] for level in LEVELS}
+        return {
+            'total_questions': total,
+            'level_distribution': distribution,
+            'percentage_distribution': {
+                level: round((count / total * 100), 1) if total > 0 else 0 for level, count in distribution.items()
+            },
+            'average_confidence': round(sum(confidence for _, confidence in totals.values()) / total, 2) if total else 0
+        }
+    
+    @staticmethod
+    def _summarize_levels(total: int, confidences_by_level: Dict[str, List[float]]) -> Dict[str, Any]:
+        """Build the statistics dict from the confidences of each level's questions"""
         stats: Dict[str, Any] = {
-            'total_questions': len(qa_pairs),
+            'total_questions': total,
             'level_distribution': {
-                level: len(questions) 
-                for level, questions in categorized.items()
+                level: len(confidences) 
+                for level, confidences in confidences_by_level.items()
             },
             'percentage_distribution': {},
             'average_confidence': 0
         }
         
         # Calculate percentages
-        total = stats['total_questions']
         for level, count in stats['level_distribution'].items():
             stats['percentage_distribution'][level] = round((count / total * 100), 1) if total > 0 else 0
         
         # Calculate average confidence
-        confidences: List[float] = []
-        for questions in categorized.values():
-            for q in questions:
-                confidences.append(q.get('confidence', 0))
+        confidences = [confidence for level_confidences in confidences_by_level.values()
+                       for confidence in level_confidences]
         
         stats['average_confidence'] = round(sum(confidences) / len(confidences), 2) if confidences else 0
-        
         return stats
@@ -0,0 +1,49 @@
+import gzip
+import json
+from typing import Any, Iterable, Optional, Tuple
+
+# orjson and brotli are optional: without them responses use the standard
+# json module and only gzip is offered
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Compression effort suited to responses built per request rather than stored
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+
+def dumps_json(payload: Any) -> bytes:
+    """Encode payload as compact UTF-8 JSON, with orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+def available_encodings() -> Tuple[str, ...]:
+    """Content codings this process can produce, preferred first"""
+    return ('br', 'gzip') if brotli is not None else ('gzip',)
+
+def choose_encoding(accepted: Iterable[Tuple[str, float]]) -> Optional[str]:
+    """The preferred available coding among (coding, quality) pairs from Accept-Encoding, or None"""
+    qualities = {coding.lower(): quality for coding, quality in accepted}
+    wildcard = qualities.get('*', 0)
+    best = None
+    best_quality = 0.0
+    for coding in available_encodings():
+        quality = qualities.get(coding, wildcard)
+        if quality > best_quality:
+            best, best_quality = coding, quality
+    return best
+
+def compress(body: bytes, encoding: str) -> bytes:
+    """body compressed with a coding from :func:`available_encodings`"""
+    if encoding == 'br':
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    if encoding == 'gzip':
+        return gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+    raise ValueError(f"Unsupported content coding: {encoding}")
@@ -2,12 +2,20 @@
 """
 Telugu Q&A Generator - Run Script
 This script helps to run the application in different modes
+
+    python run.py                                  # development server
+    python run.py serve --workers 4 --threads 8    # production server
+    python run.py generate corpus/ -o qa.jsonl     # offline bulk generation
+    python run.py build-lexicons                   # precompile data/lexicons.json
 """
 
+import argparse
+import gc
 import os
 import sys
 import subprocess
 from pathlib import Path
+from typing import Any, Dict, List, Optional
 
 def check_python_version() -> None:
     """Check if Python version is compatible"""
@@ -49,6 +57,197 @@ def run_application() -> None:
     except Exception as e:
         print(f"❌ Error starting server: {e}")
 
+def run_production_server(args: argparse.Namespace) -> None:
+    """Run the application on a multi-worker production server"""
+    os.environ['QA_MAX_CONTENT_LENGTH'] = str(args.max_request_size)
+    
+    try:
+        from gunicorn.app.base import BaseApplication
+    except ImportError:
+        BaseApplication = None
+    
+    # Every server process has a batch pool of its own, so by default the
+    # CPUs are divided between them; one gunicorn worker per CPU means no
+    # pools and no intra-request parallelism
+    processes = args.workers if BaseApplication is not None else 1
+    batch_workers = args.batch_workers or max(1, (os.cpu_count() or 1) // max(1, processes))
+    os.environ['QA_BATCH_WORKERS'] = str(batch_workers)
+    # Each server and pool process reloads the lexicons on its own, so by
+    # default they wait for build-lexicons instead of each compiling edits
+    os.environ.setdefault('QA_LEXICON_RELOAD_WATCH', 'artifact')
+    
+    # Preload the app (and its NLP processor, lexicon artifact and NumPy)
+    # once in the master so the forked workers share its memory pages
+    # copy-on-write
+    from app import app
+    from question_level_analyzer import load_numpy
+    load_numpy()
+    gc.freeze()
+    
+    print("🚀 Starting Telugu Q&A Generator (production)...")
+    print(f"📱 Listening on http://{args.host}:{args.port}")
+    
+    if BaseApplication is None:
+        try:
+            from waitress import serve
+        except ImportError:
+            print("❌ No production server found. Install gunicorn or waitress")
+            sys.exit(1)
+        print(f"⚙️  waitress: 1 process × {args.threads} threads, {batch_workers} batch processes")
+        serve(
+            app,
+            host=args.host,
+            port=args.port,
+            threads=args.threads,
+            channel_timeout=args.timeout,
+            max_request_body_size=args.max_request_size
+        )
+        return
+    
+    class ProductionApplication(BaseApplication):  # type: ignore[misc, valid-type]
+        """Gunicorn application serving the preloaded Flask app"""
+        
+        def __init__(self, application: Any, options: Dict[str, Any]):
+            self.application = application
+            self.options = options
+            super().__init__()
+        
+        def load_config(self) -> None:
+            for key, value in self.options.items():
+                self.cfg.set(key, value)
+        
+        def load(self) -> Any:
+            return self.application
+    
+    print(f"⚙️  gunicorn: {args.workers} workers × {args.threads} threads, "
+          f"{batch_workers} batch processes per worker")
+    ProductionApplication(app, {
+        'bind': f"{args.host}:{args.port}",
+        'workers': args.workers,
+        'threads': args.threads,
+        'worker_class': 'gthread' if args.threads > 1 else 'sync',
+        'keepalive': args.keepalive,
+        'timeout': args.timeout,
+        'max_requests': args.max_requests,
+        'max_requests_jitter': args.max_requests // 10,
+        'limit_request_line': 8190,
+        'preload_app': True,
+        'accesslog': '-' if args.access_log else None
+    }).run()
+
+def build_lexicons(args: argparse.Namespace) -> None:
+    """Compile the lexicon data file and gazetteers into the precompiled artifact loaded at startup"""
+    from lexicons import build_artifact
+    
+    artifact = build_artifact(args.lexicons, args.output, args.gazetteers)
+    print(f"✅ Built {args.output or 'lexicon artifact'} version {artifact.version} "
+          f"(format {artifact.key['format']}, Python {'.'.join(map(str, artifact.key['python']))})")
+    for kind, gazetteer in artifact.gazetteers.items():
+        print(f"📚 {kind}: {len(gazetteer)} names")
+
+def run_bulk_generation(args: argparse.Namespace) -> None:
+    """Generate Q&A for files, directories or JSONL records without the web server"""
+    from bulk_generator import generate_jsonl
+    
+    if args.dedupe_index and not args.dedupe:
+        print("❌ --dedupe-index needs a --dedupe mode")
+        sys.exit(1)
+    options: Dict[str, Any] = {'num_questions': args.num_questions, 'difficulty': args.difficulty,
+                               'selection': args.selection}
+    print(f"📚 Generating Q&A for {', '.join(args.inputs)} → {args.output}")
+    print(f"⚙️  {args.workers} workers, {args.chunk_size} records per chunk")
+    try:
+        totals = generate_jsonl(
+            args.inputs,
+            args.output,
+            options,
+            workers=args.workers,
+            chunk_size=args.chunk_size,
+            resume=args.resume,
+            max_generic_questions=args.max_generic_questions,
+            dedupe=args.dedupe,
+            dedupe_index=args.dedupe_index,
+            dedupe_max_size=args.dedupe_max_size,
+            dedupe_threshold=args.dedupe_threshold,
+            bank=args.bank,
+            progress=lambda records, rate: print(f"⏳ {records} records, {rate:.1f} records/s")
+        )
+    except KeyboardInterrupt:
+        print("\n\n👋 Stopped; continue with --resume")
+        sys.exit(130)
+    except (OSError, ValueError) as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    
+    if totals['resumed_from']:
+        print(f"↩️  Resumed after {totals['resumed_from']} records")
+    rate = (totals['records'] - totals['resumed_from']) / max(totals['seconds'], 1e-9)
+    print(f"✅ {totals['records']} records ({totals['failed']} failed), {totals['questions']} questions "
+          f"in {totals['seconds']:.1f} s ({rate:.1f} records/s)")
+    if 'duplicates_removed' in totals:
+        print(f"🧹 {totals['duplicates_removed']} duplicate questions removed")
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Telugu Q&A Generator")
+    subparsers = parser.add_subparsers(dest='command')
+    
+    serve = subparsers.add_parser('serve', help='run the production server')
+    serve.add_argument('--host', default=os.environ.get('QA_HOST', '0.0.0.0'))
+    serve.add_argument('--port', type=int, default=int(os.environ.get('PORT', 5000)))
+    serve.add_argument('--workers', type=int, default=int(os.environ.get('QA_WORKERS', os.cpu_count() or 1)),
+                       help='worker processes (gunicorn only)')
+    serve.add_argument('--threads', type=int, default=int(os.environ.get('QA_THREADS', 4)),
+                       help='threads per worker')
+    serve.add_argument('--batch-workers', type=int, default=int(os.environ.get('QA_BATCH_WORKERS', 0)) or None,
+                       help='batch and large-paragraph processes per server process (default: CPUs / workers, '
+                            'so the default of one worker per CPU has no pools and no intra-request parallelism)')
+    serve.add_argument('--keepalive', type=int, default=int(os.environ.get('QA_KEEPALIVE', 5)),
+                       help='seconds to hold idle keep-alive connections')
+    serve.add_argument('--timeout', type=int, default=int(os.environ.get('QA_TIMEOUT', 60)),
+                       help='seconds before a busy worker is restarted')
+    serve.add_argument('--max-request-size', type=int,
+                       default=int(os.environ.get('QA_MAX_CONTENT_LENGTH', 1024 * 1024)),
+                       help='largest accepted request body in bytes')
+    serve.add_argument('--max-requests', type=int, default=int(os.environ.get('QA_MAX_REQUESTS', 0)),
+                       help='recycle a worker after this many requests (0 = never)')
+    serve.add_argument('--access-log', action='store_true', help='log every request')
+    
+    generate = subparsers.add_parser('generate', help='generate Q&A offline for files, directories or JSONL')
+    generate.add_argument('inputs', nargs='+',
+                          help='.txt files (paragraphs separated by blank lines), .jsonl files or directories')
+    generate.add_argument('-o', '--output', required=True, help='JSONL file to write, one line per paragraph')
+    generate.add_argument('--num-questions', type=int, default=5)
+    generate.add_argument('--difficulty', default='mixed', choices=['mixed', 'basic', 'intermediate', 'advanced'])
+    generate.add_argument('--selection', default='sequential', choices=['sequential', 'spread', 'balanced'])
+    generate.add_argument('--workers', type=int, default=int(os.environ.get('QA_BATCH_WORKERS', os.cpu_count() or 1)),
+                          help='worker processes (1 = in-process)')
+    generate.add_argument('--chunk-size', type=int, default=16, help='records sent to a worker at a time')
+    generate.add_argument('--max-generic-questions', type=int,
+                          default=int(os.environ.get('QA_MAX_GENERIC_QUESTIONS', 100)),
+                          help='most generic template questions per paragraph')
+    generate.add_argument('--resume', action='store_true',
+                          help='continue an interrupted run from its progress checkpoint')
+    generate.add_argument('--bank', default=os.environ.get('QA_BANK_PATH'),
+                          help='question bank SQLite file to store results in and reuse them from')
+    generate.add_argument('--dedupe', choices=['exact', 'normalized', 'near'],
+                          help='drop questions repeating one written earlier in the run')
+    generate.add_argument('--dedupe-index',
+                          help='file of questions from earlier runs to dedupe against, updated at the end of the run')
+    generate.add_argument('--dedupe-max-size', type=int, default=1_000_000,
+                          help='most questions remembered for deduplication, oldest forgotten first')
+    generate.add_argument('--dedupe-threshold', type=float, default=0.8,
+                          help='MinHash similarity at which --dedupe near treats questions as the same')
+    
+    lexicons = subparsers.add_parser('build-lexicons', help='precompile the lexicon data file and gazetteers')
+    lexicons.add_argument('--lexicons', help='lexicon JSON file (default: data/lexicons.json or QA_LEXICON_PATH)')
+    lexicons.add_argument('--gazetteers',
+                          help='directory of gazetteer .txt files (default: data/gazetteers or QA_GAZETTEER_DIR)')
+    lexicons.add_argument('-o', '--output',
+                          help='artifact to write (default: data/lexicons.pickle or QA_LEXICON_ARTIFACT)')
+    
+    return parser.parse_args(argv)
+
 def install_dependencies() -> None:
     """Install required dependencies"""
     print("📦 Installing dependencies...")
@@ -61,9 +260,26 @@ def install_dependencies() -> None:
 
 def main() -> None:
     """Main function"""
+    args = parse_args()
+    
     print("🌟 Telugu Q&A Generator - Setup & Run")
     print("=" * 50)
     
+    if args.command == 'serve':
+        check_python_version()
+        check_dependencies()
+        run_production_server(args)
+        return
+    
+    if args.command == 'generate':
+        check_python_version()
+        run_bulk_generation(args)
+        return
+    
+    if args.command == 'build-lexicons':
+        build_lexicons(args)
+        return
+    
     # Check Python version
     check_python_version()
     
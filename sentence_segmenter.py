@@ -0,0 +1,143 @@
+import mmap
+import re
+from array import array
+from typing import IO, Iterable, Iterator, List, NamedTuple, Sequence, Tuple, Union, overload
+
+# Characters (or bytes) read from file objects at a time
+CHUNK_SIZE = 64 * 1024
+
+# Anything SentenceSegmenter.iter_sentences can read
+SentenceSource = Union[str, IO[str], IO[bytes], mmap.mmap]
+
+class Sentence(NamedTuple):
+    """A stripped sentence and its [start, end) offsets in the source
+
+    Offsets count characters for str and text-file sources, and bytes for
+    binary files and memory maps.
+    """
+    text: str
+    start: int
+    end: int
+
+class SentenceSpans(Sequence[str]):
+    """The sentences of a text, stored as offsets and sliced out on access"""
+
+    def __init__(self, text: str, starts: 'array[int]', ends: 'array[int]'):
+        self.text = text
+        self.starts = starts
+        self.ends = ends
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+    @overload
+    def __getitem__(self, index: slice) -> List[str]: ...
+    def __getitem__(self, index: Union[int, slice]) -> Union[str, List[str]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return self.text[self.starts[index]:self.ends[index]]
+
+class SentenceSegmenter:
+    """Splits text into stripped, non-empty sentences at a fixed set of endings
+
+    Sentences are the pieces between ending characters with surrounding
+    whitespace removed, like ``re.split`` followed by ``strip`` but without
+    building either list.  Strings are scanned in place with one compiled
+    pattern; file objects are read in chunks, carrying the unfinished last
+    sentence over to the next chunk; memory maps are scanned as bytes and
+    only the sentences themselves are decoded.
+    """
+
+    def __init__(self, endings: Iterable[str], chunk_size: int = CHUNK_SIZE):
+        self.endings = list(endings)
+        self.chunk_size = chunk_size
+        ending_class = ''.join(map(re.escape, self.endings))
+        # A run of non-ending characters from its first to its last non-space
+        self._sentence = re.compile(f'[^{ending_class}\\s](?:[^{ending_class}]*[^{ending_class}\\s])?')
+        self._encoded_endings = [ending.encode('utf-8') for ending in self.endings]
+        self._byte_boundary = re.compile(b'|'.join(map(re.escape, self._encoded_endings)))
+
+    def iter_spans(self, text: str) -> Iterator[Tuple[int, int]]:
+        """Yield the [start, end) character offsets of each sentence of text"""
+        for match in self._sentence.finditer(text):
+            yield match.span()
+
+    def iter_strings(self, text: str) -> Iterator[str]:
+        """Yield the sentences of text"""
+        for match in self._sentence.finditer(text):
+            yield match.group()
+
+    def spans(self, text: str) -> SentenceSpans:
+        """All sentences of text as compact offsets"""
+        starts, ends = array('q'), array('q')
+        for match in self._sentence.finditer(text):
+            start, end = match.span()
+            starts.append(start)
+            ends.append(end)
+        return SentenceSpans(text, starts, ends)
+
+    def iter_sentences(self, source: SentenceSource) -> Iterator[Sentence]:
+        """Yield the sentences of a string, text or binary file object, or memory-mapped UTF-8 file"""
+        if isinstance(source, str):
+            for match in self._sentence.finditer(source):
+                yield Sentence(match.group(), *match.span())
+        elif isinstance(source, mmap.mmap):
+            yield from self._iter_buffer(source, 0, len(source), 0)
+        else:
+            yield from self._iter_file(source)
+
+    def _iter_file(self, handle: Union[IO[str], IO[bytes]]) -> Iterator[Sentence]:
+        """Read a file object in chunks, holding back the text after its last ending"""
+        pending: Union[str, bytes, None] = None
+        offset = 0
+        while True:
+            chunk = handle.read(self.chunk_size)
+            if not chunk:
+                break
+            pending = chunk if pending is None else pending + chunk  # type: ignore[operator]
+            cut = self._last_boundary(pending)
+            if cut <= 0:
+                continue
+            if isinstance(pending, str):
+                for match in self._sentence.finditer(pending, 0, cut):
+                    yield Sentence(match.group(), offset + match.start(), offset + match.end())
+            else:
+                yield from self._iter_buffer(pending, 0, cut, offset)
+            pending = pending[cut:]
+            offset += cut
+        if pending:
+            if isinstance(pending, str):
+                for match in self._sentence.finditer(pending):
+                    yield Sentence(match.group(), offset + match.start(), offset + match.end())
+            else:
+                yield from self._iter_buffer(pending, 0, len(pending), offset)
+
+    def _last_boundary(self, text: Union[str, bytes]) -> int:
+        """Offset just past the last ending in text, or 0 when it has none"""
+        endings = self.endings if isinstance(text, str) else self._encoded_endings
+        cut = 0
+        for ending in endings:
+            position = text.rfind(ending)  # type: ignore[arg-type]
+            if position >= 0:
+                cut = max(cut, position + len(ending))
+        return cut
+
+    def _iter_buffer(self, buffer: Union[bytes, mmap.mmap], start: int, end: int, offset: int) -> Iterator[Sentence]:
+        """Yield the sentences of UTF-8 bytes between start and end, with byte offsets"""
+        position = start
+        for boundary in self._byte_boundary.finditer(buffer, start, end):
+            yield from self._decode_piece(buffer, position, boundary.start(), offset)
+            position = boundary.end()
+        yield from self._decode_piece(buffer, position, end, offset)
+
+    @staticmethod
+    def _decode_piece(buffer: Union[bytes, mmap.mmap], start: int, end: int, offset: int) -> Iterator[Sentence]:
+        """Decode and strip one piece between endings, yielding it when non-empty"""
+        piece = buffer[start:end].decode('utf-8')
+        text = piece.strip()
+        if text:
+            leading = len(piece[:len(piece) - len(piece.lstrip())].encode('utf-8'))
+            first = offset + start + leading
+            yield Sentence(text, first, first + len(text.encode('utf-8')))
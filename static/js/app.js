@@ -47,7 +47,7 @@ async function handleFormSubmit(event) {
     scrollToResults();
     
     try {
-        const response = await fetch('/api/generate-qa', {
+        const response = await fetch('/api/generate-qa/stream', {
             method: 'POST',
             headers: {
                 'Content-Type': 'application/json',
@@ -55,20 +55,39 @@ async function handleFormSubmit(event) {
             body: JSON.stringify({ 
                 paragraph: paragraph,
                 num_questions: numQuestions,
-                difficulty: difficulty
+                difficulty: difficulty,
+                compact: true
             })
         });
         
-        const data = await response.json();
-        
-        if (data.success) {
-            currentQAPairs = data.qa_pairs;
-            originalParagraph = paragraph;
-            displayResults(data.qa_pairs);
-        } else {
+        if (!response.ok) {
+            const data = await response.json();
             showAlert(data.error || 'ప్రశ్నలు రూపొందించడంలో లోపం', 'danger');
             showResultsSection(false); // Hide on error
+            return;
         }
+        
+        currentQAPairs = [];
+        originalParagraph = paragraph;
+        clearResults();
+        
+        // Render each question as soon as it arrives; in the compact form
+        // context sentences arrive once, ahead of the first question using them
+        const sentences = [];
+        await readEventStream(response, (message) => {
+            if (message.event === 'sentence') {
+                sentences[message.index] = message.sentence;
+            } else if (message.event === 'qa') {
+                showLoading(false);
+                const qa = expandCompactPair(message.qa, sentences);
+                currentQAPairs.push(qa);
+                appendResult(qa, currentQAPairs.length - 1);
+            } else if (message.event === 'done') {
+                displayResults(currentQAPairs);
+            } else if (message.event === 'error') {
+                showAlert(message.error || 'ప్రశ్నలు రూపొందించడంలో లోపం', 'danger');
+            }
+        });
     } catch (error) {
         console.error('Error:', error);
         showAlert('సర్వర్ లోపం. దయచేసి తిరిగి ప్రయత్నించండి', 'danger');
@@ -78,6 +97,43 @@ async function handleFormSubmit(event) {
     }
 }
 
+// Read a newline-delimited JSON response, calling onMessage for every line
+async function readEventStream(response, onMessage) {
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder('utf-8');
+    let buffer = '';
+    
+    while (true) {
+        const { value, done } = await reader.read();
+        buffer += decoder.decode(value || new Uint8Array(), { stream: !done });
+        
+        let newline;
+        while ((newline = buffer.indexOf('\n')) >= 0) {
+            const line = buffer.slice(0, newline).trim();
+            buffer = buffer.slice(newline + 1);
+            if (line) {
+                onMessage(JSON.parse(line));
+            }
+        }
+        
+        if (done) {
+            if (buffer.trim()) {
+                onMessage(JSON.parse(buffer));
+            }
+            return;
+        }
+    }
+}
+
+// Turn a compact pair, whose "sentence" indexes the sentence table, back into one with its "context"
+function expandCompactPair(qa, sentences) {
+    if (qa.sentence === undefined) {
+        return qa;
+    }
+    const { sentence, ...rest } = qa;
+    return { ...rest, context: sentences[sentence] };
+}
+
 // Display results
 function displayResults(qaPairs) {
     const resultsContent = document.getElementById('resultsContent');
@@ -95,13 +151,43 @@ function displayResults(qaPairs) {
     
     let html = `
         <div class="mb-3">
-            <h5 class="text-primary">మొత్తం ప్రశ్నలు: ${qaPairs.length}</h5>
+            <h5 class="text-primary">మొత్తం ప్రశ్నలు: <span id="resultsCount">${qaPairs.length}</span></h5>
         </div>
-        <div class="row">
+        <div class="row" id="resultsList">
     `;
     
     qaPairs.forEach((qa, index) => {
-        html += `
+        html += renderResult(qa, index);
+    });
+    
+    html += '</div>';
+    resultsContent.innerHTML = html;
+}
+
+function clearResults() {
+    const resultsContent = document.getElementById('resultsContent');
+    if (resultsContent) {
+        resultsContent.innerHTML = '';
+    }
+}
+
+// Append a single result while questions are still streaming in
+function appendResult(qa, index) {
+    const resultsList = document.getElementById('resultsList');
+    if (!resultsList) {
+        displayResults([qa]);
+        return;
+    }
+    
+    resultsList.insertAdjacentHTML('beforeend', renderResult(qa, index));
+    const resultsCount = document.getElementById('resultsCount');
+    if (resultsCount) {
+        resultsCount.textContent = index + 1;
+    }
+}
+
+function renderResult(qa, index) {
+    return `
             <div class="col-12 mb-4">
                 <div class="card border-primary">
                     <div class="card-header bg-primary text-white">
@@ -125,10 +211,6 @@ function displayResults(qaPairs) {
                 </div>
             </div>
         `;
-    });
-    
-    html += '</div>';
-    resultsContent.innerHTML = html;
 }
 
 // Utility functions
@@ -1,80 +1,266 @@
 import re
-from typing import List, Dict, Any
+from collections import deque
+from concurrent.futures import Executor, Future
+from itertools import chain, islice
+from math import gcd
+from typing import List, Dict, Any, Callable, Deque, Iterable, Iterator, Optional, Pattern, Sequence, Tuple
 import logging
-from question_level_analyzer import QuestionLevelAnalyzer
+import time
+from gazetteer import Gazetteer
+from lexicons import LexiconWatcher, lexicons_version, load_artifact, reload_artifact
+from metrics import RequestMetrics
+from question_level_analyzer import NUMPY_MIN_BATCH, QuestionLevelAnalyzer
+from qa_cache import LRUCache, QAResultCache
+from qa_record import LevelInfo, QARecord, QARecordSet, pack_sentence_records, unpack_sentence_records
+from question_bank import QuestionBank, sentence_spans
+from question_index import QuestionIndex
+from sentence_segmenter import Sentence, SentenceSegmenter, SentenceSource
+
+_WORD_PREFIX = re.compile(r'\w*')
+_WORD_CHAR = re.compile(r'\w')
+_DIGIT_RUN = re.compile(r'\d+')
+
+# Sentences analyzed together when a request is large enough for batch level analysis
+SENTENCE_BATCH_SIZE = 32
+
+# Intra-request parallelism: requests expected to analyze at least
+# PARALLEL_MIN_SENTENCES sentences shard them over the worker pool in chunks
+# of PARALLEL_CHUNK_SIZE, keeping at most parallel_window chunks in flight
+PARALLEL_MIN_SENTENCES = 256
+PARALLEL_CHUNK_SIZE = 64
+
+# How pairs are chosen when fewer are requested than the text yields
+SELECTION_STRATEGIES = ('sequential', 'spread', 'balanced')
 
 class TeluguNLPProcessor:
     """Advanced Telugu NLP processor for Q&A generation"""
     
-    def __init__(self):
+    # Attributes built from the lexicons by __init__ and shared through the lexicon artifact
+    COMPILED_ATTRIBUTES = ('segmenter', 'gazetteers', '_entity_pattern', '_entity_index', '_entity_head_sizes',
+                           '_entity_fallbacks')
+    
+    def __init__(self, result_cache: Optional[QAResultCache] = None, sentence_cache_size: int = 4096,
+                 max_generic_questions: int = 100, lexicons: Optional[Dict[str, Any]] = None,
+                 gazetteers: Optional[Dict[str, Gazetteer]] = None, question_bank: Optional[QuestionBank] = None,
+                 parallel_executor: Optional[Callable[[], Optional[Executor]]] = None,
+                 parallel_min_sentences: int = PARALLEL_MIN_SENTENCES, parallel_window: int = 8):
+        """Use the given lexicon data (as in data/lexicons.json) and gazetteers, or the compiled lexicons of the data files
+        
+        ``parallel_executor`` returns a pool from :func:`create_batch_executor`
+        (or None) when a single paragraph is large enough to shard its
+        sentences over it; see :meth:`iter_analyzed_sentences`.
+        """
         self.logger = logging.getLogger(__name__)
-        self.level_analyzer = QuestionLevelAnalyzer()
+        self.result_cache = result_cache
+        
+        # Intra-request parallelism over a shared worker pool, created on first use
+        self.parallel_executor = parallel_executor
+        self.parallel_min_sentences = parallel_min_sentences
+        self.parallel_window = max(1, parallel_window)
+        
+        # Persistent store of generated results, consulted after the result cache
+        self.question_bank = question_bank
+        artifact = None
+        if lexicons is None:
+            artifact = load_artifact()
+            words = artifact.section('processor')
+            self.level_analyzer = QuestionLevelAnalyzer()
+        else:
+            words = lexicons['processor']
+            self.level_analyzer = QuestionLevelAnalyzer(lexicons['analyzer'])
+        
+        # Identifies the lexicons in result cache keys, so results of older lexicons are not served
+        self.lexicon_version = (
+            artifact.version if artifact is not None else lexicons_version(lexicons, gazetteers)  # type: ignore[arg-type]
+        )
+        
+        # Most generic template questions added to a single result
+        self.max_generic_questions = max_generic_questions
+        
+        # Analyzed questions per sentence, shared across requests
+        self.sentence_cache: Optional[LRUCache[Tuple[QARecord, ...]]] = (
+            LRUCache(sentence_cache_size) if sentence_cache_size > 0 else None
+        )
         
         # Telugu question patterns
-        self.question_patterns = {
-            'who': ['ఎవరు', 'ఎవరి', 'ఎవరిని', 'ఎవరి ద్వారా'],
-            'what': ['ఏమిటి', 'ఏమి', 'ఏది', 'ఏం'],
-            'when': ['ఎప్పుడు', 'ఏ సమయంలో', 'ఏ కాలంలో'],
-            'where': ['ఎక్కడ', 'ఏ ప్రదేశంలో', 'ఏ చోట'],
-            'why': ['ఎందుకు', 'ఏ కారణంగా', 'ఎందుకంటే'],
-            'how': ['ఎలా', 'ఏ విధంగా', 'ఏ విధంగా']
-        }
+        self.question_patterns: Dict[str, List[str]] = words['question_patterns']
         
         # Telugu sentence endings
-        self.sentence_endings = ['.', '!', '?', '।', '॥']
+        self.sentence_endings: List[str] = words['sentence_endings']
         
         # Common Telugu words for analysis
-        self.common_verbs = ['చేశాడు', 'చేశారు', 'చేసింది', 'ఉంది', 'ఉన్నాడు', 'వచ్చాడు', 'పోయాడు']
-        self.common_nouns = ['వ్యక్తి', 'స్థలం', 'సమయం', 'విషయం', 'పని', 'ఘటన']
+        self.common_verbs: List[str] = words['common_verbs']
+        self.common_nouns: List[str] = words['common_nouns']
+
+        # Entity lexicons
+        self.person_suffixes: List[str] = words['person_suffixes']
+        self.location_indicators: List[str] = words['location_indicators']
+        self.day_marker: str = words['day_marker']
+        self.month_marker: str = words['month_marker']
+        
+        # Keywords that introduce a cause (why) or a manner (how)
+        self.why_keywords: List[str] = words['why_keywords']
+        self.how_keywords: List[str] = words['how_keywords']
+        
+        # Templates for generic questions when sentences yield too few
+        self.generic_question_templates: List[Tuple[str, str]] = [
+            (template, question_type) for template, question_type in words['generic_question_templates']
+        ]
+
+        if artifact is None:
+            self.segmenter = SentenceSegmenter(self.sentence_endings)
+            # Name lists from gazetteer files, by entity bucket
+            self.gazetteers: Dict[str, Gazetteer] = dict(gazetteers or {})
+            self._build_entity_index()
+        else:
+            self.__dict__.update(artifact.compiled['processor'])
     
+    def compiled_state(self) -> Dict[str, Any]:
+        """The segmenter, gazetteers, entity pattern and tables built from the current lexicons"""
+        return {name: getattr(self, name) for name in self.COMPILED_ATTRIBUTES}
+
+    def _build_entity_index(self) -> None:
+        """Compile the entity lexicons into a lookup keyed by word-run endings.
+
+        Every entity pattern is a run of word characters followed by a literal.
+        Each literal is split into its leading word characters (the part that
+        ends the run) and the remaining tail, which starts with a non-word
+        character such as a vowel sign.  A sentence is then scanned once with
+        a single compiled pattern, and only the runs it reports are resolved
+        against the lexicon by dictionary lookup.
+
+        A literal ending in a word character, such as the place suffix 'పేట',
+        does not end a run, so it keeps a pattern of its own in the original
+        form (a word run followed by the literal) and is matched separately.
+        """
+        index: Dict[str, List[Tuple[str, int, str]]] = {}
+        fallbacks: List[Tuple[str, int, Pattern[str]]] = []
+
+        def add(kind: str, position: int, literal: str, run: str = r'\w+') -> None:
+            head = _WORD_PREFIX.match(literal).group()
+            tail = literal[len(head):]
+            if not tail or _WORD_CHAR.match(literal[-1]):
+                fallbacks.append((kind, position, re.compile(run + re.escape(literal))))
+                return
+            index.setdefault(head, []).append((kind, position, tail))
+
+        for position, suffix in enumerate(self.person_suffixes):
+            add('person', position, suffix)
+        for position, indicator in enumerate(self.location_indicators):
+            add('location', position, indicator)
+        add('day', 0, self.day_marker, r'\d{1,2}')
+        add('month', 0, self.month_marker)
+
+        # One pattern finds every word run that ends in a lexicon head and is
+        # followed by its tail, plus bare digit runs for years.  The run is
+        # captured in a lookahead so the regex engine never backtracks into it.
+        endings = sorted({
+            (f'(?<={re.escape(head)})' if head else '') + f'(?={re.escape(tail)})'
+            for head, entries in index.items()
+            for _, _, tail in entries
+        })
+        self._entity_pattern = re.compile(
+            r'(?<!\w)(?=(?P<run>\w+))(?P=run)(?:' + '|'.join(endings) + r')(?P<entity>)'
+            r'|(?P<digits>\d+)'
+        )
+        self._entity_index = index
+        self._entity_head_sizes = sorted({len(head) for head in index})
+        self._entity_fallbacks = fallbacks
+
     def split_sentences(self, text: str) -> List[str]:
         """Split Telugu text into sentences"""
-        # Split by sentence endings
-        pattern = '|'.join(map(re.escape, self.sentence_endings))
-        sentences = re.split(pattern, text)
-        return [s.strip() for s in sentences if s.strip()]
+        return list(self.iter_sentences(text))
+    
+    def iter_sentences(self, text: str) -> Iterator[str]:
+        """Yield the non-empty, stripped sentences of Telugu text one at a time"""
+        return self.segmenter.iter_strings(text)
+    
+    def iter_sentence_spans(self, source: SentenceSource) -> Iterator[Sentence]:
+        """Yield the sentences of a string, file object or memory-mapped UTF-8 file with their offsets"""
+        return self.segmenter.iter_sentences(source)
     
     def extract_entities(self, sentence: str) -> Dict[str, List[str]]:
         """Extract entities from Telugu sentence"""
+        # Matches are grouped per lexicon entry so the output keeps the
+        # original ordering: persons by suffix, locations by indicator (first
+        # occurrence only), then years, day numbers and months.
+        persons: List[List[str]] = [[] for _ in self.person_suffixes]
+        person_ends = [0] * len(self.person_suffixes)
+        locations: List[Optional[str]] = [None] * len(self.location_indicators)
+        years: List[str] = []
+        days: List[str] = []
+        months: List[str] = []
+        day_end = month_end = 0
+
+        for match in self._entity_pattern.finditer(sentence):
+            start, end = match.span()
+            run = match.group()
+
+            # Years: every four digits of a digit run
+            if not run.isalpha():
+                for digits in _DIGIT_RUN.finditer(sentence, start, end):
+                    digit_start, digit_end = digits.span()
+                    for year_start in range(digit_start, digit_end - 3, 4):
+                        years.append(sentence[year_start:year_start + 4])
+
+            if match.lastgroup != 'entity':
+                continue
+
+            for size in self._entity_head_sizes:
+                if size >= len(run):
+                    break
+                candidates = self._entity_index.get(run[len(run) - size:])
+                if not candidates:
+                    continue
+                for kind, position, tail in candidates:
+                    if not sentence.startswith(tail, end):
+                        continue
+                    match_end = end + len(tail)
+                    if kind == 'person':
+                        if start >= person_ends[position]:
+                            persons[position].append(sentence[start:match_end])
+                            person_ends[position] = match_end
+                    elif kind == 'location':
+                        if locations[position] is None:
+                            locations[position] = sentence[start:match_end]
+                    elif kind == 'month':
+                        if start >= month_end:
+                            months.append(sentence[start:match_end])
+                            month_end = match_end
+                    else:
+                        # Day numbers keep at most two digits before the marker
+                        head_start = end - size
+                        day_start = head_start
+                        while day_start > max(start, head_start - 2) and sentence[day_start - 1].isdecimal():
+                            day_start -= 1
+                        if day_start < head_start and day_start >= day_end:
+                            days.append(sentence[day_start:match_end])
+                            day_end = match_end
+
+        for kind, position, pattern in self._entity_fallbacks:
+            if kind == 'person':
+                persons[position] = pattern.findall(sentence)
+            elif kind == 'location':
+                match = pattern.search(sentence)
+                locations[position] = match.group() if match else None
+            elif kind == 'day':
+                days = pattern.findall(sentence)
+            else:
+                months = pattern.findall(sentence)
+
         entities: Dict[str, List[str]] = {
-            'persons': [],
-            'locations': [],
-            'dates': [],
+            'persons': [person for matches in persons for person in matches],
+            'locations': [location for location in locations if location is not None],
+            'dates': years + days + months,
             'organizations': []
         }
         
-        # Simple entity extraction based on patterns
-        # Persons (looking for names ending with specific patterns)
-        person_patterns = [
-            r'(\w+రావు)',  # Names ending with రావు
-            r'(\w+కుమార్)',  # Names ending with కుమార్
-            r'(\w+దేవి)',  # Names ending with దేవి
-        ]
-        
-        for pattern in person_patterns:
-            matches = re.findall(pattern, sentence)
-            entities['persons'].extend(matches)
-        
-        # Locations (looking for common location indicators)
-        location_indicators = ['నగరం', 'పల్లె', 'గ్రామం', 'పట్టణం', 'రాష్ట్రం']
-        for indicator in location_indicators:
-            if indicator in sentence:
-                # Extract word before the indicator
-                match = re.search(r'(\w+)' + indicator, sentence)
-                if match:
-                    entities['locations'].append(match.group(1) + indicator)
-        
-        # Dates (simple patterns)
-        date_patterns = [
-            r'\d{4}',  # Years
-            r'\d{1,2}వ తేదీ',  # Dates
-            r'\w+ మాసం',  # Months
-        ]
-        
-        for pattern in date_patterns:
-            matches = re.findall(pattern, sentence)
-            entities['dates'].extend(matches)
-        
+        # Gazetteer names follow the pattern matches, each name once
+        for kind, gazetteer in self.gazetteers.items():
+            found = entities[kind]
+            for name in gazetteer.find(sentence):
+                if name not in found:
+                    found.append(name)
         return entities
     
     def generate_question_from_sentence(self, sentence: str, entities: Dict[str, List[str]]) -> List[Dict[str, str]]:
@@ -94,6 +280,11 @@ class TeluguNLPProcessor:
                 question_text = sentence.replace(location, 'ఎక్కడ', 1) + "?"
                 questions.append({'question': question_text, 'answer': location, 'type': 'where'})
 
+        # Generate WHICH-ORGANIZATION questions
+        for organization in entities['organizations']:
+            question_text = sentence.replace(organization, 'ఏ సంస్థ', 1) + "?"
+            questions.append({'question': question_text, 'answer': organization, 'type': 'who'})
+
         # Generate WHEN questions
         if entities['dates']:
             for date in entities['dates']:
@@ -101,7 +292,7 @@ class TeluguNLPProcessor:
                 questions.append({'question': question_text, 'answer': date, 'type': 'when'})
 
         # Generate WHY questions based on keywords
-        why_keywords = ['కారణంగా', 'వల్ల', 'ఎందుకంటే']
+        why_keywords = self.why_keywords
         if any(keyword in sentence for keyword in why_keywords):
             # Attempt to find the clause before the keyword
             for keyword in why_keywords:
@@ -113,7 +304,7 @@ class TeluguNLPProcessor:
                         break
 
         # Generate HOW questions based on keywords
-        how_keywords = ['విధంగా', 'ద్వారా']
+        how_keywords = self.how_keywords
         if any(keyword in sentence for keyword in how_keywords):
             for keyword in how_keywords:
                 if keyword in sentence:
@@ -133,124 +324,662 @@ class TeluguNLPProcessor:
             
         return questions
     
-    def generate_qa_pairs(self, paragraph: str, num_questions: int = 5, difficulty: str = 'mixed') -> List[Dict[str, Any]]:
+    def generate_qa_pairs(self, paragraph: str, num_questions: int = 5, difficulty: str = 'mixed',
+                          metrics: Optional[RequestMetrics] = None, selection: str = 'sequential') -> List[Dict[str, Any]]:
         """Generate Q&A pairs from Telugu paragraph"""
+        return self.generate_qa_records(paragraph, num_questions, difficulty, metrics, selection).to_dicts()
+    
+    def generate_qa_records(self, paragraph: str, num_questions: int = 5, difficulty: str = 'mixed',
+                            metrics: Optional[RequestMetrics] = None, selection: str = 'sequential') -> QARecordSet:
+        """Generate Q&A pairs from Telugu paragraph as compact records"""
+        records = QARecordSet()
         try:
-            # Split paragraph into sentences
-            sentences = self.split_sentences(paragraph)
+            records.records.extend(
+                self._iter_qa_records(paragraph, num_questions, difficulty, metrics, selection, records)
+            )
+            return records
             
-            qa_pairs: List[Dict[str, Any]] = []
+        except Exception as e:
+            self.logger.error(f"Error generating Q&A: {str(e)}")
+            return QARecordSet()
+    
+    def generate_qa_pairs_cached(self, paragraph: str, num_questions: int = 5, difficulty: str = 'mixed',
+                                 metrics: Optional[RequestMetrics] = None, selection: str = 'sequential') -> List[Dict[str, Any]]:
+        """Generate Q&A pairs, serving repeated paragraphs from the result cache or question bank when set"""
+        qa_pairs, _ = self._generate_cached(paragraph, num_questions, difficulty, metrics, selection)
+        return qa_pairs
+    
+    def _generate_cached(self, paragraph: str, num_questions: int, difficulty: str,
+                         metrics: Optional[RequestMetrics], selection: str,
+                         source: Optional[str] = None) -> Tuple[List[Dict[str, Any]], Optional[QARecordSet]]:
+        """Return Q&A pairs, plus their records when they were generated rather than read from the cache or bank"""
+        # Only sequential results are prefixes of larger results, which the cache relies on
+        cacheable = self.result_cache is not None and selection == 'sequential'
+        if not cacheable and self.question_bank is None:
+            records = self.generate_qa_records(paragraph, num_questions, difficulty, metrics, selection)
+            return records.to_dicts(), records
+        try:
+            num_questions = int(num_questions)
+        except (TypeError, ValueError):
+            records = self.generate_qa_records(paragraph, num_questions, difficulty, metrics)
+            return records.to_dicts(), records
+        
+        key = self.result_key(paragraph, difficulty)
+        if cacheable:
+            start = time.perf_counter() if metrics is not None else 0.0
+            qa_pairs = self.result_cache.get(key, num_questions)  # type: ignore[union-attr]
+            if metrics is not None:
+                metrics.add_time('result_cache', start)
+                metrics.count('result_cache_hits' if qa_pairs is not None else 'result_cache_misses')
+            if qa_pairs is not None:
+                return qa_pairs, None
+        if self.question_bank is not None:
+            start = time.perf_counter() if metrics is not None else 0.0
+            qa_pairs = self.question_bank.get(key, num_questions, selection)
+            if metrics is not None:
+                metrics.add_time('question_bank', start)
+                metrics.count('question_bank_hits' if qa_pairs is not None else 'question_bank_misses')
+            if qa_pairs is not None:
+                if cacheable:
+                    self.result_cache.put(key, num_questions, qa_pairs)  # type: ignore[union-attr]
+                if source is not None:
+                    self.question_bank.set_source(key, selection, source)
+                return qa_pairs, None
+        
+        records = self.generate_qa_records(paragraph, num_questions, difficulty, metrics, selection)
+        qa_pairs = records.to_dicts()
+        if cacheable:
+            self.result_cache.put(key, num_questions, qa_pairs)  # type: ignore[union-attr]
+        if self.question_bank is not None:
+            self.bank_result(paragraph, num_questions, difficulty, selection, qa_pairs, source, metrics)
+        return qa_pairs, records
+    
+    def result_key(self, paragraph: str, difficulty: str) -> str:
+        """Result cache and question bank key of a paragraph under this processor's lexicons and settings"""
+        return QAResultCache.make_key(paragraph, difficulty, self.lexicon_version, self.max_generic_questions)
+    
+    def bank_result(self, paragraph: str, num_questions: int, difficulty: str, selection: str,
+                    qa_pairs: List[Dict[str, Any]], source: Optional[str] = None,
+                    metrics: Optional[RequestMetrics] = None) -> None:
+        """Store a generated result in the question bank, with its context sentences' offsets"""
+        if self.question_bank is None:
+            return
+        start = time.perf_counter() if metrics is not None else 0.0
+        key = self.result_key(paragraph, difficulty)
+        self.question_bank.put(key, paragraph, difficulty, selection, self.lexicon_version, num_questions, qa_pairs,
+                               sentence_spans(self.iter_sentence_spans(paragraph)), source)
+        if metrics is not None:
+            metrics.add_time('question_bank', start)
+    
+    def iter_qa_pairs(self, paragraph: str, num_questions: int = 5, difficulty: str = 'mixed',
+                      metrics: Optional[RequestMetrics] = None, selection: str = 'sequential') -> Iterator[Dict[str, Any]]:
+        """Yield Q&A pairs from Telugu paragraph as they are produced
+        
+        Sentences flow one at a time through entity extraction, question
+        generation, de-duplication, level analysis and the difficulty filter,
+        and generation stops as soon as ``num_questions`` pairs have been
+        yielded.  The pairs are the same, in the same order, as those returned
+        by :meth:`generate_qa_pairs`.
+        
+        When ``metrics`` is given, per-stage timings and counts are added to it.
+        
+        ``selection`` picks which pairs are kept when the text yields more than
+        requested: ``sequential`` takes them in text order, ``spread`` visits
+        sentences evenly across the whole text, and ``balanced`` additionally
+        round-robins over question types.  The non-sequential strategies yield
+        once their selection is complete, in text order.
+        """
+        records = QARecordSet()
+        for record in self._iter_qa_records(paragraph, num_questions, difficulty, metrics, selection, records):
+            yield record.to_dict(records.contexts)
+    
+    def _iter_qa_records(self, paragraph: str, num_questions: int, difficulty: str,
+                         metrics: Optional[RequestMetrics], selection: str, records: QARecordSet) -> Iterator[QARecord]:
+        """Yield the records behind :meth:`iter_qa_pairs`, adding their contexts to ``records``"""
+        if selection not in SELECTION_STRATEGIES:
+            raise ValueError(f"Unknown selection strategy: {selection}")
+        num_questions = int(num_questions)
+        if num_questions <= 0:
+            return
+        if selection != 'sequential':
+            yield from self._select_qa_records(paragraph, num_questions, difficulty, selection, metrics, records)
+            return
+        
+        seen: set[str] = set()
+        produced = 0
+        
+        sentences = self.iter_sentences(paragraph)
+        if metrics is not None:
+            sentences = metrics.timed('split_sentences', sentences)
+        
+        for sentence, analyzed in self._iter_analyzed_sentences(sentences, num_questions, difficulty, metrics):
+            if metrics is not None:
+                metrics.count('sentences')
+                metrics.count('questions_generated', len(analyzed))
             
-            for sentence in sentences:
-                if len(sentence) < 10:  # Skip very short sentences
+            context = -1
+            for record in analyzed:
+                # Remove duplicates
+                if record.question in seen:
                     continue
+                seen.add(record.question)
                 
-                # Extract entities
-                entities = self.extract_entities(sentence)
-                
-                # Generate questions
-                questions = self.generate_question_from_sentence(sentence, entities)
-                
-                # Add context to each question
-                for q in questions:
-                    q['context'] = sentence
+                # Filter by difficulty
+                if difficulty != 'mixed' and record.level_info.level != difficulty:
+                    continue
                 
-                # Add to Q&A pairs
-                qa_pairs.extend(questions)
-            
-            # Remove duplicates
-            unique_qa: List[Dict[str, Any]] = []
-            seen: set[str] = set()
-            for qa in qa_pairs:
-                key = qa['question']
-                if key not in seen:
-                    seen.add(key)
-                    unique_qa.append(qa)
+                if context < 0:
+                    context = records.context_index(sentence)
+                yield record.with_context(context)
+                produced += 1
+                if metrics is not None:
+                    metrics.count('questions_returned')
+                if produced >= num_questions:
+                    return
+        
+        # If not enough questions, add more generic ones to meet the count
+        generic = self._iter_generic_questions(self.segmenter.spans(paragraph), produced, num_questions, seen, records)
+        if metrics is not None:
+            generic = metrics.timed('generic_fill', generic)
+        for record in generic:
+            if metrics is not None:
+                metrics.count('synthetic_questions')
+                metrics.count('questions_returned')
+            yield record
+    
+    def _iter_analyzed_sentences(self, sentences: Iterable[str], num_questions: int, difficulty: str,
+                                 metrics: Optional[RequestMetrics]) -> Iterator[Tuple[str, Tuple[QARecord, ...]]]:
+        """Yield each sentence long enough for questions together with its analyzed records
+        
+        Large requests analyze SENTENCE_BATCH_SIZE sentences at a time so the
+        level analysis runs in batches; small ones go sentence by sentence and
+        stop without analyzing sentences they do not need.  Requests likely
+        to analyze ``parallel_min_sentences`` sentences or more shard them
+        over the parallel executor instead.
+        """
+        eligible: Iterator[str] = (sentence for sentence in sentences if len(sentence) >= 10)  # Skip very short sentences
+        
+        # Each sentence yields at least one question, so without a difficulty
+        # filter about num_questions sentences are analyzed; with one, the
+        # first parallel_min_sentences sentences are read to see whether the
+        # text is long enough
+        if self.parallel_executor is not None and (difficulty != 'mixed' or
+                                                   num_questions >= self.parallel_min_sentences):
+            head = list(islice(eligible, self.parallel_min_sentences))
+            eligible = chain(head, eligible)
+            executor = self.parallel_executor() if len(head) >= self.parallel_min_sentences else None
+            if executor is not None:
+                yield from self.iter_analyzed_sentences(eligible, executor, metrics)
+                return
+        
+        batch_size = SENTENCE_BATCH_SIZE if num_questions >= NUMPY_MIN_BATCH else 1
+        batch: List[str] = []
+        for sentence in eligible:
+            batch.append(sentence)
+            if len(batch) >= batch_size:
+                yield from zip(batch, self.analyze_sentences(batch, metrics))
+                batch = []
+        if batch:
+            yield from zip(batch, self.analyze_sentences(batch, metrics))
+    
+    def _select_qa_records(self, paragraph: str, num_questions: int, difficulty: str, selection: str,
+                           metrics: Optional[RequestMetrics], records: QARecordSet) -> List[QARecord]:
+        """Pick Q&A pairs from sentences spread over the whole text, stopping once enough are found"""
+        sentences = self.segmenter.spans(paragraph)
+        eligible = [index for index, sentence in enumerate(sentences) if len(sentence) >= 10]
+        
+        # Visit every stride-th sentence first, so the first pass covers the
+        # whole text with about num_questions sentences
+        stride = max(1, len(eligible) // num_questions)
+        order = [eligible[i] for offset in range(stride) for i in range(offset, len(eligible), stride)]
+        
+        # Balanced selection looks at a bounded number of extra sentences
+        # so it has several question types to choose from
+        budget = num_questions if selection == 'spread' else num_questions * 2
+        
+        # The first new question of each visited sentence is preferred, the
+        # rest only make up for sentences that yield nothing
+        seen: set[str] = set()
+        firsts: List[Tuple[Tuple[int, int], QARecord]] = []
+        others: List[Tuple[Tuple[int, int], QARecord]] = []
+        
+        # Visited sentences are analyzed one at a time, or sharded over the
+        # parallel executor when the visit is likely to be long
+        executor = None
+        expected = min(len(order), budget) if difficulty == 'mixed' else len(order)
+        if self.parallel_executor is not None and expected >= self.parallel_min_sentences:
+            executor = self.parallel_executor()
+        if executor is not None:
+            visits = zip(order, (analyzed for _, analyzed in self.iter_analyzed_sentences(
+                (sentences[sentence_index] for sentence_index in order), executor, metrics
+            )))
+        else:
+            visits = ((sentence_index, self.analyze_sentence(sentences[sentence_index], metrics))
+                      for sentence_index in order)
+        
+        for sentence_index, analyzed in visits:
+            if metrics is not None:
+                metrics.count('sentences')
+                metrics.count('questions_generated', len(analyzed))
+            found = False
+            for question_index, record in enumerate(analyzed):
+                if record.question in seen:
+                    continue
+                seen.add(record.question)
+                if difficulty != 'mixed' and record.level_info.level != difficulty:
+                    continue
+                (others if found else firsts).append(((sentence_index, question_index), record))
+                found = True
+            if len(firsts) >= budget:
+                break
+        candidates = firsts + others
+        
+        if selection == 'balanced':
+            # Round-robin over question types in order of first appearance
+            by_type: Dict[str, List[Tuple[Tuple[int, int], QARecord]]] = {}
+            for candidate in candidates:
+                by_type.setdefault(candidate[1].type, []).append(candidate)
+            chosen: List[Tuple[Tuple[int, int], QARecord]] = []
+            while len(chosen) < num_questions and any(by_type.values()):
+                for bucket in by_type.values():
+                    if bucket and len(chosen) < num_questions:
+                        chosen.append(bucket.pop(0))
+            candidates = chosen
+        
+        candidates = sorted(candidates[:num_questions], key=lambda candidate: candidate[0])
+        selected = [record.with_context(records.context_index(sentences[sentence_index]))
+                    for (sentence_index, _), record in candidates]
+        
+        # If not enough questions, add more generic ones to meet the count
+        if len(selected) < num_questions:
+            produced = len(selected)
+            selected.extend(self._iter_generic_questions(sentences, produced, num_questions, seen, records))
+            if metrics is not None:
+                metrics.count('synthetic_questions', len(selected) - produced)
+        if metrics is not None:
+            metrics.count('questions_returned', len(selected))
+        return selected
+    
+    def iter_analyzed_sentences(self, sentences: Iterable[str], executor: Executor,
+                                metrics: Optional[RequestMetrics] = None) -> Iterator[Tuple[str, Tuple[QARecord, ...]]]:
+        """Yield each sentence with its analyze_sentence records, analyzing them on a worker pool
+        
+        Sentences are read PARALLEL_CHUNK_SIZE at a time; the ones not in
+        the sentence cache are sent to the executor (from
+        :func:`create_batch_executor`), with at most ``parallel_window``
+        chunks in flight.  Results are yielded in input order and are the
+        same records a local analysis gives.  Chunks still in flight are
+        cancelled when the caller stops early; a chunk whose worker fails or
+        runs on other lexicons is analyzed here instead.
+        """
+        sentences = iter(sentences)
+        pending: Deque[Tuple[List[str], List[Optional[Tuple[QARecord, ...]]], Optional[Future]]] = deque()
+        
+        def submit() -> bool:
+            chunk = list(islice(sentences, PARALLEL_CHUNK_SIZE))
+            if not chunk:
+                return False
+            cached: List[Optional[Tuple[QARecord, ...]]] = (
+                [self.sentence_cache.get(sentence) for sentence in chunk] if self.sentence_cache is not None
+                else [None] * len(chunk)
+            )
+            missing = [sentence for sentence, records in zip(chunk, cached) if records is None]
+            if metrics is not None:
+                metrics.count('sentence_cache_hits', len(chunk) - len(missing))
+                metrics.count('parallel_sentences', len(missing))
+            pending.append((chunk, cached, executor.submit(analyze_sentence_chunk, missing) if missing else None))
+            return True
+        
+        try:
+            while len(pending) < self.parallel_window and submit():
+                pass
+            while pending:
+                chunk, cached, future = pending.popleft()
+                submit()
+                if future is not None:
+                    start = time.perf_counter() if metrics is not None else 0.0
+                    missing = [sentence for sentence, records in zip(chunk, cached) if records is None]
+                    try:
+                        lexicon_version, packed = future.result()
+                        analyzed = unpack_sentence_records(packed)
+                    except Exception as e:
+                        self.logger.error(f"Error in sentence worker: {str(e)}")
+                        lexicon_version, analyzed = None, []
+                    if metrics is not None:
+                        metrics.add_time('parallel_wait', start)
+                    if lexicon_version != self.lexicon_version:
+                        analyzed = self.analyze_sentences(missing, metrics)
+                    elif self.sentence_cache is not None:
+                        for sentence, records in zip(missing, analyzed):
+                            self.sentence_cache.put(sentence, records)
+                    results = iter(analyzed)
+                    cached = [records if records is not None else next(results) for records in cached]
+                yield from zip(chunk, cached)  # type: ignore[misc]
+        finally:
+            for _, _, future in pending:
+                if future is not None:
+                    future.cancel()
+    
+    def analyze_sentence(self, sentence: str, metrics: Optional[RequestMetrics] = None) -> Tuple[QARecord, ...]:
+        """Generate and level-analyze the questions for one sentence, memoized per sentence
+        
+        The returned records are shared with the sentence cache.  Their
+        context index is 0, referring to the sentence itself; results use
+        copies made with :meth:`QARecord.with_context`.
+        """
+        return self.analyze_sentences([sentence], metrics)[0]
+    
+    def analyze_sentences(self, sentences: Sequence[str],
+                          metrics: Optional[RequestMetrics] = None) -> List[Tuple[QARecord, ...]]:
+        """analyze_sentence for several sentences, level-analyzing all their new questions in one batch"""
+        results: List[Optional[Tuple[QARecord, ...]]] = [None] * len(sentences)
+        pending: List[Tuple[int, List[Dict[str, str]]]] = []
+        for index, sentence in enumerate(sentences):
+            if self.sentence_cache is not None:
+                cached = self.sentence_cache.get(sentence)
+                if cached is not None:
+                    if metrics is not None:
+                        metrics.count('sentence_cache_hits')
+                    results[index] = cached
+                    continue
             
+            # Extract entities and generate questions
+            start = time.perf_counter() if metrics is not None else 0.0
+            entities = self.extract_entities(sentence)
+            if metrics is not None:
+                metrics.add_time('extract_entities', start)
+                start = time.perf_counter()
+            pending.append((index, self.generate_question_from_sentence(sentence, entities)))
+            if metrics is not None:
+                metrics.add_time('generate_questions', start)
+        
+        if pending:
             # Analyze question levels
-            qa_with_levels: List[Dict[str, Any]] = []
-            for qa in unique_qa:
-                level_info = self.level_analyzer.analyze_question_level(
-                    qa['question'], 
-                    qa['answer'], 
-                    qa.get('context', '')
-                )
-                qa_with_level = {**qa, **level_info}
-                qa_with_levels.append(qa_with_level)
+            start = time.perf_counter() if metrics is not None else 0.0
+            questions = [qa for _, generated in pending for qa in generated]
+            level_infos = iter(self.level_analyzer.analyze_level_infos_batch(
+                [qa['question'] for qa in questions],
+                [qa['answer'] for qa in questions]
+            ))
+            if metrics is not None:
+                metrics.add_time('analyze_question_level', start)
             
-            # Filter by difficulty
-            if difficulty != 'mixed':
-                qa_with_levels = [qa for qa in qa_with_levels if qa.get('level') == difficulty]
-            
-            # Limit number of questions
-            num_questions = int(num_questions)
+            for index, generated in pending:
+                result = tuple(QARecord(qa['question'], qa['answer'], qa['type'], 0, next(level_infos))
+                               for qa in generated)
+                if self.sentence_cache is not None:
+                    self.sentence_cache.put(sentences[index], result)
+                results[index] = result
+        return results  # type: ignore[return-value]
+    
+    def _iter_generic_questions(self, sentences: Sequence[str], produced: int, num_questions: int, seen: set[str],
+                                records: QARecordSet) -> Iterator[QARecord]:
+        """Yield generic template questions until num_questions pairs exist
+        
+        Every (sentence, template) combination is tried at most once, starting
+        where ``produced`` points and cycling through sentences and templates,
+        so the fill ends after ``len(sentences) * len(templates)`` candidates
+        at the latest.  Combinations whose question already exists are skipped
+        and at most ``max_generic_questions`` are added.  Generic records are
+        marked ``synthetic``.
+        """
+        templates = self.generic_question_templates
+        combinations = len(sentences) * len(templates)
+        limit = min(num_questions, produced + self.max_generic_questions)
+        
+        # Step k pairs sentence k % n with template k % t, as the fill always
+        # has.  That repeats after lcm(n, t) steps when n and t share a factor
+        # g, so each later block of lcm(n, t) steps shifts the template by one,
+        # up to g - 1: every pair is then visited once per n * t steps
+        shared = gcd(len(sentences), len(templates))
+        cycle = len(sentences) * len(templates) // shared
+        analyzed: Dict[int, List[LevelInfo]] = {}
+        for step in range(produced, produced + combinations):
+            if produced >= limit:
+                break
+            sentence_index = step % len(sentences)
+            template_index = (step + step // cycle % shared) % len(templates)
+            sentence = sentences[sentence_index]
+            template, q_type = templates[template_index]
             
-            # If not enough questions, add more generic ones to meet the count
-            generic_question_templates = [
-                ("'{sentence}' గురించి వివరించండి.", 'what'),
-                ("'{sentence}' వాక్యం ఎలా ముగుస్తుంది?", 'how'),
-                ("'{sentence}' వాక్యం యొక్క ప్రాముఖ్యత ఏమిటి?", 'why')
-            ]
+            question_text = template.format(sentence=sentence)
+            if question_text in seen:
+                continue
             
-            while len(qa_with_levels) < num_questions and sentences:
-                # Cycle through sentences and templates to generate varied generic questions
-                sentence_index = len(qa_with_levels) % len(sentences)
-                template_index = len(qa_with_levels) % len(generic_question_templates)
-                
-                sentence = sentences[sentence_index]
-                template, q_type = generic_question_templates[template_index]
-                
-                question_text = template.format(sentence=sentence)
-                
-                if question_text not in seen:
-                    generic_question = {
-                        'question': question_text,
-                        'answer': sentence,
-                        'type': q_type,
-                        'context': sentence
-                    }
-                    
-                    level_info = self.level_analyzer.analyze_question_level(
-                        generic_question['question'], 
-                        generic_question['answer'], 
-                        generic_question.get('context', '')
-                    )
-                    qa_with_level: Dict[str, Any] = {**generic_question, **level_info}
-                    qa_with_levels.append(qa_with_level)
-                    seen.add(question_text)
-                else:
-                    # If we've exhausted all unique combinations, we may have to stop to avoid infinite loops
-                    # Or add a simple counter to the question to make it unique
-                    question_text_unique = f"{question_text} ({len(qa_with_levels)})"
-                    if question_text_unique not in seen:
-                         generic_question = {
-                            'question': question_text_unique,
-                            'answer': sentence,
-                            'type': q_type,
-                            'context': sentence
-                        }
-                         level_info = self.level_analyzer.analyze_question_level(
-                            generic_question['question'], 
-                            generic_question['answer'], 
-                            generic_question.get('context', '')
-                        )
-                         qa_with_level: Dict[str, Any] = {**generic_question, **level_info}
-                         qa_with_levels.append(qa_with_level)
-                         seen.add(question_text_unique)
-                    else:
-                        break # Break the loop if we can't generate a unique question
-
-            return qa_with_levels[:num_questions]
+            # Level analysis of all templates shares the sentence scan
+            levels = analyzed.get(sentence_index)
+            if levels is None:
+                levels = analyzed[sentence_index] = self.level_analyzer.analyze_templated_questions(
+                    sentence, [template for template, _ in templates]
+                )
             
-        except Exception as e:
-            self.logger.error(f"Error generating Q&A: {str(e)}")
-            return []
+            yield QARecord(question_text, sentence, q_type, records.context_index(sentence),
+                           levels[template_index], synthetic=True)
+            seen.add(question_text)
+            produced += 1
     
     def validate_telugu_text(self, text: str) -> bool:
         """Validate if text contains Telugu characters"""
         telugu_pattern = r'[\u0C00-\u0C7F]+'
         return bool(re.search(telugu_pattern, text))
 
-    def get_question_statistics(self, qa_pairs: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def get_question_statistics(self, qa_pairs: List[Dict[str, Any]],
+                                metrics: Optional[RequestMetrics] = None) -> Dict[str, Any]:
         """Get comprehensive statistics about generated questions"""
-        return self.level_analyzer.get_level_statistics(qa_pairs)
+        stats = self.level_analyzer.get_level_statistics(qa_pairs, metrics)
+        stats['synthetic_questions'] = sum(1 for qa in qa_pairs if qa.get('synthetic'))
+        return stats
+
+    def get_record_statistics(self, records: QARecordSet,
+                              metrics: Optional[RequestMetrics] = None) -> Dict[str, Any]:
+        """Same statistics as get_question_statistics, computed from records"""
+        stats = self.level_analyzer.get_record_statistics(records.records, metrics)
+        stats['synthetic_questions'] = sum(1 for record in records.records if record.synthetic)
+        return stats
+
+    def generate_qa_with_statistics(self, paragraph: str, num_questions: int = 5, difficulty: str = 'mixed',
+                                    metrics: Optional[RequestMetrics] = None, selection: str = 'sequential',
+                                    dedupe: Optional[QuestionIndex] = None, source: Optional[str] = None) -> Dict[str, Any]:
+        """Generate Q&A pairs and their statistics from a single level analysis
+        
+        With ``dedupe``, pairs whose question repeats one already in the
+        index are dropped and the others are added to it.  ``source`` labels
+        the result in the question bank.
+        """
+        qa_pairs, records = self._generate_cached(paragraph, num_questions, difficulty, metrics, selection, source)
+        if dedupe is not None:
+            return self.dedupe_result({'qa_pairs': qa_pairs}, dedupe, metrics)
+        return {
+            'qa_pairs': qa_pairs,
+            'statistics': (self.get_record_statistics(records, metrics) if records is not None
+                           else self.get_question_statistics(qa_pairs, metrics))
+        }
+    
+    def dedupe_result(self, result: Dict[str, Any], index: QuestionIndex,
+                      metrics: Optional[RequestMetrics] = None) -> Dict[str, Any]:
+        """A copy of a result without the pairs whose question the index already holds
+        
+        The remaining questions are added to the index, so results passed
+        in order never repeat each other.  Dropped pairs are not replaced;
+        ``statistics.duplicates_removed`` counts them.
+        """
+        start = time.perf_counter() if metrics is not None else 0.0
+        qa_pairs = [qa for qa in result['qa_pairs'] if index.add(qa['question'])]
+        removed = len(result['qa_pairs']) - len(qa_pairs)
+        if metrics is not None:
+            metrics.add_time('dedupe', start)
+            metrics.count('duplicates_removed', removed)
+        deduped = {**result, 'qa_pairs': qa_pairs, 'statistics': self.get_question_statistics(qa_pairs, metrics)}
+        deduped['statistics']['duplicates_removed'] = removed
+        if 'total_questions' in result:
+            deduped['total_questions'] = len(qa_pairs)
+        return deduped
+
+    @staticmethod
+    def _batch_item_settings(item: Dict[str, Any]) -> Tuple[Optional[Tuple[str, int, str, str, Optional[str]]], Optional[str]]:
+        """A batch item's paragraph, num_questions, difficulty, selection and source label, or why it is invalid"""
+        paragraph = item.get('paragraph', '')
+        if not paragraph or not isinstance(paragraph, str):
+            return None, 'Paragraph is required'
+        try:
+            num_questions = int(item.get('num_questions', 5))
+        except (TypeError, ValueError):
+            return None, 'num_questions must be an integer'
+        difficulty = item.get('difficulty', 'mixed')
+        selection = item.get('selection', 'sequential')
+        if selection not in SELECTION_STRATEGIES:
+            return None, f"selection must be one of: {', '.join(SELECTION_STRATEGIES)}"
+        source = item.get('source')
+        return (paragraph, num_questions, difficulty, selection, str(source) if source is not None else None), None
+
+    def generate_batch_item(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        """Generate Q&A pairs and statistics for one batch item, reporting failures in the result"""
+        try:
+            settings, error = self._batch_item_settings(item)
+            if settings is None:
+                return {'success': False, 'error': error}
+            paragraph, num_questions, difficulty, selection, source = settings
+            
+            result = self.generate_qa_with_statistics(paragraph, num_questions, difficulty, selection=selection,
+                                                      source=source)
+            return {
+                'success': True,
+                'qa_pairs': result['qa_pairs'],
+                'total_questions': len(result['qa_pairs']),
+                'statistics': result['statistics']
+            }
+        except Exception as e:
+            self.logger.error(f"Error generating batch item: {str(e)}")
+            return {'success': False, 'error': 'Failed to generate Q&A'}
+
+    def banked_batch_item(self, item: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """The result of a batch item read from the question bank, or None when it has to be generated"""
+        if self.question_bank is None:
+            return None
+        settings, _ = self._batch_item_settings(item)
+        if settings is None:
+            return None
+        paragraph, num_questions, difficulty, selection, source = settings
+        key = self.result_key(paragraph, difficulty)
+        qa_pairs = self.question_bank.get(key, num_questions, selection)
+        if qa_pairs is None:
+            return None
+        if source is not None:
+            self.question_bank.set_source(key, selection, source)
+        return {
+            'success': True,
+            'qa_pairs': qa_pairs,
+            'total_questions': len(qa_pairs),
+            'statistics': self.get_question_statistics(qa_pairs)
+        }
+
+    def bank_batch_result(self, item: Dict[str, Any], result: Dict[str, Any]) -> None:
+        """Store the result a batch worker generated for an item in the question bank"""
+        if self.question_bank is None or not result['success']:
+            return
+        settings, _ = self._batch_item_settings(item)
+        if settings is not None:
+            paragraph, num_questions, difficulty, selection, source = settings
+            self.bank_result(paragraph, num_questions, difficulty, selection, result['qa_pairs'], source)
+
+    def generate_qa_pairs_batch(self, items: Iterable[Dict[str, Any]], executor: Optional[Executor] = None,
+                                dedupe: Optional[QuestionIndex] = None) -> List[Dict[str, Any]]:
+        """Generate Q&A pairs for many paragraphs, optionally fanned out over an executor
+        
+        Each item is a dict with ``paragraph`` and optional ``num_questions`` and
+        ``difficulty``.  Results are returned in input order, one per item; an
+        item that fails is reported with ``success: False`` and an ``error``.
+        Pass an executor from :func:`create_batch_executor` to use a process pool;
+        items already in the question bank are then read here instead.
+        
+        With ``dedupe``, questions repeating one from an earlier item (or
+        already in the index) are dropped, in input order, so the outcome
+        does not depend on which worker finishes first.
+        """
+        items = list(items)
+        if executor is None:
+            results = [self.generate_batch_item(item) for item in items]
+        else:
+            banked = [self.banked_batch_item(item) for item in items]
+            futures = {index: executor.submit(_generate_batch_item, item)
+                       for index, item in enumerate(items) if banked[index] is None}
+            results = []
+            for index, item in enumerate(items):
+                result = banked[index]
+                if result is None:
+                    try:
+                        result = futures[index].result()
+                    except Exception as e:
+                        self.logger.error(f"Error in batch worker: {str(e)}")
+                        result = {'success': False, 'error': 'Failed to generate Q&A'}
+                    else:
+                        self.bank_batch_result(item, result)
+                results.append(result)
+        if dedupe is not None:
+            results = [self.dedupe_result(result, dedupe) if result['success'] else result for result in results]
+        return results
+
+# Processor owned by each batch worker process
+_worker_processor: Optional[TeluguNLPProcessor] = None
+_worker_watcher: Optional[LexiconWatcher] = None
+
+def _init_batch_worker(max_generic_questions: int = 100, lexicon_reload_interval: float = 0,
+                       watch_artifact: bool = False) -> None:
+    """Build the processor once per worker process"""
+    global _worker_processor, _worker_watcher
+    # The fork server loaded the lexicons when it started; catch up with any
+    # change since then, recompiling only what changed
+    reload_artifact()
+    _worker_processor = TeluguNLPProcessor(max_generic_questions=max_generic_questions)
+    _worker_watcher = (
+        LexiconWatcher(lexicon_reload_interval, watch_artifact=watch_artifact) if lexicon_reload_interval > 0 else None
+    )
+
+def _get_worker_processor() -> TeluguNLPProcessor:
+    """The worker process's processor, rebuilt first when its lexicon files changed"""
+    global _worker_processor
+    if _worker_processor is None:
+        _worker_processor = TeluguNLPProcessor()
+    elif _worker_watcher is not None and _worker_watcher.changed():
+        # Lexicon files changed: rebuild here rather than restarting the worker
+        reload_artifact()
+        _worker_processor = TeluguNLPProcessor(max_generic_questions=_worker_processor.max_generic_questions)
+    return _worker_processor
+
+def _generate_batch_item(item: Dict[str, Any]) -> Dict[str, Any]:
+    """Process one batch item inside a worker process"""
+    return _get_worker_processor().generate_batch_item(item)
+
+def analyze_sentence_chunk(sentences: List[str]) -> Tuple[str, bytes]:
+    """Analyze sentences inside a worker process, returning the worker's lexicon version and packed records"""
+    processor = _get_worker_processor()
+    return processor.lexicon_version, pack_sentence_records(processor.analyze_sentences(sentences))
+
+def generate_batch_chunk(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Process several batch items in one task, for submitting to a batch executor"""
+    return [_generate_batch_item(item) for item in items]
+
+def create_batch_executor(max_workers: Optional[int] = None, max_generic_questions: int = 100,
+                          lexicon_reload_interval: float = 0, watch_artifact: bool = False) -> Executor:
+    """Create a process pool whose workers each hold their own TeluguNLPProcessor
+    
+    With a positive ``lexicon_reload_interval``, workers check the lexicon
+    files (or only the artifact, with ``watch_artifact``) that often and
+    rebuild their processor when they change.  Workers
+    are started by a fork server (or spawned where there is none), never
+    forked from the calling process: a server worker forks with request
+    threads running, and a child could inherit a lock one of them holds.
+    The fork server preloads the lexicons, so workers do not compile them.
+    """
+    # Imported here so processes that never batch skip loading multiprocessing
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+    method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+    context = multiprocessing.get_context(method)
+    if method == 'forkserver':
+        # Found on the fork server's path when started from the project
+        # directory; otherwise each worker loads the lexicons itself
+        context.set_forkserver_preload(['pool_preload'])
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=context,
+                               initializer=_init_batch_worker,
+                               initargs=(max_generic_questions, lexicon_reload_interval, watch_artifact))
@@ -0,0 +1,39 @@
+import re
+import sys
+from copy import deepcopy
+from pathlib import Path
+from typing import Any, Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from lexicons import read_lexicons
+from telugu_nlp_processor import TeluguNLPProcessor
+
+SENTENCES = [
+    'కొత్తపేట నుండి రామారావు వచ్చాడు.',
+    'నారాయణపేటలో 12వ తేదీ 2023 సంవత్సరం మేళా జరిగింది.',
+    'విజయవాడ నగరం దగ్గర కొత్తపేట, పాతపేట ఉన్నాయి.',
+    'సీతాదేవి హైదరాబాద్ నగరంలో చైత్ర మాసం నివసిస్తుంది.',
+]
+
+def baseline_entities(words: Dict[str, Any], sentence: str) -> Dict[str, List[str]]:
+    """Entities as the original per-pattern extraction found them"""
+    persons = [match for suffix in words['person_suffixes'] for match in re.findall(r'(\w+' + suffix + ')', sentence)]
+    locations = []
+    for indicator in words['location_indicators']:
+        match = re.search(r'(\w+)' + indicator, sentence)
+        if match:
+            locations.append(match.group(1) + indicator)
+    dates = (re.findall(r'\d{4}', sentence) + re.findall(r'\d{1,2}' + words['day_marker'], sentence)
+             + re.findall(r'\w+' + words['month_marker'], sentence))
+    return {'persons': persons, 'locations': locations, 'dates': dates, 'organizations': []}
+
+def test_word_final_literals_match_baseline() -> None:
+    lexicons = deepcopy(read_lexicons())
+    words = lexicons['processor']
+    words['location_indicators'].append('పేట')
+    words['person_suffixes'].insert(0, 'రామ')
+    processor = TeluguNLPProcessor(sentence_cache_size=0, lexicons=lexicons)
+    for sentence in SENTENCES:
+        assert processor.extract_entities(sentence) == baseline_entities(words, sentence)
+    assert processor.extract_entities(SENTENCES[0])['locations'] == ['తపేట']
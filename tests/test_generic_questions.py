@@ -0,0 +1,30 @@
+import sys
+from pathlib import Path
+from typing import List, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from telugu_nlp_processor import TeluguNLPProcessor
+
+def generic_order(processor: TeluguNLPProcessor, paragraph: str) -> List[Tuple[int, int]]:
+    """(sentence, template) positions of the generic questions added for a paragraph, in output order"""
+    sentences = processor.split_sentences(paragraph)
+    templates = [template for template, _ in processor.generic_question_templates]
+    order = []
+    for qa in processor.generate_qa_pairs(paragraph, 30):
+        if qa.get('synthetic'):
+            sentence = sentences.index(qa['context'])
+            order.append((sentence, templates.index(next(
+                template for template in templates if template.format(sentence=qa['context']) == qa['question']
+            ))))
+    return order
+
+def test_generic_rotation_order() -> None:
+    processor = TeluguNLPProcessor(sentence_cache_size=0)
+    # Step k pairs sentence k % n with template k % t; each sentence's own
+    # fallback question already uses template 0, so those steps are skipped
+    assert generic_order(processor, 'వర్షం పడింది. పిల్లలు ఆడారు.') == [(0, 2), (0, 1), (1, 2), (1, 1)]
+    # Three sentences and three templates: after every 3 steps the template shifts by one
+    assert generic_order(processor, 'వర్షం పడింది. పిల్లలు ఆడారు. రైతులు సంతోషించారు.') == [
+        (0, 1), (1, 2), (0, 2), (2, 1), (1, 1), (2, 2)
+    ]